@@ -5,8 +5,11 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from datetime import datetime
+import hashlib
 import json
+import marshal
 import os
+import sys
 import threading
 from pathlib import Path
 
@@ -126,27 +129,151 @@ class LoginScreen:
             )
 
 
+def flatten_translations(tree: dict, prefix: str = "") -> dict:
+    """將巢狀翻譯資源攤平成 {"header.title": 文字} 形式"""
+    flat = {}
+    for key, value in tree.items():
+        if isinstance(value, dict):
+            flat.update(flatten_translations(value, f"{prefix}{key}."))
+        elif isinstance(value, str):
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def default_locale_cache_dir() -> Path:
+    """語言快取目錄；打包版放在執行檔旁的 data/，與資料庫相同"""
+    if getattr(sys, "frozen", False):
+        app_root = Path(sys.executable).resolve().parent
+    else:
+        app_root = Path(__file__).resolve().parents[1]
+    return app_root / "data" / "locale_cache"
+
+
 class LanguageManager:
     """
     語言管理器
     負責管理多語言資源並提供翻譯功能
+
+    啟動時只載入目前語言，其他語言在切換或需要備援時才載入。
+    解析後的資源以 marshal 快取於 cache_dir，來源 JSON 的 mtime/大小
+    不變時直接讀取快取，不再解析 JSON。
     """
-    
-    def __init__(self, locales_dir: str = "frontend/public/locales"):
+
+    # 快取格式變更時遞增，使舊快取失效
+    CACHE_FORMAT = 1
+
+    def __init__(self, locales_dir: str = "frontend/public/locales", cache_dir=None):
         self.locales_dir = locales_dir
+        self.cache_dir = str(cache_dir or default_locale_cache_dir())
         self.current_language = "ja"  # 默認為日文
         self.translations = {}
+        # 每個已載入語言一個攤平索引，載入時建立
+        self._index = {}
+        # 各語言查無鍵值的結果 {語言: {鍵: 備援語言文字或 None}}，重複查詢不再解析
+        self._fallback_texts = {}
 
         # 支援的語言
         self.supported_languages = ["ja", "zh", "en"]
 
-        # 加載所有語言資源
-        self.load_all_translations()
+        # 只加載目前語言的資源
+        self.ensure_language_loaded(self.current_language)
 
     def load_all_translations(self):
         """加載所有支援語言的翻譯資源"""
         for lang_code in self.supported_languages:
-            self.translations[lang_code] = self.load_language_translations(lang_code)
+            self.ensure_language_loaded(lang_code)
+
+    def ensure_language_loaded(self, lang_code: str) -> dict:
+        """載入尚未載入的語言 (優先讀取快取)，返回其巢狀翻譯資源"""
+        if lang_code not in self.translations:
+            catalog, flat = self._load_catalog(lang_code)
+            self.translations[lang_code] = catalog
+            self._index[lang_code] = flat
+        return self.translations[lang_code]
+
+    def rebuild_index(self):
+        """重建攤平的翻譯索引；直接修改 translations 後需呼叫"""
+        self._index = {
+            lang_code: flatten_translations(catalog)
+            for lang_code, catalog in self.translations.items()
+        }
+        self._fallback_texts = {}
+
+    def _fallback_text(self, lang_code: str, key: str):
+        """目前語言中 ``key`` 的上層路徑是字串時，依序查其他語言
+
+        只是缺少的鍵不查其他語言 (返回 None，由呼叫端使用默認文本)，
+        因此查無鍵值不會載入其他語言。
+        """
+        index = self._index[lang_code]
+        parts = key.split(".")
+        if not any(".".join(parts[:end]) in index for end in range(1, len(parts))):
+            return None
+        for fallback in self.supported_languages:
+            if fallback != lang_code:
+                self.ensure_language_loaded(fallback)
+                text = self._index[fallback].get(key)
+                if text is not None:
+                    return text
+        return None
+
+    def _cache_path(self, lang_code: str) -> str:
+        return os.path.join(self.cache_dir, f"{lang_code}.marshal")
+
+    def _load_catalog(self, lang_code: str):
+        """返回 (巢狀資源, 攤平索引)；來源未變時讀快取"""
+        file_path = os.path.join(self.locales_dir, f"{lang_code}.json")
+        cached = self._read_cache(lang_code, file_path)
+        if cached is not None:
+            return cached
+        catalog = self.load_language_translations(lang_code)
+        flat = flatten_translations(catalog)
+        if catalog:
+            self._write_cache(lang_code, file_path, catalog, flat)
+        return catalog, flat
+
+    def _read_cache(self, lang_code: str, file_path: str):
+        try:
+            stat = os.stat(file_path)
+            with open(self._cache_path(lang_code), "rb") as f:
+                payload = marshal.loads(f.read())
+            header, size, mtime_ns, digest, catalog, flat = payload
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if header != (self.CACHE_FORMAT, sys.version_info[:2]):
+            return None
+        if (stat.st_size, stat.st_mtime_ns) != (size, mtime_ns):
+            # 打包版每次解壓都會更新 mtime，內容未變時沿用快取並更新記錄
+            try:
+                with open(file_path, "rb") as f:
+                    if hashlib.sha1(f.read()).hexdigest() != digest:
+                        return None
+            except OSError:
+                return None
+            self._write_cache(lang_code, file_path, catalog, flat)
+        return catalog, flat
+
+    def _write_cache(self, lang_code: str, file_path: str, catalog: dict, flat: dict):
+        try:
+            with open(file_path, "rb") as f:
+                raw = f.read()
+            stat = os.stat(file_path)
+            payload = (
+                (self.CACHE_FORMAT, sys.version_info[:2]),
+                stat.st_size,
+                stat.st_mtime_ns,
+                hashlib.sha1(raw).hexdigest(),
+                catalog,
+                flat,
+            )
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{self._cache_path(lang_code)}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(marshal.dumps(payload))
+            os.replace(tmp_path, self._cache_path(lang_code))
+        except (OSError, ValueError):
+            # 唯讀目錄等情況下略過快取，下次仍解析 JSON
+            pass
 
     def load_language_translations(self, lang_code: str):
         """加載特定語言的翻譯資源"""
@@ -428,35 +555,22 @@ class LanguageManager:
         :param default_text: 默認文本
         :return: 翻譯後的文本或默認文本
         """
-        try:
-            # 分割鍵以支持嵌套結構 (例如: "header.title")
-            keys = key.split('.')
-            current_dict = self.translations[self.current_language]
-
-            for k in keys:
-                current_dict = current_dict.get(k, {})
-
-            if isinstance(current_dict, str):
-                return current_dict
+        lang_code = self.current_language
+        index = self._index.get(lang_code)
+        if index is None:
+            self.ensure_language_loaded(lang_code)
+            index = self._index[lang_code]
+        text = index.get(key)
+        if text is None:
+            resolved = self._fallback_texts.setdefault(lang_code, {})
+            if key in resolved:
+                text = resolved[key]
             else:
-                # 如果找不到確切的鍵，返回默認值或鍵本身
-                return default_text or key
-        except (TypeError, AttributeError):
-            # 如果當前語言中找不到翻譯，則檢查其他語言
-            for lang_code in self.supported_languages:
-                if lang_code != self.current_language:
-                    try:
-                        current_dict = self.translations[lang_code]
-                        for k in keys:
-                            current_dict = current_dict.get(k, {})
-                        
-                        if isinstance(current_dict, str):
-                            return current_dict
-                    except (KeyError, TypeError, AttributeError):
-                        continue
-
-            # 如果所有語言都沒有找到，返回默認文本或鍵值
+                text = resolved[key] = self._fallback_text(lang_code, key)
+        if text is None:
+            # 找不到翻譯，返回默認文本或鍵值
             return default_text or key
+        return text
 
     def set_language(self, language_code: str) -> bool:
         """
@@ -465,6 +579,7 @@ class LanguageManager:
         :return: 設置成功與否
         """
         if language_code in self.supported_languages:
+            self.ensure_language_loaded(language_code)
             self.current_language = language_code
             return True
         else:
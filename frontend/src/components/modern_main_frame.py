@@ -4,23 +4,50 @@ from __future__ import annotations
 現代化主應用程序界面框架
 採用側邊導航、卡片式設計、現代色彩方案
 """
+import base64
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from collections import defaultdict
 import calendar
 import json
 import os
 import shutil
-import pandas as pd
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-from matplotlib import rcParams
 from sqlalchemy.orm import joinedload
 from frontend.src.utils.attendance_helpers import build_attendance_notes
+from frontend.src.utils.background_query import BackgroundQueryRunner
+from frontend.src.utils.chart_images import (
+    chart_image_size,
+    ChartImageRenderer,
+    summary_chart_requests,
+)
+from frontend.src.utils.batch_import import (
+    DATE_FIELDS,
+    DELAY,
+    SUMMARY_ACTUAL,
+    find_import_files,
+    import_sheet_name,
+    merge_results,
+    parse_import_files,
+    parse_records,
+)
 from frontend.src.utils.i18n_helpers import I18nRegistry
-from frontend.src.utils.import_helpers import open_excel_workbook, read_table
+from frontend.src.utils.import_helpers import (
+    CSV_EXTENSIONS,
+    MissingSummaryDateError,
+    estimate_sheet_rows,
+    iter_sheet_rows,
+    select_excel_sheet,
+)
+from frontend.src.utils.import_jobs import ImportJobRunner
+from frontend.src.utils.master_data_cache import master_data_cache
+from frontend.src.utils.page_cache import PageCache, estimate_page_cost
+from frontend.src.utils.query_cache import (
+    REPORT_LOG_TABLES,
+    SUMMARY_DASHBOARD_TABLES,
+    query_cache,
+)
 from frontend.src.utils.report_helpers import (
     build_shift_display_options,
     format_report_context_label,
@@ -50,6 +77,7 @@ from frontend.src.components.attendance_section_optimized import (
     AttendanceSectionOptimized,
 )
 from auth import verify_password
+from migrations import consume_migration_notices
 from models import (
     DelayEntry,
     SummaryActualEntry,
@@ -61,11 +89,35 @@ from models import (
     OvertimeEntry,
     EquipmentLog,
     LotLog,
-    ShiftOption,
-    AreaOption,
     get_database_path,
     consume_database_fallback_notice,
 )
+from import_service import (
+    describe_import,
+    file_content_hash,
+    find_current_import,
+    list_import_history,
+    pending_fingerprint,
+    record_imports,
+    replace_summary_actual_entries,
+    supersede_imports,
+    upsert_delay_entries,
+)
+from pagination import (
+    fetch_delay_page,
+    fetch_equipment_page,
+    fetch_lot_page,
+    fetch_report_page,
+)
+import startup_profiler
+from reporting import (
+    BUCKET_DAY,
+    BUCKET_MONTH,
+    BUCKET_WEEK,
+    load_attendance_summary,
+    refresh_attendance_rollup,
+    rollup_keys_for_reports,
+)
 
 
 class ModernMainFrame:
@@ -112,38 +164,469 @@ class ModernMainFrame:
         }
         self.delay_pending_records = []
         self.summary_pending_records = []
+        self._pending_imports = {}
         self._delay_pending_seq = 0
         self._summary_pending_seq = 0
         self.summary_dashboard_data = None
         self.summary_pie_frame = None
         self.summary_bar_frame = None
-        self._cjk_font_ready = False
+        self.summary_chart_labels = {}
+        self.summary_chart_images = {}
+        self._summary_chart_size = None
+        self._summary_chart_resize_id = None
         self.shift_options = ["Day", "Night"]
         self.area_options = ["etching_D", "etching_E", "litho", "thin_film"]
+        self._query_runner = BackgroundQueryRunner(self.parent)
+        self._import_runner = ImportJobRunner(self.parent)
+        self._chart_renderer = ChartImageRenderer(self.parent)
+        self._loading_channels = {}
+        self._interrupted_queries = set()
 
         # 配置現代化樣式
-        self.setup_modern_styles()
+        with startup_profiler.phase("setup_modern_styles"):
+            self.setup_modern_styles()
 
         # 創建界面
-        self.setup_login_ui()
-        self.setup_ui()
+        with startup_profiler.phase("setup_login_ui"):
+            self.setup_login_ui()
+        with startup_profiler.phase("setup_ui"):
+            self.setup_ui()
 
         # 先顯示登入畫面
         self._show_login_screen()
         self.parent.after(0, self._notify_database_fallback)
+        self.parent.after(0, self._notify_migration_notices)
         self.parent.protocol("WM_DELETE_WINDOW", self._on_app_close)
 
     def _t(self, key, default):
         return self.lang_manager.get_text(key, default)
 
+    def _submit_query(
+        self, channel, fetch, on_success, on_error=None, busy_widget=None
+    ):
+        """Run ``fetch(db)`` on a worker thread; callbacks run on the Tk thread.
+
+        A newer query on the same channel supersedes the previous one.
+        """
+        self._interrupted_queries.discard(channel)
+        self._set_loading(channel, busy_widget)
+        return self._query_runner.submit(
+            channel,
+            fetch,
+            on_success,
+            on_error,
+            on_done=lambda: self._clear_loading(channel),
+        )
+
+    def _set_loading(self, channel, busy_widget=None):
+        self._loading_channels[channel] = busy_widget
+        self._apply_busy_cursor(busy_widget, True)
+        self._set_status("status.loading", "⏳ 資料載入中...")
+
+    def _clear_loading(self, channel):
+        if channel not in self._loading_channels:
+            return
+        self._apply_busy_cursor(self._loading_channels.pop(channel), False)
+        loading_text = self._t("status.loading", "⏳ 資料載入中...")
+        if (
+            not self._loading_channels
+            and self.status_label.cget("text") == loading_text
+        ):
+            self._set_status("status.ready", "就緒")
+
+    @staticmethod
+    def _apply_busy_cursor(widget, busy):
+        try:
+            if widget is not None and widget.winfo_exists():
+                widget.config(cursor="watch" if busy else "")
+        except tk.TclError:
+            pass
+
+    def _create_load_more_bar(self, parent, command):
+        frame = ttk.Frame(parent, style="Card.TFrame")
+        button = ttk.Button(frame, command=command, state="disabled")
+        self._register_text(button, "common.loadMore", "載入更多", scope="page")
+        button.pack(side="left")
+        label = ttk.Label(frame, font=("Segoe UI", 9))
+        label.pack(side="left", padx=(12, 0))
+        return {"frame": frame, "button": button, "label": label}
+
+    def _update_load_more_bar(self, bar, loaded, has_more):
+        if not bar or not bar["button"].winfo_exists():
+            return
+        bar["button"].config(state="normal" if has_more else "disabled")
+        if has_more:
+            text = self._t(
+                "common.loadedRowsMore", "已載入 {count} 筆，尚有更多資料"
+            )
+        else:
+            text = self._t("common.loadedRows", "已載入 {count} 筆")
+        bar["label"].config(text=text.format(count=loaded))
+
+    def _create_import_progress_bar(self, parent, channel):
+        frame = ttk.Frame(parent, style="Card.TFrame")
+        bar = ttk.Progressbar(frame, length=260, maximum=100)
+        bar.pack(side="left")
+        label = ttk.Label(frame, font=("Segoe UI", 9))
+        label.pack(side="left", padx=(12, 0))
+        button = ttk.Button(frame, command=lambda: self._import_runner.cancel(channel))
+        self._register_text(button, "common.cancel", "取消", scope="page")
+        button.pack(side="left", padx=(12, 0))
+        return {"frame": frame, "bar": bar, "label": label}
+
+    def _show_import_progress(self, progress):
+        if not progress or not progress["frame"].winfo_exists():
+            return
+        progress["bar"].config(mode="indeterminate", value=0)
+        progress["bar"].start(15)
+        progress["label"].config(text=self._t("common.importReading", "讀取中..."))
+        progress["frame"].grid()
+
+    def _update_import_progress(self, progress, done, total, text=None):
+        if not progress or not progress["frame"].winfo_exists():
+            return
+        bar = progress["bar"]
+        if total:
+            if str(bar.cget("mode")) != "determinate":
+                bar.stop()
+                bar.config(mode="determinate")
+            bar.config(value=min(done * 100 / total, 100))
+            text = text or self._t("common.importProgress", "已讀取 {done} / {total} 列")
+        else:
+            text = self._t("common.importProgressRows", "已讀取 {done} 列")
+        progress["label"].config(text=text.format(done=done, total=total))
+
+    def _hide_import_progress(self, progress):
+        if not progress or not progress["frame"].winfo_exists():
+            return
+        progress["bar"].stop()
+        progress["frame"].grid_remove()
+
+    def _start_import(
+        self, channel, work, on_success, progress, on_error=None, progress_text=None
+    ):
+        """Run ``work(job)`` on the import worker with a progress bar."""
+        self._show_import_progress(progress)
+        return self._import_runner.start(
+            channel,
+            work,
+            on_success,
+            on_error=on_error or self._show_import_error,
+            on_progress=lambda done, total: self._update_import_progress(
+                progress, done, total, progress_text
+            ),
+            on_done=lambda: self._hide_import_progress(progress),
+        )
+
+    def _show_import_error(self, exc):
+        if isinstance(exc, MissingSummaryDateError):
+            messagebox.showerror(
+                self._t("common.error", "錯誤"),
+                self._t("errors.invalidDateFormat", "日期格式需為 YYYY-MM-DD"),
+            )
+            return
+        messagebox.showerror(self._t("common.error", "錯誤"), f"{exc}")
+
+    def _import_targets(self, kind):
+        """(job channel, progress bar, staging callback) of an import kind."""
+        if kind == DELAY:
+            return (
+                "delay_import",
+                getattr(self, "delay_import_progress", None),
+                self._finish_delay_import,
+            )
+        return (
+            "summary_import",
+            getattr(self, "summary_import_progress", None),
+            self._finish_summary_import,
+        )
+
+    @staticmethod
+    def _format_utc(value):
+        if value is None:
+            return ""
+        local = value.replace(tzinfo=timezone.utc).astimezone()
+        return local.strftime("%Y-%m-%d %H:%M")
+
+    def _current_username(self):
+        return self.current_user.get("username", "") if self.current_user else ""
+
+    def _import_file(self, kind, path, sheet_name, force=False):
+        """Parse one file in the import job unless its content is already stored."""
+        channel, progress, finish = self._import_targets(kind)
+
+        def _parse(job):
+            content_hash = file_content_hash(path)
+            if not force:
+                with SessionLocal() as db:
+                    previous = find_current_import(db, kind, content_hash, sheet_name)
+                if previous is not None:
+                    return {"previous": previous}
+            total = estimate_sheet_rows(path, sheet_name)
+            rows = job.track(iter_sheet_rows(path, sheet_name), total)
+            records = parse_records(kind, rows)
+            source = describe_import(
+                kind, path, content_hash, sheet_name, records, DATE_FIELDS[kind]
+            )
+            return {"records": records, "source": source}
+
+        def _done(result):
+            previous = result.get("previous")
+            if previous is None:
+                finish(result["records"], sources=[result["source"]])
+                return
+            message = self._t(
+                "common.alreadyImported",
+                "此檔案內容已於 {time} 匯入（{rows} 筆），資料庫中的資料相同。\n"
+                "是否仍要重新匯入？",
+            ).format(
+                time=self._format_utc(previous.imported_at), rows=previous.row_count
+            )
+            if messagebox.askyesno(self._t("common.info", "資訊"), message):
+                self._import_file(kind, path, sheet_name, force=True)
+
+        self._start_import(channel, _parse, _done, progress)
+
+    def _import_folder(self, kind):
+        """Parse every new import file of a folder in parallel, then stage the merge.
+
+        Files whose content is already stored (per the import ledger) are skipped.
+        """
+        folder = filedialog.askdirectory(
+            parent=self.parent, title=self._t("common.importFolder", "匯入資料夾")
+        )
+        if not folder:
+            return
+        paths = find_import_files(folder)
+        if not paths:
+            messagebox.showinfo(
+                self._t("common.info", "資訊"), self._t("common.emptyData", "查無資料")
+            )
+            return
+        channel, progress, finish = self._import_targets(kind)
+
+        def _parse(job):
+            fresh, skipped, keys = [], [], {}
+            with SessionLocal() as db:
+                for path in paths:
+                    job.check()
+                    content_hash = file_content_hash(path)
+                    try:
+                        sheet_name = import_sheet_name(kind, path)
+                    except Exception:
+                        # parse_import_file reports the unreadable file
+                        sheet_name = None
+                    if find_current_import(db, kind, content_hash, sheet_name):
+                        skipped.append(path)
+                    else:
+                        fresh.append(path)
+                        keys[path] = (content_hash, sheet_name)
+
+            def _on_result(_result, done, total):
+                job.report(done, total)
+
+            results = parse_import_files(kind, fresh, on_result=_on_result)
+            sources = [
+                describe_import(
+                    kind,
+                    result.path,
+                    *keys[result.path],
+                    result.records,
+                    DATE_FIELDS[kind],
+                )
+                for result in results
+                if result.error is None and result.records
+            ]
+            return results, skipped, sources
+
+        def _finish(result):
+            results, skipped, sources = result
+            finish(
+                merge_results(results),
+                notice=self._batch_import_notice(results, skipped),
+                sources=sources,
+            )
+
+        self._start_import(
+            channel,
+            _parse,
+            _finish,
+            progress,
+            progress_text=self._t(
+                "common.importFilesProgress", "已處理 {done} / {total} 個檔案"
+            ),
+        )
+
+    def _batch_import_notice(self, results, skipped=()):
+        ok = [result for result in results if result.error is None]
+        lines = [
+            self._t(
+                "common.batchImportResult", "{ok} / {total} 個檔案匯入成功，共 {rows} 筆"
+            ).format(
+                ok=len(ok),
+                total=len(results) + len(skipped),
+                rows=sum(len(result.records) for result in ok),
+            )
+        ]
+        for result in results:
+            name = os.path.basename(result.path)
+            if result.error is None:
+                lines.append(f"✔ {name}: {len(result.records)}")
+            elif isinstance(result.error, MissingSummaryDateError):
+                lines.append(
+                    f"✖ {name}: "
+                    + self._t("errors.invalidDateFormat", "日期格式需為 YYYY-MM-DD")
+                )
+            else:
+                lines.append(f"✖ {name}: {result.error}")
+        skipped_text = self._t("common.alreadyImportedSkipped", "內容與先前匯入相同，已略過")
+        for path in skipped:
+            lines.append(f"↷ {os.path.basename(path)}: {skipped_text}")
+        return "\n".join(lines) + "\n\n"
+
+    def _import_delay_folder(self):
+        self._import_folder(DELAY)
+
+    def _import_summary_actual_folder(self):
+        self._import_folder(SUMMARY_ACTUAL)
+
+    def _stage_import_sources(self, kind, records, sources):
+        # The ledger is only written if the staged rows are uploaded unedited
+        self._pending_imports[kind] = (list(sources), pending_fingerprint(records))
+
+    def _staged_import_sources(self, kind, records):
+        sources, fingerprint = self._pending_imports.get(kind, ((), None))
+        if sources and fingerprint == pending_fingerprint(records):
+            return sources
+        return ()
+
+    def _upload_pending(self, kind, records, write, on_uploaded):
+        """Write staged rows on the import worker with a progress bar.
+
+        ``write(db, rows, progress)`` runs on the worker thread; cancelling the
+        job rolls the whole upload back.  ``on_uploaded(result, fingerprint)``
+        runs on the Tk thread after the commit.
+        """
+        channel, progress, _finish = self._import_targets(kind)
+        if self._import_runner.is_busy(channel):
+            return
+        rows = [dict(rec) for rec in records]
+        fingerprint = pending_fingerprint(rows)
+        sources = self._staged_import_sources(kind, rows)
+        username = self._current_username()
+
+        def _write(job):
+            with SessionLocal() as db:
+                result = write(db, rows, job.report)
+                if sources:
+                    record_imports(db, sources, username)
+                job.check()
+                db.commit()
+            return result
+
+        def _done(result):
+            self._pending_imports.pop(kind, None)
+            on_uploaded(result, fingerprint)
+
+        self._start_import(
+            channel,
+            _write,
+            _done,
+            progress,
+            progress_text=self._t("common.uploadProgress", "已寫入 {done} / {total} 筆"),
+        )
+
+    def _show_import_history(self, kind):
+        dlg = tk.Toplevel(self.parent)
+        dlg.configure(background=self.COLORS["background"])
+        dlg.title(self._t("common.importHistory", "匯入紀錄"))
+        dlg.geometry("860x420")
+        frame = ttk.Frame(dlg, style="Card.TFrame")
+        frame.pack(fill="both", expand=True, padx=10, pady=10)
+        cols = ("file", "sheet", "rows", "dates", "user", "time")
+        tree = create_treeview_with_scrollbars(
+            parent=frame,
+            columns=cols,
+            header_keys=[
+                ("common.fileName", "檔案"),
+                ("common.sheet", "工作表"),
+                ("common.rowCount", "筆數"),
+                ("common.dateRange", "日期範圍"),
+                ("common.importedBy", "匯入者"),
+                ("common.importedAt", "匯入時間"),
+            ],
+            widths={"file": 220, "sheet": 120, "rows": 60, "dates": 180},
+            anchors={"rows": "e"},
+            stretchable_cols=["file"],
+            translate=self._t,
+        )["tree"]
+
+        def _fetch(db):
+            return [
+                (
+                    entry.file_name,
+                    entry.sheet_name,
+                    entry.row_count,
+                    entry.dates,
+                    entry.imported_by,
+                    entry.imported_at,
+                )
+                for entry in list_import_history(db, kind)
+            ]
+
+        def _render(rows):
+            if not tree.winfo_exists():
+                return
+            for file_name, sheet, count, dates, user, imported_at in rows:
+                days = dates.split(",") if dates else [""]
+                span = days[0] if len(days) == 1 else f"{days[0]} ~ {days[-1]}"
+                tree.insert(
+                    "",
+                    "end",
+                    values=(
+                        file_name,
+                        sheet,
+                        count,
+                        span,
+                        user,
+                        self._format_utc(imported_at),
+                    ),
+                )
+
+        self._submit_query(
+            "import_history",
+            _fetch,
+            _render,
+            on_error=self._show_query_error,
+            busy_widget=tree,
+        )
+
+    def _cancel_queries(self):
+        for channel in list(self._loading_channels):
+            self._query_runner.cancel(channel)
+            self._clear_loading(channel)
+        self._interrupted_queries.clear()
+
+    def _cancel_page_queries(self, page_id):
+        """Cancel the running queries of the page being left.
+
+        Cancelled channels are remembered so the page can re-issue them when
+        it is shown again.
+        """
+        for channel in self._page_query_channels.get(page_id, ()):
+            if channel in self._loading_channels:
+                self._query_runner.cancel(channel)
+                self._clear_loading(channel)
+                self._interrupted_queries.add(channel)
+
     def _register_text(self, widget, key, default, scope="global"):
         self._i18n.register(widget, key, default, scope=scope, translate=self._t)
 
     def _apply_i18n(self):
         self._i18n.apply(self._t)
 
-    def _clear_page_i18n(self):
-        self._i18n.clear_page()
+    def _clear_page_i18n(self, page_id=None):
+        self._i18n.clear_page(page_id)
 
     def _set_status(self, key, default):
         self.status_label.config(text=self._t(key, default))
@@ -260,14 +743,6 @@ class ModernMainFrame:
                 self.status_indicator_id, fill=colors["success"]
             )
 
-        if hasattr(self, "summary_pie_canvas") and self.summary_pie_canvas:
-            self.summary_pie_canvas.get_tk_widget().configure(
-                background=colors["surface"]
-            )
-        if hasattr(self, "summary_bar_canvas") and self.summary_bar_canvas:
-            self.summary_bar_canvas.get_tk_widget().configure(
-                background=colors["surface"]
-            )
 
         popup = getattr(self, "_calendar_popup", None)
         if popup is not None and popup.winfo_exists():
@@ -866,12 +1341,25 @@ class ModernMainFrame:
         )
         separator.pack(fill="x", pady=(0, 20))
 
-        # 內容區（動態載入）
-        self.page_content = ttk.Frame(self.content_frame, style="Modern.TFrame")
-        self.page_content.pack(fill="both", expand=True)
+        # 內容區（動態載入）；每個頁面建立在自己的 frame 中並快取
+        self._page_host = ttk.Frame(self.content_frame, style="Modern.TFrame")
+        self._page_host.pack(fill="both", expand=True)
+        self.page_content = self._page_host
 
         # 初始化各個頁面
-        self.pages = {}
+        self.pages = PageCache(on_evict=self._destroy_page)
+        self._uncached_pages = {"admin"}
+        # 離開頁面時只取消該頁的查詢，其他頻道（如匯入紀錄視窗）不受影響
+        self._page_query_channels = {
+            "summary": ("summary_dashboard",),
+            "summary_query": ("summary_query",),
+            "abnormal_history": ("abnormal_history",),
+            "delay_list": ("delay_entries",),
+            "summary_actual": ("summary_actual",),
+        }
+        # 設備/批次表單建立或清空時所屬的報表
+        self._form_report_ids = {}
+        self._page_wheel_targets = {}
         self.current_page = None
 
     def create_status_bar(self):
@@ -927,6 +1415,19 @@ class ModernMainFrame:
         info_text = f"{version_text} | {db_label} {db_path} | Create by Pigo Hsiao"
         self.status_info_label.config(text=info_text)
 
+    def _notify_migration_notices(self):
+        for notice in consume_migration_notices():
+            if notice.get("kind") != "delay_duplicates":
+                continue
+            messagebox.showwarning(
+                self._t("common.warning", "提醒"),
+                self._t(
+                    "settings.delayDuplicatesBackedUp",
+                    "資料庫升級時發現 {count} 筆重複的延遲清單資料（同日期、機台、"
+                    "工程、批號、晶片），已保留最新一筆，其餘已備份至資料表 {table}。",
+                ).format(count=notice["count"], table=notice["table"]),
+            )
+
     def _notify_database_fallback(self):
         notice = consume_database_fallback_notice()
         if not notice:
@@ -1013,14 +1514,32 @@ class ModernMainFrame:
                 ),
             )
             return
-        # 清除現有內容
-        for widget in self.page_content.winfo_children():
-            widget.destroy()
-        self._clear_page_i18n()
+        # 隱藏目前頁面（未快取的頁面直接銷毀）
+        self._cancel_page_queries(self.current_page)
+        self._hide_current_page()
+        self.pages.evict(keep=page_id)
 
         # 更新導航按鈕狀態
         self.update_nav_buttons(page_id)
 
+        cached_frame = self.pages.get(page_id)
+        if cached_frame is not None:
+            self._i18n.set_active_page(page_id, self._t)
+            cached_frame.pack(fill="both", expand=True)
+            self.page_content = cached_frame
+            self.current_page = page_id
+            self._restore_page_mousewheel(page_id)
+            self._refresh_page_data(page_id)
+            self._update_report_context_label()
+            return
+
+        self.page_content = ttk.Frame(self._page_host, style="Modern.TFrame")
+        self.page_content.pack(fill="both", expand=True)
+        self._i18n.set_active_page(page_id)
+        self._clear_page_i18n(page_id)
+        self._page_wheel_targets.pop(page_id, None)
+        self.current_page = page_id
+
         # 根據頁面ID創建內容
         if page_id == "daily_report":
             self.create_daily_report_page()
@@ -1043,9 +1562,85 @@ class ModernMainFrame:
         elif page_id == "admin":
             self.create_admin_page()
 
-        self.current_page = page_id
+        if page_id not in self._uncached_pages:
+            self.pages.put(page_id, self.page_content)
         self._update_report_context_label()
 
+    def _hide_current_page(self):
+        page_id = self.current_page
+        frame = self.page_content
+        if page_id is None or frame is self._page_host:
+            return
+        if page_id in self.pages:
+            self.pages.set_cost(page_id, estimate_page_cost(frame))
+            frame.pack_forget()
+        else:
+            self._destroy_page(page_id, frame)
+        self.page_content = self._page_host
+        self.current_page = None
+
+    def _destroy_page(self, page_id, frame):
+        if page_id == "summary":
+            self.summary_dashboard_data = None
+            self.summary_pie_frame = self.summary_bar_frame = None
+            self.summary_chart_labels = {}
+            self.summary_chart_images = {}
+            self._cancel_summary_chart_resize()
+        frame.destroy()
+        self._clear_page_i18n(page_id)
+        self._page_wheel_targets.pop(page_id, None)
+        self._canvas_widgets = [
+            entry for entry in self._canvas_widgets if entry["widget"].winfo_exists()
+        ]
+        self._text_widgets = [
+            widget for widget in self._text_widgets if widget.winfo_exists()
+        ]
+
+    def _reset_pages(self):
+        """Destroy every built page, e.g. when the user logs out."""
+        self._cancel_queries()
+        for channel in ("delay_import", "summary_import"):
+            self._import_runner.cancel(channel)
+        self._hide_current_page()
+        self.pages.clear()
+
+    def _restore_page_mousewheel(self, page_id):
+        target = self._page_wheel_targets.get(page_id)
+        if target is not None:
+            self._bind_canvas_mousewheel(*target)
+            return
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.parent.unbind_all(sequence)
+
+    def _refresh_page_data(self, page_id):
+        """Reload the data shown by a cached page when it is shown again."""
+        if page_id == "daily_report":
+            self._update_shift_values()
+        elif page_id == "attendance":
+            if self.active_report_id:
+                self._load_attendance_entries()
+            else:
+                self.attendance_section.clear_data()
+        elif page_id in ("equipment", "lot"):
+            # 報表日期/班別/區域變更後，清空上一份報表尚未送出的表單
+            if self._form_report_ids.get(page_id) != self.active_report_id:
+                self._clear_report_form(page_id)
+        elif page_id == "summary":
+            interrupted = "summary_dashboard" in self._interrupted_queries
+            if interrupted or self.summary_dashboard_data is not None:
+                self._load_summary_dashboard()
+        elif page_id == "delay_list":
+            self._apply_report_date_to_filters()
+            self._load_delay_entries()
+        elif page_id == "summary_actual":
+            self._apply_report_date_to_filters()
+            self._load_summary_actual()
+        elif page_id == "summary_query":
+            self._apply_report_date_to_filters()
+            self._load_summary_query_records()
+        elif page_id == "abnormal_history":
+            self._load_abnormal_history()
+
     def update_nav_buttons(self, active_page):
         """更新導航按鈕狀態"""
         for page_id, button in self.nav_buttons.items():
@@ -1265,6 +1860,8 @@ class ModernMainFrame:
         def _on_mousewheel_linux(event):
             _safe_scroll(int(-1 * event.num))
 
+        if self.current_page is not None:
+            self._page_wheel_targets[self.current_page] = (frame, canvas)
         frame.bind_all("<MouseWheel>", _on_mousewheel)
         frame.bind_all("<Button-4>", _on_mousewheel_linux)
         frame.bind_all("<Button-5>", _on_mousewheel_linux)
@@ -1446,28 +2043,24 @@ class ModernMainFrame:
         self._register_text(label, label_key, label_default, scope="page")
         return widget
 
-    def _load_shift_area_options(self):
+    @staticmethod
+    def _query_shift_area_options(db):
+        return master_data_cache.get(db)
+
+    def _apply_shift_area_options(self, shifts, areas):
         shift_defaults = ["Day", "Night"]
         area_defaults = ["etching_D", "etching_E", "litho", "thin_film"]
+        self.shift_options = sorted(
+            shifts or shift_defaults, key=lambda v: str(v).lower()
+        )
+        self.area_options = sorted(areas or area_defaults, key=lambda v: str(v).lower())
+
+    def _load_shift_area_options(self):
         try:
-            with SessionLocal() as db:
-                shifts = [
-                    opt.name
-                    for opt in db.query(ShiftOption).order_by(ShiftOption.id).all()
-                ]
-                areas = [
-                    opt.name
-                    for opt in db.query(AreaOption).order_by(AreaOption.id).all()
-                ]
-            self.shift_options = sorted(
-                shifts or shift_defaults, key=lambda v: str(v).lower()
-            )
-            self.area_options = sorted(
-                areas or area_defaults, key=lambda v: str(v).lower()
-            )
+            shifts, areas = master_data_cache.get()
         except Exception:
-            self.shift_options = sorted(shift_defaults, key=lambda v: str(v).lower())
-            self.area_options = sorted(area_defaults, key=lambda v: str(v).lower())
+            shifts, areas = [], []
+        self._apply_shift_area_options(shifts, areas)
 
     def _build_shift_display_options(self):
         display_values, code_map, display_map = build_shift_display_options(
@@ -1768,6 +2361,7 @@ class ModernMainFrame:
             history_btn, "actions.viewEquipmentHistory", "📋 查看歷史", scope="page"
         )
         history_btn.pack(side="left", padx=10)
+        self._form_report_ids["equipment"] = self.active_report_id
 
     def create_lot_page(self):
         """創建異常批次頁面"""
@@ -1884,6 +2478,7 @@ class ModernMainFrame:
             list_btn, "actions.viewLotList", "📋 批次列表", scope="page"
         )
         list_btn.pack(side="left", padx=10)
+        self._form_report_ids["lot"] = self.active_report_id
 
     def create_summary_page(self):
         """創建總結頁面"""
@@ -2062,6 +2657,16 @@ class ModernMainFrame:
         )
         charts_card.pack(fill="both", expand=True)
 
+        charts_toolbar = ttk.Frame(charts_card, style="Card.TFrame")
+        charts_toolbar.pack(fill="x", padx=self.layout["card_pad"], pady=(10, 0))
+        export_charts_btn = ttk.Button(
+            charts_toolbar, command=self._export_summary_charts
+        )
+        self._register_text(
+            export_charts_btn, "summaryDashboard.exportCharts", "匯出圖表", scope="page"
+        )
+        export_charts_btn.pack(side="right")
+
         charts_frame = ttk.Frame(charts_card, style="Card.TFrame")
         charts_frame.pack(
             fill="both",
@@ -2069,16 +2674,26 @@ class ModernMainFrame:
             padx=self.layout["card_pad"],
             pady=self.layout["card_pad"],
         )
-        charts_frame.columnconfigure(0, weight=1)
-        charts_frame.columnconfigure(1, weight=1)
+        charts_frame.columnconfigure(0, weight=1, uniform="summary_charts")
+        charts_frame.columnconfigure(1, weight=1, uniform="summary_charts")
 
-        self.summary_pie_frame = ttk.Frame(charts_frame, style="Card.TFrame")
+        # 圖片大小跟隨欄寬，圖片不反過來撐大欄位；高度隨寬度調整
+        _width, chart_height = chart_image_size(0)
+        self.summary_pie_frame = ttk.Frame(
+            charts_frame, style="Card.TFrame", width=1, height=chart_height
+        )
         self.summary_pie_frame.grid(row=0, column=0, sticky="nsew", padx=(0, 10))
-        self.summary_bar_frame = ttk.Frame(charts_frame, style="Card.TFrame")
+        self.summary_bar_frame = ttk.Frame(
+            charts_frame, style="Card.TFrame", width=1, height=chart_height
+        )
         self.summary_bar_frame.grid(row=0, column=1, sticky="nsew")
+        for frame in (self.summary_pie_frame, self.summary_bar_frame):
+            frame.pack_propagate(False)
+        charts_frame.bind("<Configure>", self._on_summary_charts_configure, add="+")
 
-        self.summary_pie_canvas = None
-        self.summary_bar_canvas = None
+        self.summary_chart_labels = {}
+        self.summary_chart_images = {}
+        self._summary_chart_size = None
         self.summary_dashboard_data = None
         self._render_summary_charts(None)
 
@@ -2228,6 +2843,7 @@ class ModernMainFrame:
             return
         try:
             with SessionLocal() as db:
+                hidden_keys = set()
                 for item_id in selections:
                     try:
                         report_id = int(item_id)
@@ -2243,6 +2859,9 @@ class ModernMainFrame:
                         else ""
                     )
                     report.last_modified_at = datetime.now()
+                    hidden_keys.add((report.date, report.shift, report.area))
+                db.flush()
+                refresh_attendance_rollup(db, hidden_keys)
                 db.commit()
             self._load_summary_dashboard()
         except Exception as exc:
@@ -2470,6 +3089,7 @@ class ModernMainFrame:
 
         updated = 0
         conflicts = 0
+        rollup_keys = set()
         try:
             with SessionLocal() as db:
                 for item_id in selections:
@@ -2526,6 +3146,8 @@ class ModernMainFrame:
                     )
                     if not row:
                         continue
+                    rollup_keys.add((row.date, row.shift, row.area))
+                    rollup_keys.add((new_date, shift_code, area_value))
                     row.date = new_date
                     row.shift = shift_code
                     row.area = area_value
@@ -2535,6 +3157,8 @@ class ModernMainFrame:
                     row.last_modified_at = datetime.now()
                     updated += 1
                 if updated:
+                    db.flush()
+                    refresh_attendance_rollup(db, rollup_keys)
                     db.commit()
             if conflicts:
                 messagebox.showwarning(
@@ -2589,145 +3213,84 @@ class ModernMainFrame:
             self._render_summary_charts(None)
             return
 
-        try:
-            with SessionLocal() as db:
-                reports = (
-                    db.query(DailyReport)
-                    .options(joinedload(DailyReport.author))
-                    .filter(
-                        DailyReport.date >= start_date,
-                        DailyReport.date <= end_date,
-                        DailyReport.is_hidden == 0,
-                    )
-                    .order_by(DailyReport.date, DailyReport.shift, DailyReport.area)
-                    .all()
-                )
-                if not reports:
-                    self.summary_dashboard_data = None
-                    self._render_summary_charts(None)
-                    messagebox.showinfo(
-                        self._t("common.info", "資訊"),
-                        self._t("common.emptyData", "查無資料"),
-                    )
-                    return
-                report_ids = [report.id for report in reports]
-                attendance_rows = (
-                    db.query(AttendanceEntry)
-                    .filter(AttendanceEntry.report_id.in_(report_ids))
-                    .all()
-                )
-                overtime_rows = (
-                    db.query(OvertimeEntry)
-                    .filter(OvertimeEntry.report_id.in_(report_ids))
-                    .all()
-                )
-
-            attendance_by_report = {}
-            overtime_by_report = {}
-            for report in reports:
-                attendance_by_report[report.id] = {
-                    "regular": {"present": 0, "absent": 0, "reason": ""},
-                    "contract": {"present": 0, "absent": 0, "reason": ""},
-                }
-                overtime_by_report[report.id] = 0
-
-            for row in attendance_rows:
-                category = (row.category or "").lower()
-                bucket = "regular" if category.startswith("reg") else "contract"
-                target = attendance_by_report.get(row.report_id)
-                if not target:
-                    continue
-                slot = target[bucket]
-                slot["present"] += int(row.present_count or 0)
-                slot["absent"] += int(row.absent_count or 0)
-                reason = (row.reason or "").strip()
-                if reason:
-                    if slot["reason"]:
-                        slot["reason"] = f"{slot['reason']} / {reason}"
-                    else:
-                        slot["reason"] = reason
+        def _fetch(db):
+            summary = query_cache.fetch(
+                ("summary_dashboard", start_date, end_date, None, None),
+                SUMMARY_DASHBOARD_TABLES,
+                lambda: load_attendance_summary(db, start_date, end_date),
+            )
+            return summary, self._query_shift_area_options(db)
 
-            for row in overtime_rows:
-                if row.report_id in overtime_by_report:
-                    overtime_by_report[row.report_id] += int(row.count or 0)
+        self._submit_query(
+            "summary_dashboard",
+            _fetch,
+            self._render_summary_dashboard,
+            on_error=self._on_summary_dashboard_error,
+            busy_widget=self.summary_dash_tree,
+        )
 
-            total_present = 0
-            total_absent = 0
-            daily_counts = defaultdict(
-                lambda: {"regular": 0, "contract": 0, "present": 0, "absent": 0}
-            )
+    def _render_summary_dashboard(self, result):
+        if not self.summary_dash_tree.winfo_exists():
+            return
+        summary, (shifts, areas) = result
+        try:
+            if not summary.reports:
+                self.summary_dashboard_data = None
+                self._render_summary_charts(None)
+                messagebox.showinfo(
+                    self._t("common.info", "資訊"),
+                    self._t("common.emptyData", "查無資料"),
+                )
+                return
 
-            for report in reports:
-                data = attendance_by_report.get(report.id, {})
-                regular = data.get("regular", {})
-                contract = data.get("contract", {})
-                regular_present = regular.get("present", 0)
-                regular_absent = regular.get("absent", 0)
-                contract_present = contract.get("present", 0)
-                contract_absent = contract.get("absent", 0)
-                overtime_count = overtime_by_report.get(report.id, 0)
-                total_attendance = regular_present + contract_present + overtime_count
+            self._apply_shift_area_options(shifts, areas)
+            self._build_shift_display_options()
+            for row in summary.reports:
+                total_attendance = (
+                    row.regular_present + row.contract_present + row.overtime_count
+                )
                 notes = self._build_attendance_notes(
-                    regular.get("reason", ""), contract.get("reason", "")
+                    row.regular_reason, row.contract_reason
                 )
-                author_name = report.author.username if report.author else ""
-
                 self.summary_dash_tree.insert(
                     "",
                     "end",
-                    iid=str(report.id),
+                    iid=str(row.report_id),
                     values=(
-                        report.date.strftime("%Y-%m-%d"),
-                        self._format_shift_display(report.shift),
-                        report.area,
-                        author_name,
-                        regular_present,
-                        regular_absent,
-                        contract_present,
-                        contract_absent,
-                        overtime_count,
+                        row.date.strftime("%Y-%m-%d"),
+                        self.shift_display_map.get(row.shift, row.shift),
+                        row.area,
+                        row.author,
+                        row.regular_present,
+                        row.regular_absent,
+                        row.contract_present,
+                        row.contract_absent,
+                        row.overtime_count,
                         total_attendance,
                         notes,
-                        self._format_last_modified_display(report),
+                        self._format_last_modified_display(row),
                     ),
                 )
 
-                total_present += regular_present + contract_present
-                total_absent += regular_absent + contract_absent
-                daily_counts[report.date]["regular"] += regular_present
-                daily_counts[report.date]["contract"] += contract_present
-                daily_counts[report.date]["present"] += (
-                    regular_present + contract_present
-                )
-                daily_counts[report.date]["absent"] += regular_absent + contract_absent
-
-            daily_series = []
-            for date_key in sorted(daily_counts.keys()):
-                daily_series.append(
-                    {
-                        "date": date_key,
-                        "regular": daily_counts[date_key]["regular"],
-                        "contract": daily_counts[date_key]["contract"],
-                        "present": daily_counts[date_key]["present"],
-                        "absent": daily_counts[date_key]["absent"],
-                    }
-                )
-
             self.summary_dashboard_data = {
-                "total_present": total_present,
-                "total_absent": total_absent,
-                "daily_series": daily_series,
+                "total_present": summary.total_present,
+                "total_absent": summary.total_absent,
+                "daily_series": [point._asdict() for point in summary.daily_series],
+                "bucket": summary.bucket,
             }
             self._render_summary_charts(self.summary_dashboard_data)
         except Exception as exc:
-            self.summary_dashboard_data = None
-            self._render_summary_charts(None)
-            messagebox.showerror(
-                self._t("common.error", "錯誤"),
-                self._t("summaryDashboard.loadFailed", "統計載入失敗：{error}").format(
-                    error=exc
-                ),
-            )
+            self._on_summary_dashboard_error(exc)
+
+    def _on_summary_dashboard_error(self, exc):
+        self.summary_dashboard_data = None
+        self._render_summary_charts(None)
+        messagebox.showerror(
+            self._t("common.error", "錯誤"),
+            self._t("summaryDashboard.loadFailed", "統計載入失敗：{error}").format(
+                error=exc
+            ),
+        )
 
     def _load_abnormal_history(self):
         if not hasattr(self, "abnormal_equipment_tree") or not hasattr(
@@ -2763,75 +3326,69 @@ class ModernMainFrame:
             )
             return
 
-        try:
-            with SessionLocal() as db:
-                all_label = self._t("common.all", "全部")
-                shift_display = self.abnormal_shift_var.get().strip()
-                area_value = self.abnormal_area_var.get().strip()
-                shift_code = None
-                if shift_display and shift_display not in {
-                    "全部",
-                    "All",
-                    "すべて",
-                    all_label,
-                }:
-                    shift_code = self.shift_code_map.get(shift_display, shift_display)
-                if area_value in {"全部", "All", "すべて", all_label}:
-                    area_value = None
+        all_label = self._t("common.all", "全部")
+        shift_display = self.abnormal_shift_var.get().strip()
+        area_value = self.abnormal_area_var.get().strip()
+        shift_code = None
+        if shift_display and shift_display not in {
+            "全部",
+            "All",
+            "すべて",
+            all_label,
+        }:
+            shift_code = self.shift_code_map.get(shift_display, shift_display)
+        if area_value in {"全部", "All", "すべて", all_label}:
+            area_value = None
 
-                equipment_query = (
-                    db.query(EquipmentLog)
-                    .join(DailyReport)
-                    .options(
-                        joinedload(EquipmentLog.report).joinedload(DailyReport.author)
-                    )
-                    .filter(
-                        DailyReport.date >= start_date, DailyReport.date <= end_date
-                    )
-                    .filter(DailyReport.is_hidden == 0)
-                    .distinct()
-                )
-                if shift_code:
-                    equipment_query = equipment_query.filter(
-                        DailyReport.shift == shift_code
-                    )
-                if area_value:
-                    equipment_query = equipment_query.filter(
-                        DailyReport.area == area_value
-                    )
-                equipment_rows = equipment_query.order_by(
-                    DailyReport.date,
-                    DailyReport.area,
-                    DailyReport.shift,
-                    EquipmentLog.id,
-                ).all()
-
-                lot_query = (
-                    db.query(LotLog)
-                    .join(DailyReport)
-                    .options(joinedload(LotLog.report).joinedload(DailyReport.author))
-                    .filter(
-                        DailyReport.date >= start_date, DailyReport.date <= end_date
-                    )
-                    .filter(DailyReport.is_hidden == 0)
-                    .distinct()
-                )
-                if shift_code:
-                    lot_query = lot_query.filter(DailyReport.shift == shift_code)
-                if area_value:
-                    lot_query = lot_query.filter(DailyReport.area == area_value)
-                lot_rows = lot_query.order_by(
-                    DailyReport.date,
-                    DailyReport.area,
-                    DailyReport.shift,
-                    LotLog.id,
-                ).all()
-
-            for row in equipment_rows:
+        self._abnormal_filters = (start_date, end_date, shift_code, area_value)
+        self._abnormal_cursors = {"equip": None, "lot": None}
+        self._abnormal_loaded = {"equip": 0, "lot": 0}
+        self._fetch_abnormal_history_pages(("equip", "lot"))
+
+    def _load_more_abnormal_history(self, kind):
+        cursor = getattr(self, "_abnormal_cursors", {}).get(kind)
+        if cursor is not None:
+            self._fetch_abnormal_history_pages((kind,), cursor)
+
+    def _fetch_abnormal_history_pages(self, kinds, cursor=None):
+        start_date, end_date, shift_code, area_value = self._abnormal_filters
+        fetchers = {"equip": fetch_equipment_page, "lot": fetch_lot_page}
+
+        def _fetch_page(db, kind):
+            return query_cache.fetch(
+                ("abnormal_history", start_date, end_date, shift_code, area_value)
+                + (kind, cursor),
+                REPORT_LOG_TABLES,
+                lambda: fetchers[kind](
+                    db, start_date, end_date, shift_code, area_value, cursor=cursor
+                ),
+            )
+
+        def _fetch(db):
+            pages = {kind: _fetch_page(db, kind) for kind in kinds}
+            return pages, self._query_shift_area_options(db), cursor is not None
+
+        self._submit_query(
+            "abnormal_history",
+            _fetch,
+            self._render_abnormal_history,
+            on_error=self._on_abnormal_history_error,
+            busy_widget=self.abnormal_equipment_tree,
+        )
+
+    def _render_abnormal_history(self, result):
+        if not self.abnormal_equipment_tree.winfo_exists():
+            return
+        pages, (shifts, areas), appended = result
+        try:
+            self._apply_shift_area_options(shifts, areas)
+            self._build_shift_display_options()
+            equipment_page = pages.get("equip")
+            for row in equipment_page.rows if equipment_page else []:
                 report = row.report
                 if not report:
                     continue
-                shift_display = self._format_shift_display(report.shift)
+                shift_display = self.shift_display_map.get(report.shift, report.shift)
                 author_name = report.author.username if report.author else ""
                 self.abnormal_equipment_tree.insert(
                     "",
@@ -2852,11 +3409,12 @@ class ModernMainFrame:
                     ),
                 )
 
-            for row in lot_rows:
+            lot_page = pages.get("lot")
+            for row in lot_page.rows if lot_page else []:
                 report = row.report
                 if not report:
                     continue
-                shift_display = self._format_shift_display(report.shift)
+                shift_display = self.shift_display_map.get(report.shift, report.shift)
                 author_name = report.author.username if report.author else ""
                 self.abnormal_lot_tree.insert(
                     "",
@@ -2874,44 +3432,29 @@ class ModernMainFrame:
                     ),
                 )
 
-            if not equipment_rows and not lot_rows:
+            for kind, page in pages.items():
+                self._abnormal_cursors[kind] = page.next_cursor
+                self._abnormal_loaded[kind] += len(page.rows)
+                bar = getattr(self, f"abnormal_{kind}_more_bar", None)
+                self._update_load_more_bar(
+                    bar, self._abnormal_loaded[kind], page.next_cursor is not None
+                )
+
+            if not appended and not any(page.rows for page in pages.values()):
                 messagebox.showinfo(
                     self._t("common.info", "資訊"),
                     self._t("common.emptyData", "查無資料"),
                 )
         except Exception as exc:
-            messagebox.showerror(
-                self._t("common.error", "錯誤"),
-                self._t("abnormalHistory.loadFailed", "查詢失敗：{error}").format(
-                    error=exc
-                ),
-            )
+            self._on_abnormal_history_error(exc)
 
-    def _ensure_cjk_font(self):
-        if self._cjk_font_ready:
-            return
-        candidates = [
-            "Noto Sans CJK TC",
-            "Noto Sans CJK JP",
-            "Noto Sans CJK SC",
-            "Noto Sans TC",
-            "Noto Sans JP",
-            "Microsoft YaHei",
-            "PingFang TC",
-            "PingFang SC",
-            "Heiti TC",
-            "Hiragino Sans",
-            "Yu Gothic",
-            "MS Gothic",
-            "IPAexGothic",
-            "IPAGothic",
-            "SimHei",
-            "Arial Unicode MS",
-        ]
-        rcParams["font.family"] = "sans-serif"
-        rcParams["font.sans-serif"] = candidates + ["DejaVu Sans"]
-        rcParams["axes.unicode_minus"] = False
-        self._cjk_font_ready = True
+    def _on_abnormal_history_error(self, exc):
+        messagebox.showerror(
+            self._t("common.error", "錯誤"),
+            self._t("abnormalHistory.loadFailed", "查詢失敗：{error}").format(
+                error=exc
+            ),
+        )
 
     def _get_chart_theme(self):
         colors = self.COLORS
@@ -2924,16 +3467,6 @@ class ModernMainFrame:
             "bar_accent": colors["accent"],
         }
 
-    def _apply_chart_axes_theme(self, ax, theme):
-        ax.set_facecolor(theme["face"])
-        ax.tick_params(axis="x", colors=theme["text"])
-        ax.tick_params(axis="y", colors=theme["text"])
-        ax.title.set_color(theme["text"])
-        ax.xaxis.label.set_color(theme["text"])
-        ax.yaxis.label.set_color(theme["text"])
-        for spine in ax.spines.values():
-            spine.set_color(theme["grid"])
-
     def _clear_summary_charts(self):
         for frame in (
             getattr(self, "summary_pie_frame", None),
@@ -2943,32 +3476,32 @@ class ModernMainFrame:
                 continue
             for child in frame.winfo_children():
                 child.destroy()
-        self.summary_pie_canvas = None
-        self.summary_bar_canvas = None
+        self.summary_chart_labels = {}
 
     def _render_summary_charts(self, data):
         if not getattr(self, "summary_pie_frame", None) or not getattr(
             self, "summary_bar_frame", None
         ):
             return
-        self._clear_summary_charts()
-        if not data:
-            empty_text = self._t("common.emptyData", "查無資料")
-            if hasattr(self, "summary_pie_frame"):
-                ttk.Label(
-                    self.summary_pie_frame, text=empty_text, font=("Segoe UI", 10)
-                ).pack(expand=True)
-            if hasattr(self, "summary_bar_frame"):
-                ttk.Label(
-                    self.summary_bar_frame, text=empty_text, font=("Segoe UI", 10)
-                ).pack(expand=True)
+        empty_text = self._t("common.emptyData", "查無資料")
+        if not data and not self.summary_chart_labels:
+            self._clear_summary_charts()
+            self.summary_chart_images = {}
+            for frame in (self.summary_pie_frame, self.summary_bar_frame):
+                ttk.Label(frame, text=empty_text, font=("Segoe UI", 10)).pack(
+                    expand=True
+                )
             return
 
-        self._ensure_cjk_font()
-        theme = self._get_chart_theme()
-
-        daily_series = data.get("daily_series", [])
-        labels = [item["date"].strftime("%Y-%m-%d") for item in daily_series]
+        daily_series = (data or {}).get("daily_series", [])
+        bucket = (data or {}).get("bucket", BUCKET_DAY)
+        date_format = "%Y-%m" if bucket == BUCKET_MONTH else "%Y-%m-%d"
+        labels = [item["date"].strftime(date_format) for item in daily_series]
+        x_axis = {
+            BUCKET_DAY: self._t("summaryDashboard.bucketDay", "日期"),
+            BUCKET_WEEK: self._t("summaryDashboard.bucketWeek", "週 (週一起算)"),
+            BUCKET_MONTH: self._t("summaryDashboard.bucketMonth", "月份"),
+        }.get(bucket, "")
         regular_values = [item["regular"] for item in daily_series]
         contract_values = [item["contract"] for item in daily_series]
         rate_values = []
@@ -2976,122 +3509,129 @@ class ModernMainFrame:
             total = item.get("present", 0) + item.get("absent", 0)
             rate_values.append((item.get("present", 0) / total * 100) if total else 0)
 
-        line_fig = Figure(figsize=(4.2, 3.2), dpi=100)
-        line_fig.patch.set_facecolor(theme["face"])
-        line_ax = line_fig.add_subplot(111)
-        self._apply_chart_axes_theme(line_ax, theme)
-        line_ax.set_title(self._t("summaryDashboard.rateLineTitle", "出勤率趨勢"))
-        if labels:
-            x = list(range(len(labels)))
-            line_ax.plot(
-                x,
-                rate_values,
-                marker="o",
-                color=theme["line"],
-                label=self._t("summaryDashboard.rateSeries", "出勤率"),
-            )
-            for idx, rate in enumerate(rate_values):
-                line_ax.annotate(
-                    f"{rate:.1f}%",
-                    (x[idx], rate),
-                    textcoords="offset points",
-                    xytext=(0, 6),
-                    ha="center",
-                    color=theme["text"],
-                    fontsize=8,
-                )
-            line_ax.set_xticks(x)
-            line_ax.set_xticklabels(labels, rotation=45, ha="right")
-            line_ax.set_ylabel(self._t("summaryDashboard.rateAxis", "出勤率 (%)"))
-            line_ax.set_ylim(0, 100)
-            legend = line_ax.legend(loc="upper right")
-            legend.get_frame().set_facecolor(theme["face"])
-            legend.get_frame().set_edgecolor(theme["grid"])
-            for text in legend.get_texts():
-                text.set_color(theme["text"])
-        else:
-            line_ax.text(
-                0.5,
-                0.5,
-                self._t("common.emptyData", "查無資料"),
-                ha="center",
-                va="center",
-                color=theme["text"],
-            )
-        line_fig.tight_layout()
-        self.summary_pie_canvas = FigureCanvasTkAgg(
-            line_fig, master=self.summary_pie_frame
-        )
-        self.summary_pie_canvas.draw()
-        self.summary_pie_canvas.get_tk_widget().configure(background=theme["face"])
-        self.summary_pie_canvas.get_tk_widget().pack(fill="both", expand=True)
-
-        bar_fig = Figure(figsize=(4.6, 3.2), dpi=100)
-        bar_fig.patch.set_facecolor(theme["face"])
-        bar_ax = bar_fig.add_subplot(111)
-        self._apply_chart_axes_theme(bar_ax, theme)
-        bar_ax.set_title(self._t("summaryDashboard.countChartTitle", "出勤人數"))
-
-        if labels:
-            x = list(range(len(labels)))
-            bar_ax.bar(
-                x,
-                regular_values,
-                label=self._t("attendance.regular_short", "正職"),
-                color=theme["bar_primary"],
-            )
-            bar_ax.bar(
-                x,
-                contract_values,
-                bottom=regular_values,
-                label=self._t("attendance.contractor_short", "契約"),
-                color=theme["bar_accent"],
+        # 圖表在背景執行緒以 Agg 繪製；輸入未變時直接顯示快取的 PNG
+        requests = summary_chart_requests(
+            labels,
+            rate_values,
+            regular_values,
+            contract_values,
+            {
+                "title": self._t("summaryDashboard.rateLineTitle", "出勤率趨勢"),
+                "series": self._t("summaryDashboard.rateSeries", "出勤率"),
+                "axis": self._t("summaryDashboard.rateAxis", "出勤率 (%)"),
+                "empty": empty_text,
+                "x_axis": x_axis,
+            },
+            {
+                "title": self._t("summaryDashboard.countChartTitle", "出勤人數"),
+                "regular": self._t("attendance.regular_short", "正職"),
+                "contract": self._t("attendance.contractor_short", "契約"),
+                "axis": self._t("summaryDashboard.countAxis", "出勤人數"),
+                "empty": empty_text,
+                "x_axis": x_axis,
+            },
+            self._get_chart_theme(),
+            self.lang_manager.current_language,
+            self._current_summary_chart_size(),
+        )
+        self._chart_renderer.show(
+            requests, self._show_summary_chart_images, on_error=self._show_query_error
+        )
+
+    def _summary_chart_frames_exist(self):
+        frames = (self.summary_pie_frame, self.summary_bar_frame)
+        return all(frame and frame.winfo_exists() for frame in frames)
+
+    def _summary_chart_slot_size(self):
+        if not self._summary_chart_frames_exist():
+            return chart_image_size(0)
+        frames = (self.summary_pie_frame, self.summary_bar_frame)
+        return chart_image_size(min(frame.winfo_width() for frame in frames))
+
+    def _current_summary_chart_size(self):
+        self._summary_chart_size = self._summary_chart_slot_size()
+        return self._summary_chart_size
+
+    def _on_summary_charts_configure(self, _event=None):
+        if not self._summary_chart_frames_exist():
+            return
+        size = self._summary_chart_slot_size()
+        for chart_frame in (self.summary_pie_frame, self.summary_bar_frame):
+            if int(chart_frame.cget("height")) != size[1]:
+                chart_frame.configure(height=size[1])
+        if size == self._summary_chart_size:
+            return
+        # 拖曳調整視窗大小時只在停止後重繪一次
+        self._cancel_summary_chart_resize()
+        self._summary_chart_resize_id = self.parent.after(
+            200, self._rerender_summary_charts_for_size
+        )
+
+    def _rerender_summary_charts_for_size(self):
+        self._summary_chart_resize_id = None
+        if self.summary_chart_labels:
+            self._render_summary_charts(self.summary_dashboard_data)
+        elif self._summary_chart_frames_exist():
+            self._current_summary_chart_size()
+
+    def _cancel_summary_chart_resize(self):
+        if self._summary_chart_resize_id is not None:
+            try:
+                self.parent.after_cancel(self._summary_chart_resize_id)
+            except Exception:
+                pass
+            self._summary_chart_resize_id = None
+
+    def _show_summary_chart_images(self, images):
+        if not self._summary_chart_frames_exist():
+            return
+        frames = {"rate": self.summary_pie_frame, "count": self.summary_bar_frame}
+        if not self.summary_chart_labels:
+            self._clear_summary_charts()
+            for kind, frame in frames.items():
+                label = ttk.Label(frame)
+                label.pack(expand=True)
+                self.summary_chart_labels[kind] = label
+        for kind, label in self.summary_chart_labels.items():
+            photo = tk.PhotoImage(data=base64.b64encode(images[kind]))
+            label.configure(image=photo)
+            label.image = photo
+        self.summary_chart_images = images
+
+    def _export_summary_charts(self):
+        """Save the chart images on screen as PNG files, without drawing again."""
+        images = dict(getattr(self, "summary_chart_images", {}))
+        if not images:
+            messagebox.showinfo(
+                self._t("common.info", "資訊"), self._t("common.emptyData", "查無資料")
             )
-            for idx, (reg, con) in enumerate(zip(regular_values, contract_values)):
-                if reg:
-                    bar_ax.text(
-                        x[idx],
-                        reg / 2,
-                        f"{reg}",
-                        ha="center",
-                        va="center",
-                        color=theme["text"],
-                        fontsize=8,
-                    )
-                if con:
-                    bar_ax.text(
-                        x[idx],
-                        reg + (con / 2),
-                        f"{con}",
-                        ha="center",
-                        va="center",
-                        color=theme["text"],
-                        fontsize=8,
-                    )
-            bar_ax.set_xticks(x)
-            bar_ax.set_xticklabels(labels, rotation=45, ha="right")
-            bar_ax.set_ylabel(self._t("summaryDashboard.countAxis", "出勤人數"))
-            legend = bar_ax.legend(loc="upper right")
-            legend.get_frame().set_facecolor(theme["face"])
-            legend.get_frame().set_edgecolor(theme["grid"])
-            for text in legend.get_texts():
-                text.set_color(theme["text"])
-        else:
-            bar_ax.text(
-                0.5,
-                0.5,
-                self._t("common.emptyData", "查無資料"),
-                ha="center",
-                va="center",
-                color=theme["text"],
+            return
+        folder = filedialog.askdirectory(
+            parent=self.parent,
+            title=self._t("summaryDashboard.exportCharts", "匯出圖表"),
+        )
+        if not folder:
+            return
+        start = self.summary_dash_start_var.get().strip()
+        end = self.summary_dash_end_var.get().strip()
+        try:
+            for kind, png in images.items():
+                target = Path(folder) / f"attendance_{kind}_{start}_{end}.png"
+                target.write_bytes(png)
+        except OSError as exc:
+            messagebox.showerror(
+                self._t("common.error", "錯誤"),
+                self._t(
+                    "summaryDashboard.exportChartsFailed", "匯出圖表失敗：{error}"
+                ).format(error=exc),
             )
-        bar_fig.tight_layout()
-        self.summary_bar_canvas = FigureCanvasTkAgg(
-            bar_fig, master=self.summary_bar_frame
+            return
+        messagebox.showinfo(
+            self._t("common.info", "資訊"),
+            self._t(
+                "summaryDashboard.exportChartsDone", "已匯出 {count} 張圖表至 {folder}"
+            ).format(count=len(images), folder=folder),
         )
-        self.summary_bar_canvas.draw()
-        self.summary_bar_canvas.get_tk_widget().configure(background=theme["face"])
-        self.summary_bar_canvas.get_tk_widget().pack(fill="both", expand=True)
 
     def create_delay_list_page(self):
         """創建延遲清單頁面"""
@@ -3187,6 +3727,28 @@ class ModernMainFrame:
         self._register_text(clear_btn, "delay.clear", "清除畫面", scope="page")
         clear_btn.grid(row=1, column=3, padx=(20, 0), pady=self.layout["row_pad"])
 
+        folder_btn = ttk.Button(
+            control_frame, style="Accent.TButton", command=self._import_delay_folder
+        )
+        self._register_text(folder_btn, "delay.importFolder", "匯入資料夾", scope="page")
+        folder_btn.grid(row=1, column=4, padx=(20, 0), pady=self.layout["row_pad"])
+
+        history_btn = ttk.Button(
+            control_frame,
+            style="Accent.TButton",
+            command=lambda: self._show_import_history(DELAY),
+        )
+        self._register_text(history_btn, "common.importHistory", "匯入紀錄", scope="page")
+        history_btn.grid(row=1, column=5, padx=(20, 0), pady=self.layout["row_pad"])
+
+        self.delay_import_progress = self._create_import_progress_bar(
+            control_frame, "delay_import"
+        )
+        self.delay_import_progress["frame"].grid(
+            row=2, column=0, columnspan=6, sticky="w", pady=self.layout["row_pad"]
+        )
+        self.delay_import_progress["frame"].grid_remove()
+
         table_card = self.create_card(
             self.page_content, "📋", "cards.delayListTable", "延遲清單資料"
         )
@@ -3238,6 +3800,11 @@ class ModernMainFrame:
             "action": "w",
             "progress": "w",
         }
+        self.delay_more_bar = self._create_load_more_bar(
+            table_frame, self._load_more_delay_entries
+        )
+        self.delay_more_bar["frame"].pack(side="bottom", fill="x", pady=(8, 0))
+
         delay_tree_data = create_treeview_with_scrollbars(
             parent=table_frame,
             columns=cols,
@@ -3250,6 +3817,7 @@ class ModernMainFrame:
             double_click_handler=self._start_delay_cell_edit,
             context_menu_handler=self._show_delay_context_menu,
             translate=self._t,
+            virtual=True,
         )
         self.delay_tree = delay_tree_data["tree"]
         self._configure_delay_tree = delay_tree_data["configure"]
@@ -3352,6 +3920,32 @@ class ModernMainFrame:
         self._register_text(clear_btn, "summaryActual.clear", "清除畫面", scope="page")
         clear_btn.grid(row=1, column=2, padx=(20, 0), pady=self.layout["row_pad"])
 
+        folder_btn = ttk.Button(
+            control_frame,
+            style="Accent.TButton",
+            command=self._import_summary_actual_folder,
+        )
+        self._register_text(
+            folder_btn, "summaryActual.importFolder", "匯入資料夾", scope="page"
+        )
+        folder_btn.grid(row=1, column=3, padx=(20, 0), pady=self.layout["row_pad"])
+
+        history_btn = ttk.Button(
+            control_frame,
+            style="Accent.TButton",
+            command=lambda: self._show_import_history(SUMMARY_ACTUAL),
+        )
+        self._register_text(history_btn, "common.importHistory", "匯入紀錄", scope="page")
+        history_btn.grid(row=1, column=4, padx=(20, 0), pady=self.layout["row_pad"])
+
+        self.summary_import_progress = self._create_import_progress_bar(
+            control_frame, "summary_import"
+        )
+        self.summary_import_progress["frame"].grid(
+            row=2, column=0, columnspan=6, sticky="w", pady=self.layout["row_pad"]
+        )
+        self.summary_import_progress["frame"].grid_remove()
+
         table_card = self.create_card(
             self.page_content, "📋", "cards.summaryActualTable", "Summary Actual 資料"
         )
@@ -3574,6 +4168,11 @@ class ModernMainFrame:
             ("lot.notes", "特記事項"),
         ]
 
+        self.summary_query_more_bar = self._create_load_more_bar(
+            table_frame, self._load_more_summary_query_records
+        )
+        self.summary_query_more_bar["frame"].pack(side="bottom", fill="x", pady=(8, 0))
+
         table_inner = ttk.Frame(table_frame, style="Card.TFrame")
         table_inner.pack(fill="both", expand=True)
 
@@ -3586,6 +4185,7 @@ class ModernMainFrame:
             horizontal_scrollbar=True,
             context_menu_handler=self._show_summary_query_context_menu,
             translate=self._t,
+            virtual=True,
         )
         self.summary_query_tree = summary_tree_data["tree"]
         self._configure_summary_query_tree = summary_tree_data["configure"]
@@ -3749,6 +4349,11 @@ class ModernMainFrame:
             ("common.image", "異常圖片"),
         ]
 
+        self.abnormal_equip_more_bar = self._create_load_more_bar(
+            equipment_frame, lambda: self._load_more_abnormal_history("equip")
+        )
+        self.abnormal_equip_more_bar["frame"].pack(side="bottom", fill="x", pady=(8, 0))
+
         equipment_inner = ttk.Frame(equipment_frame, style="Card.TFrame")
         equipment_inner.pack(fill="both", expand=True)
 
@@ -3758,6 +4363,7 @@ class ModernMainFrame:
             header_keys=self.abnormal_equipment_header_keys,
             height=8,
             translate=self._t,
+            virtual=True,
         )
         self.abnormal_equipment_tree = abnormal_equip_tree_data["tree"]
         self._configure_abnormal_equipment_tree = abnormal_equip_tree_data["configure"]
@@ -3803,6 +4409,11 @@ class ModernMainFrame:
             ("lot.notes", "特記事項"),
         ]
 
+        self.abnormal_lot_more_bar = self._create_load_more_bar(
+            lot_frame, lambda: self._load_more_abnormal_history("lot")
+        )
+        self.abnormal_lot_more_bar["frame"].pack(side="bottom", fill="x", pady=(8, 0))
+
         lot_inner = ttk.Frame(lot_frame, style="Card.TFrame")
         lot_inner.pack(fill="both", expand=True)
 
@@ -3812,6 +4423,7 @@ class ModernMainFrame:
             header_keys=self.abnormal_lot_header_keys,
             height=8,
             translate=self._t,
+            virtual=True,
         )
         self.abnormal_lot_tree = abnormal_lot_tree_data["tree"]
         self._configure_abnormal_lot_tree = abnormal_lot_tree_data["configure"]
@@ -3939,8 +4551,27 @@ class ModernMainFrame:
         self._register_text(save_btn, "settings.saveBackup", "確認", scope="page")
         save_btn.pack(side="left")
 
+        stats_btn = ttk.Button(
+            system_card, style="Accent.TButton", command=self._show_query_cache_stats
+        )
+        self._register_text(
+            stats_btn, "settings.queryCacheStats", "查詢快取統計", scope="page"
+        )
+        stats_btn.pack(anchor="w", padx=20, pady=(0, 15))
+
         self._load_system_settings()
 
+    def _show_query_cache_stats(self):
+        stats = query_cache.stats()
+        messagebox.showinfo(
+            self._t("settings.queryCacheStats", "查詢快取統計"),
+            self._t(
+                "settings.queryCacheStatsBody",
+                "快取筆數：{entries}\n命中：{hits}\n未命中：{misses}\n"
+                "命中率：{rate}\n失效筆數：{invalidations}",
+            ).format(rate=f"{stats['hit_rate']:.0%}", **stats),
+        )
+
     def _settings_path(self):
         return str(get_settings_path())
 
@@ -4237,6 +4868,9 @@ class ModernMainFrame:
         if not self._can_close_app(confirm=True):
             return
         self._closing = True
+        self._query_runner.shutdown()
+        self._import_runner.shutdown()
+        self._chart_renderer.shutdown()
         self.parent.destroy()
 
     def _request_restart(self, skip_checks=False):
@@ -4252,6 +4886,9 @@ class ModernMainFrame:
             ),
         )
         self._closing = True
+        self._query_runner.shutdown()
+        self._import_runner.shutdown()
+        self._chart_renderer.shutdown()
         self.parent.destroy()
 
     def toggle_auth(self):
@@ -4310,6 +4947,7 @@ class ModernMainFrame:
         self.current_user = None
         self._update_auth_ui()
         self._reset_report_state()
+        self._reset_pages()
         self._set_status("status.loggedOut", "✅ 已登出")
         self._show_login_screen()
 
@@ -4492,6 +5130,18 @@ class ModernMainFrame:
                 db.add(entry)
                 db.commit()
             self._set_status("status.equipmentAdded", "✅ 設備異常記錄已添加")
+            self._clear_report_form("equipment")
+        except Exception as exc:
+            messagebox.showerror(
+                self._t("common.error", "錯誤"),
+                self._t("equipment.saveFailed", "設備異常儲存失敗：{error}").format(
+                    error=exc
+                ),
+            )
+
+    def _clear_report_form(self, page_id):
+        """Empty the equipment or lot form and tie it to the active report."""
+        if page_id == "equipment":
             self.equip_id_var.set("")
             self.start_time_var.set("")
             self.impact_qty_var.set("0")
@@ -4500,13 +5150,12 @@ class ModernMainFrame:
             self.action_text.delete("1.0", "end")
             if hasattr(self, "image_path_var"):
                 self.image_path_var.set("")
-        except Exception as exc:
-            messagebox.showerror(
-                self._t("common.error", "錯誤"),
-                self._t("equipment.saveFailed", "設備異常儲存失敗：{error}").format(
-                    error=exc
-                ),
-            )
+        else:
+            self.lot_id_var.set("")
+            self.lot_status_var.set("")
+            self.lot_desc_text.delete("1.0", "end")
+            self.lot_notes_text.delete("1.0", "end")
+        self._form_report_ids[page_id] = self.active_report_id
 
     def view_equipment_history(self):
         """查看設備歷史"""
@@ -4561,10 +5210,7 @@ class ModernMainFrame:
                 db.add(entry)
                 db.commit()
             self._set_status("status.lotAdded", "✅ 批次異常記錄已添加")
-            self.lot_id_var.set("")
-            self.lot_status_var.set("")
-            self.lot_desc_text.delete("1.0", "end")
-            self.lot_notes_text.delete("1.0", "end")
+            self._clear_report_form("lot")
         except Exception as exc:
             messagebox.showerror(
                 self._t("common.error", "錯誤"),
@@ -4783,6 +5429,10 @@ class ModernMainFrame:
                     report.summary_key_output = key_output
                     report.summary_issues = issues
                     report.summary_countermeasures = counter
+                db.flush()
+                refresh_attendance_rollup(
+                    db, {(report.date, report.shift, report.area)}
+                )
                 db.commit()
                 db.refresh(report)
 
@@ -5010,6 +5660,10 @@ class ModernMainFrame:
                                     notes=ot_notes,
                                 )
                             )
+                db.flush()
+                refresh_attendance_rollup(
+                    db, rollup_keys_for_reports(db, [self.active_report_id])
+                )
                 db.commit()
             self._set_status("status.attendanceSaved", "✅ 出勤資料已儲存")
             return True
@@ -5058,7 +5712,8 @@ class ModernMainFrame:
             )
             return
 
-        self._load_shift_area_options()
+        if not hasattr(self, "shift_code_map"):
+            self._build_shift_display_options()
         all_label = self._t("common.all", "全部")
         all_labels = {"全部", "All", "すべて", all_label}
         shift_display = (
@@ -5077,59 +5732,94 @@ class ModernMainFrame:
         if area_value in all_labels:
             area_value = None
 
-        try:
-            with SessionLocal() as db:
-                query = (
-                    db.query(DailyReport)
-                    .options(joinedload(DailyReport.author))
-                    .filter(
-                        DailyReport.date >= start_date,
-                        DailyReport.date <= end_date,
-                        DailyReport.is_hidden == 0,
-                    )
-                    .distinct()
-                )
-                if shift_code:
-                    query = query.filter(DailyReport.shift == shift_code)
-                if area_value:
-                    query = query.filter(DailyReport.area == area_value)
-                reports = query.order_by(
-                    DailyReport.date,
-                    DailyReport.area,
-                    DailyReport.shift,
-                    DailyReport.id,
-                ).all()
-                if not reports:
-                    messagebox.showinfo(
-                        self._t("common.info", "資訊"),
-                        self._t("common.emptyData", "查無資料"),
-                    )
-                    return
-                report_ids = [report.id for report in reports]
-                equipment_rows = (
-                    db.query(EquipmentLog)
-                    .options(joinedload(EquipmentLog.report))
-                    .filter(EquipmentLog.report_id.in_(report_ids))
-                    .order_by(EquipmentLog.report_id, EquipmentLog.id)
-                    .distinct()
-                    .all()
-                )
-                lot_rows = (
-                    db.query(LotLog)
-                    .options(joinedload(LotLog.report))
-                    .filter(LotLog.report_id.in_(report_ids))
-                    .order_by(LotLog.report_id, LotLog.id)
-                    .distinct()
-                    .all()
-                )
-        except Exception as exc:
-            messagebox.showerror(
-                self._t("common.error", "錯誤"),
-                self._t("summaryQuery.loadFailed", "摘要查詢失敗：{error}").format(
-                    error=exc
-                ),
+        self._summary_query_filters = (start_date, end_date, shift_code, area_value)
+        self._summary_query_cursor = None
+        self._summary_query_loaded = 0
+        self._fetch_summary_query_page()
+
+    def _load_more_summary_query_records(self):
+        cursor = getattr(self, "_summary_query_cursor", None)
+        if cursor is not None:
+            self._fetch_summary_query_page(cursor)
+
+    def _fetch_summary_query_page(self, cursor=None):
+        start_date, end_date, shift_code, area_value = self._summary_query_filters
+        appended = cursor is not None
+
+        def _fetch_records(db):
+            page = fetch_report_page(
+                db, start_date, end_date, shift_code, area_value, cursor=cursor
+            )
+            reports = page.rows
+            if not reports:
+                return reports, [], [], page.next_cursor
+            report_ids = [report.id for report in reports]
+            equipment_rows = (
+                db.query(EquipmentLog)
+                .options(joinedload(EquipmentLog.report))
+                .filter(EquipmentLog.report_id.in_(report_ids))
+                .order_by(EquipmentLog.report_id, EquipmentLog.id)
+                .distinct()
+                .all()
             )
+            lot_rows = (
+                db.query(LotLog)
+                .options(joinedload(LotLog.report))
+                .filter(LotLog.report_id.in_(report_ids))
+                .order_by(LotLog.report_id, LotLog.id)
+                .distinct()
+                .all()
+            )
+            return reports, equipment_rows, lot_rows, page.next_cursor
+
+        def _fetch(db):
+            options = self._query_shift_area_options(db)
+            reports, equipment_rows, lot_rows, next_cursor = query_cache.fetch(
+                ("summary_query", start_date, end_date, shift_code, area_value)
+                + (cursor,),
+                REPORT_LOG_TABLES,
+                lambda: _fetch_records(db),
+            )
+            return reports, equipment_rows, lot_rows, options, next_cursor, appended
+
+        self._submit_query(
+            "summary_query",
+            _fetch,
+            self._render_summary_query_records,
+            on_error=self._on_summary_query_error,
+            busy_widget=self.summary_query_tree,
+        )
+
+    def _on_summary_query_error(self, exc):
+        messagebox.showerror(
+            self._t("common.error", "錯誤"),
+            self._t("summaryQuery.loadFailed", "摘要查詢失敗：{error}").format(
+                error=exc
+            ),
+        )
+
+    def _render_summary_query_records(self, result):
+        if not self.summary_query_tree.winfo_exists():
+            return
+        reports, equipment_rows, lot_rows, (shifts, areas), next_cursor, appended = (
+            result
+        )
+        self._summary_query_cursor = next_cursor
+        self._summary_query_loaded += len(reports)
+        self._update_load_more_bar(
+            getattr(self, "summary_query_more_bar", None),
+            self._summary_query_loaded,
+            next_cursor is not None,
+        )
+        if not reports:
+            if not appended:
+                messagebox.showinfo(
+                    self._t("common.info", "資訊"),
+                    self._t("common.emptyData", "查無資料"),
+                )
             return
+        self._apply_shift_area_options(shifts, areas)
+        self._build_shift_display_options()
 
         equipment_by_report = defaultdict(list)
         seen_equipment_ids = set()
@@ -5145,7 +5835,7 @@ class ModernMainFrame:
                 lot_by_report[row.report_id].append(row)
 
         for report in reports:
-            shift_display = self._format_shift_display(report.shift)
+            shift_display = self.shift_display_map.get(report.shift, report.shift)
             base_values = {
                 "date": report.date.strftime("%Y-%m-%d"),
                 "shift": shift_display,
@@ -5279,6 +5969,7 @@ class ModernMainFrame:
             return
         try:
             with SessionLocal() as db:
+                hidden_keys = set()
                 for item_id in selections:
                     meta = self._parse_summary_query_item_id(item_id)
                     if not meta:
@@ -5305,6 +5996,9 @@ class ModernMainFrame:
                                 else ""
                             )
                             report.last_modified_at = datetime.now()
+                            hidden_keys.add((report.date, report.shift, report.area))
+                db.flush()
+                refresh_attendance_rollup(db, hidden_keys)
                 db.commit()
             self._load_summary_query_records()
         except Exception as exc:
@@ -5500,6 +6194,7 @@ class ModernMainFrame:
         if hasattr(self, "delay_tree"):
             self._clear_tree(self.delay_tree)
         self.delay_pending_records = []
+        self._pending_imports.pop(DELAY, None)
         self._delay_pending_seq = 0
 
     def _ensure_delay_pending_ids(self):
@@ -5530,6 +6225,7 @@ class ModernMainFrame:
         if hasattr(self, "summary_tree"):
             self._clear_tree(self.summary_tree)
         self.summary_pending_records = []
+        self._pending_imports.pop(SUMMARY_ACTUAL, None)
         self._summary_pending_seq = 0
 
     def _ensure_summary_pending_ids(self):
@@ -5702,21 +6398,31 @@ class ModernMainFrame:
             )
             return
 
-        try:
-            with SessionLocal() as db:
-                query = db.query(SummaryActualEntry)
-                if start_date:
-                    query = query.filter(SummaryActualEntry.summary_date >= start_date)
-                if end_date:
-                    query = query.filter(SummaryActualEntry.summary_date <= end_date)
-                rows = query.order_by(
-                    SummaryActualEntry.summary_date,
-                    SummaryActualEntry.id,
-                ).all()
-        except Exception as exc:
-            messagebox.showerror(self._t("common.error", "錯誤"), f"{exc}")
+        def _fetch(db):
+            query = db.query(SummaryActualEntry)
+            if start_date:
+                query = query.filter(SummaryActualEntry.summary_date >= start_date)
+            if end_date:
+                query = query.filter(SummaryActualEntry.summary_date <= end_date)
+            return query.order_by(
+                SummaryActualEntry.summary_date,
+                SummaryActualEntry.id,
+            ).all()
+
+        self._submit_query(
+            "summary_actual",
+            _fetch,
+            self._render_summary_actual_rows,
+            on_error=self._show_query_error,
+            busy_widget=self.summary_tree,
+        )
+
+    def _show_query_error(self, exc):
+        messagebox.showerror(self._t("common.error", "錯誤"), f"{exc}")
+
+    def _render_summary_actual_rows(self, rows):
+        if not self.summary_tree.winfo_exists() or self.summary_pending_records:
             return
-
         if not rows:
             messagebox.showinfo(
                 self._t("common.info", "資訊"),
@@ -5843,7 +6549,10 @@ class ModernMainFrame:
                             self._t("common.selectRow", "??????"),
                         )
                         return
+                    edited_dates = {row.delay_date}
                     setattr(row, field_name, parsed_value)
+                    edited_dates.add(row.delay_date)
+                    supersede_imports(db, DELAY, edited_dates)
                     db.commit()
             except Exception as exc:
                 messagebox.showerror(self._t("common.error", "??"), f"{exc}")
@@ -5913,9 +6622,16 @@ class ModernMainFrame:
         if db_ids:
             try:
                 with SessionLocal() as db:
+                    deleted_dates = [
+                        day
+                        for (day,) in db.query(SummaryActualEntry.summary_date)
+                        .filter(SummaryActualEntry.id.in_(db_ids))
+                        .distinct()
+                    ]
                     db.query(SummaryActualEntry).filter(
                         SummaryActualEntry.id.in_(db_ids)
                     ).delete(synchronize_session=False)
+                    supersede_imports(db, SUMMARY_ACTUAL, deleted_dates)
                     db.commit()
             except Exception as exc:
                 messagebox.showerror(self._t("common.error", "Error"), f"{exc}")
@@ -5955,17 +6671,25 @@ class ModernMainFrame:
         if db_ids:
             try:
                 with SessionLocal() as db:
+                    deleted_dates = [
+                        day
+                        for (day,) in db.query(DelayEntry.delay_date)
+                        .filter(DelayEntry.id.in_(db_ids))
+                        .distinct()
+                    ]
                     db.query(DelayEntry).filter(DelayEntry.id.in_(db_ids)).delete(
                         synchronize_session=False
                     )
+                    supersede_imports(db, DELAY, deleted_dates)
                     db.commit()
             except Exception as exc:
                 messagebox.showerror(self._t("common.error", "??"), f"{exc}")
                 return
         self._load_delay_entries()
 
-    def _render_delay_rows(self, rows, pending=False):
-        self._clear_tree(self.delay_tree)
+    def _render_delay_rows(self, rows, pending=False, append=False):
+        if not append:
+            self._clear_tree(self.delay_tree)
         if pending:
             self._ensure_delay_pending_ids()
 
@@ -6019,11 +6743,17 @@ class ModernMainFrame:
                     row.action,
                     row.note,
                 )
-            self.delay_tree.insert("", "end", values=values)
+            self.delay_tree.insert("", "end", iid=str(values[0]), values=values)
 
     def _load_delay_entries(self):
         if self.delay_pending_records:
             self._render_delay_rows(self.delay_pending_records, pending=True)
+            self._delay_cursor = None
+            self._update_load_more_bar(
+                getattr(self, "delay_more_bar", None),
+                len(self.delay_pending_records),
+                False,
+            )
             return
         start = self.delay_start_var.get().strip()
         end = self.delay_end_var.get().strip()
@@ -6039,24 +6769,44 @@ class ModernMainFrame:
                 self._t("errors.invalidDateFormat", "日期格式需為 YYYY-MM-DD"),
             )
             return
-        try:
-            with SessionLocal() as db:
-                query = db.query(DelayEntry)
-                if start_date:
-                    query = query.filter(DelayEntry.delay_date >= start_date)
-                if end_date:
-                    query = query.filter(DelayEntry.delay_date <= end_date)
-                rows = query.order_by(
-                    DelayEntry.delay_date,
-                    DelayEntry.reactor,
-                    DelayEntry.process,
-                    DelayEntry.lot,
-                    DelayEntry.id,
-                ).all()
-        except Exception as exc:
-            messagebox.showerror(self._t("common.error", "錯誤"), f"{exc}")
+        self._delay_filters = (start_date, end_date)
+        self._delay_cursor = None
+        self._delay_loaded = 0
+        self._fetch_delay_page()
+
+    def _load_more_delay_entries(self):
+        cursor = getattr(self, "_delay_cursor", None)
+        if cursor is not None and not self.delay_pending_records:
+            self._fetch_delay_page(cursor)
+
+    def _fetch_delay_page(self, cursor=None):
+        start_date, end_date = self._delay_filters
+
+        def _fetch(db):
+            page = fetch_delay_page(db, start_date, end_date, cursor=cursor)
+            return page, cursor is not None
+
+        self._submit_query(
+            "delay_entries",
+            _fetch,
+            self._render_saved_delay_rows,
+            on_error=self._show_query_error,
+            busy_widget=getattr(self, "delay_tree", None),
+        )
+
+    def _render_saved_delay_rows(self, result):
+        delay_tree = getattr(self, "delay_tree", None)
+        if self.delay_pending_records or not delay_tree or not delay_tree.winfo_exists():
             return
-        self._render_delay_rows(rows, pending=False)
+        page, appended = result
+        self._render_delay_rows(page.rows, pending=False, append=appended)
+        self._delay_cursor = page.next_cursor
+        self._delay_loaded += len(page.rows)
+        self._update_load_more_bar(
+            getattr(self, "delay_more_bar", None),
+            self._delay_loaded,
+            page.next_cursor is not None,
+        )
 
     def _import_delay_excel(self):
         path = filedialog.askopenfilename(
@@ -6069,11 +6819,9 @@ class ModernMainFrame:
         if not path:
             return
         try:
-            ext = os.path.splitext(path)[1].lower()
-            xls = None
             sheet_name = None
-            if ext not in (".csv", ".txt"):
-                xls, sheet_name = open_excel_workbook(
+            if os.path.splitext(path)[1].lower() not in CSV_EXTENSIONS:
+                sheet_name = select_excel_sheet(
                     path,
                     parent=self.parent,
                     title=self._t("navigation.delayList", "延遲清單"),
@@ -6081,83 +6829,28 @@ class ModernMainFrame:
                     ok_label=self._t("common.ok", "確定"),
                     theme=self.COLORS,
                 )
-            df = read_table(path, header=1, xls=xls, sheet_name=sheet_name)
         except Exception as exc:
             messagebox.showerror(self._t("common.error", "錯誤"), f"{exc}")
             return
 
-        def find_col(match):
-            for col in df.columns:
-                c = str(col).lower()
-                if match in c:
-                    return col
-            return None
-
-        col_map = {
-            "date": find_col("date"),
-            "time": find_col("time"),
-            "reactor": find_col("reactor"),
-            "process": find_col("process"),
-            "lot": find_col("lot"),
-            "wafer": find_col("wafer"),
-            "progress": find_col("progress"),
-            "prev_steps": find_col("previous"),
-            "prev_time": find_col("prev"),
-            "severity": find_col("severity") or find_col("caution"),
-            "action": find_col("action") or find_col("対処"),
-            "note": find_col("note") or find_col("備考"),
-        }
-
-        records = []
-        for _, row in df.iterrows():
-            raw_date = row.get(col_map["date"]) if col_map["date"] else None
-            parsed_date = (
-                pd.to_datetime(raw_date, errors="coerce").date()
-                if pd.notna(raw_date)
-                else None
-            )
-            if not parsed_date:
-                continue
-
-            def sval(key):
-                col = col_map.get(key)
-                if col is None:
-                    return ""
-                val = row.get(col)
-                if pd.isna(val):
-                    return ""
-                return str(val).strip()
-
-            records.append(
-                {
-                    "delay_date": parsed_date,
-                    "time_range": sval("time"),
-                    "reactor": sval("reactor"),
-                    "process": sval("process"),
-                    "lot": sval("lot"),
-                    "wafer": sval("wafer"),
-                    "progress": sval("progress"),
-                    "prev_steps": sval("prev_steps"),
-                    "prev_time": sval("prev_time"),
-                    "severity": sval("severity"),
-                    "action": sval("action"),
-                    "note": sval("note"),
-                }
-            )
+        self._import_file(DELAY, path, sheet_name)
 
+    def _finish_delay_import(self, records, notice="", sources=()):
         if not records:
             messagebox.showinfo(
-                self._t("common.info", "資訊"), self._t("common.emptyData", "查無資料")
+                self._t("common.info", "資訊"),
+                notice + self._t("common.emptyData", "查無資料"),
             )
             return
 
         self.delay_pending_records = records
         self._delay_pending_seq = 0
+        self._stage_import_sources(DELAY, records, sources)
         self._ensure_delay_pending_ids()
-        self._render_delay_rows(self.delay_pending_records, pending=True)
+        self._load_delay_entries()
         messagebox.showinfo(
             self._t("common.info", "資訊"),
-            self._t("delay.importPending", "匯入完成，請確認後再點上傳"),
+            notice + self._t("delay.importPending", "匯入完成，請確認後再點上傳"),
         )
 
     def _upload_delay_pending(self):
@@ -6166,25 +6859,32 @@ class ModernMainFrame:
                 self._t("common.info", "資訊"), self._t("common.emptyData", "查無資料")
             )
             return
-        try:
-            with SessionLocal() as db:
-                unique_dates = {rec["delay_date"] for rec in self.delay_pending_records}
-                if unique_dates:
-                    db.query(DelayEntry).filter(
-                        DelayEntry.delay_date.in_(unique_dates)
-                    ).delete(synchronize_session=False)
-                for rec in self.delay_pending_records:
-                    payload = {k: v for k, v in rec.items() if not k.startswith("_")}
-                    db.add(DelayEntry(**payload))
-                db.commit()
+        self._upload_pending(
+            DELAY,
+            self.delay_pending_records,
+            lambda db, rows, progress: upsert_delay_entries(
+                db, rows, progress=progress
+            ),
+            self._delay_uploaded,
+        )
+
+    def _delay_uploaded(self, result, fingerprint):
+        # 上傳期間修改過的暫存資料保留，讓使用者再次上傳
+        if pending_fingerprint(self.delay_pending_records) == fingerprint:
             self.delay_pending_records = []
-            self._load_delay_entries()
-            messagebox.showinfo(
-                self._t("common.success", "成功"),
-                self._t("common.uploadSuccess", "上傳成功"),
-            )
-        except Exception as exc:
-            messagebox.showerror(self._t("common.error", "錯誤"), f"{exc}")
+        self._load_delay_entries()
+        counts = self._t(
+            "delay.upsertResult", "新增 {inserted} 筆，更新 {updated} 筆，未變更 {unchanged} 筆"
+        ).format(**result._asdict())
+        if result.duplicates:
+            counts += "\n" + self._t(
+                "delay.upsertDuplicates",
+                "另有 {duplicates} 筆與其他列的日期/機台/工程/批號/晶片重複，以最後一筆為準",
+            ).format(duplicates=result.duplicates)
+        messagebox.showinfo(
+            self._t("common.success", "成功"),
+            self._t("common.uploadSuccess", "上傳成功") + "\n" + counts,
+        )
 
     def _import_summary_actual_excel(self):
         path = filedialog.askopenfilename(
@@ -6196,12 +6896,10 @@ class ModernMainFrame:
         )
         if not path:
             return
-        sheet_name = None
-        xls = None
-        ext = os.path.splitext(path)[1].lower()
         try:
-            if ext not in (".csv", ".txt"):
-                xls, sheet_name = open_excel_workbook(
+            sheet_name = None
+            if os.path.splitext(path)[1].lower() not in CSV_EXTENSIONS:
+                sheet_name = select_excel_sheet(
                     path,
                     parent=self.parent,
                     title=self._t("navigation.summaryActual", "Summary Actual"),
@@ -6210,112 +6908,27 @@ class ModernMainFrame:
                     theme=self.COLORS,
                     preferred_sheet="Summary(Actual)",
                 )
-            raw_sheet = read_table(path, header=None, xls=xls, sheet_name=sheet_name)
         except Exception as exc:
             messagebox.showerror(self._t("common.error", "錯誤"), f"{exc}")
             return
-        summary_date = None
-        if len(raw_sheet) > 1:
-            for val in raw_sheet.iloc[1].dropna().tolist():
-                parsed = pd.to_datetime(val, errors="coerce")
-                if pd.isna(parsed):
-                    continue
-                summary_date = parsed.date()
-                break
-        if not summary_date:
-            messagebox.showerror(
-                self._t("common.error", "錯誤"),
-                self._t("errors.invalidDateFormat", "日期格式需為 YYYY-MM-DD"),
-            )
-            return
 
-        try:
-            df = read_table(path, header=2, xls=xls, sheet_name=sheet_name)
-        except Exception as exc:
-            messagebox.showerror(self._t("common.error", "錯誤"), f"{exc}")
-            return
-
-        def norm(col):
-            return str(col).strip().lower().replace(" ", "").replace("_", "")
-
-        col_lookup = {norm(c): c for c in df.columns}
-
-        def get_col(key):
-            return col_lookup.get(key, None)
-
-        def get_val(row, key):
-            col = get_col(key)
-            if col is None:
-                return 0
-            val = row.get(col)
-            if pd.isna(val):
-                return 0
-            try:
-                return int(val)
-            except Exception:
-                try:
-                    return int(float(val))
-                except Exception:
-                    return 0
-
-        records = []
-        for _, row in df.iterrows():
-            label_val = ""
-            if len(df.columns) > 2:
-                part_b = row.get(df.columns[1])
-                part_c = row.get(df.columns[2])
-                label_val = f"{'' if pd.isna(part_b) else str(part_b).strip()} {'' if pd.isna(part_c) else str(part_c).strip()}".strip()
-            if not label_val:
-                continue
-            plan = get_val(row, "plan")
-            completed = get_val(row, "completed")
-            in_process = get_val(row, "inprocess")
-            on_track = get_val(row, "ontrack")
-            at_risk = get_val(row, "atrisk")
-            delayed = get_val(row, "delayed")
-            no_data = get_val(row, "nodata")
-            scrapped = get_val(row, "scrapped")
-            if all(
-                val == 0
-                for val in (
-                    plan,
-                    completed,
-                    in_process,
-                    on_track,
-                    at_risk,
-                    delayed,
-                    no_data,
-                    scrapped,
-                )
-            ):
-                continue
-            records.append(
-                {
-                    "summary_date": summary_date,
-                    "label": label_val,
-                    "plan": plan,
-                    "completed": completed,
-                    "in_process": in_process,
-                    "on_track": on_track,
-                    "at_risk": at_risk,
-                    "delayed": delayed,
-                    "no_data": no_data,
-                    "scrapped": scrapped,
-                }
-            )
+        self._import_file(SUMMARY_ACTUAL, path, sheet_name)
 
+    def _finish_summary_import(self, records, notice="", sources=()):
         if not records:
             messagebox.showinfo(
-                self._t("common.info", "資訊"), self._t("common.emptyData", "查無資料")
+                self._t("common.info", "資訊"),
+                notice + self._t("common.emptyData", "查無資料"),
             )
             return
         self.summary_pending_records = records
         self._summary_pending_seq = 0
+        self._stage_import_sources(SUMMARY_ACTUAL, records, sources)
         self._ensure_summary_pending_ids()
         self._load_summary_actual()
         messagebox.showinfo(
             self._t("common.info", "資訊"),
-            self._t("summaryActual.importPending", "匯入完成，請確認後再點上傳"),
+            notice + self._t("summaryActual.importPending", "匯入完成，請確認後再點上傳"),
         )
 
     def _upload_summary_pending(self):
@@ -6324,28 +6937,24 @@ class ModernMainFrame:
                 self._t("common.info", "資訊"), self._t("common.emptyData", "查無資料")
             )
             return
-        try:
-            with SessionLocal() as db:
-                unique_dates = {
-                    rec["summary_date"] for rec in self.summary_pending_records
-                }
-                if unique_dates:
-                    db.query(SummaryActualEntry).filter(
-                        SummaryActualEntry.summary_date.in_(unique_dates)
-                    ).delete(synchronize_session=False)
-                for rec in self.summary_pending_records:
-                    payload = {k: v for k, v in rec.items() if not k.startswith("_")}
-                    db.add(SummaryActualEntry(**payload))
-                db.commit()
+        self._upload_pending(
+            SUMMARY_ACTUAL,
+            self.summary_pending_records,
+            lambda db, rows, progress: replace_summary_actual_entries(
+                db, rows, progress=progress
+            ),
+            self._summary_uploaded,
+        )
+
+    def _summary_uploaded(self, _result, fingerprint):
+        if pending_fingerprint(self.summary_pending_records) == fingerprint:
             self.summary_pending_records = []
             self._summary_pending_seq = 0
-            self._load_summary_actual()
-            messagebox.showinfo(
-                self._t("common.success", "成功"),
-                self._t("common.uploadSuccess", "上傳成功"),
-            )
-        except Exception as exc:
-            messagebox.showerror(self._t("common.error", "錯誤"), f"{exc}")
+        self._load_summary_actual()
+        messagebox.showinfo(
+            self._t("common.success", "成功"),
+            self._t("common.uploadSuccess", "上傳成功"),
+        )
 
     def _edit_summary_dialog(self):
         sel = self.summary_tree.selection()
@@ -6469,6 +7078,7 @@ class ModernMainFrame:
                                 self._t("common.selectRow", "請先選擇一列"),
                             )
                             return
+                        edited_dates = {row.summary_date}
                         try:
                             row.summary_date = datetime.strptime(
                                 vars_map["date"].get().strip(), "%Y-%m-%d"
@@ -6499,6 +7109,8 @@ class ModernMainFrame:
                                 )
                             except Exception:
                                 setattr(row, attr, 0)
+                        edited_dates.add(row.summary_date)
+                        supersede_imports(db, SUMMARY_ACTUAL, edited_dates)
                         db.commit()
                     self._load_summary_actual()
                 dlg.destroy()
@@ -0,0 +1,295 @@
+"""Persistent matplotlib charts for the summary dashboard.
+
+Each chart builds its figure, axes and artists once; later updates only
+change data, labels and colors.  Value labels come from a pool that is
+reused across updates, so the number of artists stops growing once the
+longest series has been shown.  Figures are drawn offscreen by the Agg
+canvas when ``to_png()`` is called (see ``frontend.src.utils.chart_images``),
+at the pixel size the dashboard currently gives the chart.
+
+At most ``MAX_TICK_LABELS`` x labels and ``MAX_VALUE_LABELS`` points with
+value labels are shown, evenly spaced, so text layout (the bulk of a draw)
+does not grow with the series length.
+"""
+
+import abc
+import io
+
+from matplotlib import rcParams
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
+
+# Fixed margins instead of tight_layout, which re-measures every text per call
+CHART_MARGINS = {"left": 0.14, "right": 0.97, "top": 0.9, "bottom": 0.32}
+BAR_WIDTH = 0.8
+MAX_TICK_LABELS = 16
+MAX_VALUE_LABELS = 16
+CJK_FONT_CANDIDATES = [
+    "Noto Sans CJK TC",
+    "Noto Sans CJK JP",
+    "Noto Sans CJK SC",
+    "Noto Sans TC",
+    "Noto Sans JP",
+    "Microsoft YaHei",
+    "PingFang TC",
+    "PingFang SC",
+    "Heiti TC",
+    "Hiragino Sans",
+    "Yu Gothic",
+    "MS Gothic",
+    "IPAexGothic",
+    "IPAGothic",
+    "SimHei",
+    "Arial Unicode MS",
+]
+
+
+def use_cjk_fonts():
+    """Prefer fonts that cover Chinese/Japanese labels, falling back to DejaVu."""
+    rcParams["font.family"] = "sans-serif"
+    rcParams["font.sans-serif"] = CJK_FONT_CANDIDATES + ["DejaVu Sans"]
+    rcParams["axes.unicode_minus"] = False
+
+
+def label_positions(count, limit):
+    """Evenly spaced indexes of at most ``limit`` of ``count`` points."""
+    step = max(1, -(-count // limit))
+    return range(0, count, step)
+
+
+class _TextPool:
+    """Reusable text artists; ``take(n)`` returns n visible ones."""
+
+    def __init__(self, create):
+        self._create = create
+        self._items = []
+
+    def __len__(self):
+        return len(self._items)
+
+    def take(self, count):
+        while len(self._items) < count:
+            self._items.append(self._create())
+        for idx, item in enumerate(self._items):
+            item.set_visible(idx < count)
+        return self._items[:count]
+
+    def set_color(self, color):
+        for item in self._items:
+            item.set_color(color)
+
+
+class SummaryChart(abc.ABC):
+    """Figure, axes and Agg canvas reused for every image of one chart."""
+
+    FIGSIZE = (4.6, 3.2)
+    DPI = 100
+
+    def __init__(self):
+        self.figure = Figure(figsize=self.FIGSIZE, dpi=self.DPI)
+        self.figure.subplots_adjust(**CHART_MARGINS)
+        self.ax = self.figure.add_subplot(111)
+        self.canvas = FigureCanvasAgg(self.figure)
+        self._empty_text = self.ax.text(
+            0.5, 0.5, "", ha="center", va="center", transform=self.ax.transAxes
+        )
+        self._theme = None
+        self._build()
+
+    @abc.abstractmethod
+    def _build(self):
+        """Create the chart's artists once; updates only change their data."""
+
+    def _series_artists(self):
+        return []
+
+    def _apply_series_colors(self, theme):
+        pass
+
+    def apply_theme(self, theme):
+        if theme == self._theme:
+            return
+        self._theme = dict(theme)
+        ax = self.ax
+        self.figure.patch.set_facecolor(theme["face"])
+        ax.set_facecolor(theme["face"])
+        ax.tick_params(axis="x", colors=theme["text"])
+        ax.tick_params(axis="y", colors=theme["text"])
+        ax.title.set_color(theme["text"])
+        ax.xaxis.label.set_color(theme["text"])
+        ax.yaxis.label.set_color(theme["text"])
+        for spine in ax.spines.values():
+            spine.set_color(theme["grid"])
+        self._empty_text.set_color(theme["text"])
+        frame = self.legend.get_frame()
+        frame.set_facecolor(theme["face"])
+        frame.set_edgecolor(theme["grid"])
+        for text in self.legend.get_texts():
+            text.set_color(theme["text"])
+        self._apply_series_colors(theme)
+
+    def _set_axis_texts(self, texts, legend_labels):
+        self.ax.set_title(texts["title"])
+        self.ax.set_ylabel(texts["axis"])
+        self.ax.set_xlabel(texts.get("x_axis", ""))
+        for text, label in zip(self.legend.get_texts(), legend_labels):
+            text.set_text(label)
+
+    def _set_x_labels(self, labels):
+        count = len(labels)
+        ticks = label_positions(count, MAX_TICK_LABELS)
+        tick_labels = [labels[idx] for idx in ticks]
+        self.ax.set_xticks(ticks, tick_labels, rotation=45, ha="right")
+        self.ax.set_xlim(-0.5, count - 0.5 if count else 0.5)
+
+    def _show_series(self, visible, empty_text=""):
+        for artist in self._series_artists():
+            artist.set_visible(visible)
+        self.legend.set_visible(visible)
+        self._empty_text.set_text(empty_text)
+        self._empty_text.set_visible(not visible)
+        if not visible:
+            self.ax.set_xticks([])
+
+    def resize(self, size=None):
+        """Draw later images at ``size`` = (width, height) pixels, or FIGSIZE."""
+        if size is None:
+            self.figure.set_size_inches(self.FIGSIZE)
+        else:
+            # Agg truncates inches * dpi, so 460 / 100 * 100 would give 459 px
+            width, height = (value + 0.5 for value in size)
+            self.figure.set_size_inches(width / self.DPI, height / self.DPI)
+
+    def to_png(self):
+        """The current chart as PNG bytes, drawn with Agg."""
+        buffer = io.BytesIO()
+        self.figure.savefig(
+            buffer, format="png", facecolor=self.figure.get_facecolor()
+        )
+        return buffer.getvalue()
+
+
+class AttendanceRateChart(SummaryChart):
+    """Attendance rate per day as a line with a percentage label per point."""
+
+    FIGSIZE = (4.2, 3.2)
+
+    def _build(self):
+        (self.line,) = self.ax.plot([], [], marker="o")
+        self.ax.set_ylim(0, 100)
+        self.legend = self.ax.legend([self.line], [""], loc="upper right")
+        self.annotations = _TextPool(self._new_annotation)
+
+    def _new_annotation(self):
+        return self.ax.annotate(
+            "",
+            (0, 0),
+            textcoords="offset points",
+            xytext=(0, 6),
+            ha="center",
+            fontsize=8,
+            color=self._theme["text"] if self._theme else None,
+        )
+
+    def _series_artists(self):
+        return [self.line]
+
+    def _apply_series_colors(self, theme):
+        self.line.set_color(theme["line"])
+        self.legend.legend_handles[0].set_color(theme["line"])
+        self.annotations.set_color(theme["text"])
+
+    def update(self, labels, rates, theme, texts):
+        """``texts``: title, series, axis, empty (no-data message), x_axis."""
+        self.apply_theme(theme)
+        self._set_axis_texts(texts, [texts["series"]])
+        if not labels:
+            self.annotations.take(0)
+            self._show_series(False, texts["empty"])
+            return
+        self._show_series(True)
+        self.line.set_data(range(len(labels)), rates)
+        shown = label_positions(len(labels), MAX_VALUE_LABELS)
+        for idx, annotation in zip(shown, self.annotations.take(len(shown))):
+            annotation.xy = (idx, rates[idx])
+            annotation.set_text(f"{rates[idx]:.1f}%")
+        self._set_x_labels(labels)
+
+
+class AttendanceCountChart(SummaryChart):
+    """Regular and contract headcount per day as stacked bars."""
+
+    def _build(self):
+        self.regular_bars = []
+        self.contract_bars = []
+        handles = [Rectangle((0, 0), 1, 1), Rectangle((0, 0), 1, 1)]
+        self.legend = self.ax.legend(handles, ["", ""], loc="upper right")
+        self.value_labels = _TextPool(self._new_value_label)
+
+    def _new_value_label(self):
+        return self.ax.text(
+            0,
+            0,
+            "",
+            ha="center",
+            va="center",
+            fontsize=8,
+            color=self._theme["text"] if self._theme else None,
+        )
+
+    def _new_bar(self):
+        bar = Rectangle((0, 0), BAR_WIDTH, 0)
+        self.ax.add_patch(bar)
+        return bar
+
+    def _series_artists(self):
+        return self.regular_bars + self.contract_bars
+
+    def _apply_series_colors(self, theme):
+        colors = (theme["bar_primary"], theme["bar_accent"])
+        for bars, color in zip((self.regular_bars, self.contract_bars), colors):
+            for bar in bars:
+                bar.set_facecolor(color)
+        for handle, color in zip(self.legend.legend_handles, colors):
+            handle.set_facecolor(color)
+        self.value_labels.set_color(theme["text"])
+
+    def _ensure_bars(self, count):
+        colors = (self._theme["bar_primary"], self._theme["bar_accent"])
+        for bars, color in zip((self.regular_bars, self.contract_bars), colors):
+            while len(bars) < count:
+                bar = self._new_bar()
+                bar.set_facecolor(color)
+                bars.append(bar)
+
+    def update(self, labels, regular, contract, theme, texts):
+        """``texts``: title, regular, contract, axis, empty and x_axis."""
+        self.apply_theme(theme)
+        self._set_axis_texts(texts, [texts["regular"], texts["contract"]])
+        if not labels:
+            self.value_labels.take(0)
+            self._show_series(False, texts["empty"])
+            return
+        self._show_series(True)
+        count = len(labels)
+        self._ensure_bars(count)
+        for idx, (reg, con) in enumerate(zip(regular, contract)):
+            left = idx - BAR_WIDTH / 2
+            self.regular_bars[idx].set_bounds(left, 0, BAR_WIDTH, reg)
+            self.contract_bars[idx].set_bounds(left, reg, BAR_WIDTH, con)
+        values = []
+        for idx in label_positions(count, MAX_VALUE_LABELS):
+            reg, con = regular[idx], contract[idx]
+            if reg:
+                values.append((idx, reg / 2, reg))
+            if con:
+                values.append((idx, reg + con / 2, con))
+        for bar in self.regular_bars[count:] + self.contract_bars[count:]:
+            bar.set_visible(False)
+        for label, (x, y, value) in zip(self.value_labels.take(len(values)), values):
+            label.set_position((x, y))
+            label.set_text(f"{value}")
+        self._set_x_labels(labels)
+        top = max((reg + con for reg, con in zip(regular, contract)), default=0)
+        self.ax.set_ylim(0, top * 1.1 if top else 1)
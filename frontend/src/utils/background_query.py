@@ -0,0 +1,153 @@
+"""Run database reads on worker threads and deliver results back to Tk."""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from models import SessionLocal
+
+
+class BackgroundQueryRunner:
+    """Thread-pool query executor polled from the Tk event loop.
+
+    Every job belongs to a channel (one per page or table).  Submitting a new
+    job on a channel supersedes the previous one: a job that has not started
+    is skipped, a running SQLite statement is interrupted and a late result
+    is dropped.  Each job opens its own session; callbacks always run on the
+    Tk thread via ``after()``.
+    """
+
+    POLL_INTERVAL_MS = 50
+
+    def __init__(self, widget, session_factory=None, max_workers=2):
+        self._widget = widget
+        self._session_factory = session_factory or SessionLocal
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="db-query"
+        )
+        self._results = queue.Queue()
+        self._lock = threading.Lock()
+        self._generations = {}
+        self._running = {}
+        self._pending = 0
+        self._poll_id = None
+        self._closed = False
+
+    def submit(self, channel, fetch, on_success, on_error=None, on_done=None):
+        """Run ``fetch(session)`` in the pool and hand its result to ``on_success``.
+
+        ``on_error(exc)`` receives exceptions raised by ``fetch``; ``on_done()``
+        runs after either callback.  Callbacks are skipped when the job has
+        been superseded or cancelled.  Returns the job generation.
+        """
+        if self._closed:
+            return None
+        with self._lock:
+            generation = self._generations.get(channel, 0) + 1
+            self._generations[channel] = generation
+            self._interrupt_locked(channel)
+        self._pending += 1
+        self._executor.submit(
+            self._run, channel, generation, fetch, (on_success, on_error, on_done)
+        )
+        self._schedule_poll()
+        return generation
+
+    def cancel(self, channel):
+        """Drop the current job of ``channel`` without calling its callbacks."""
+        with self._lock:
+            self._generations[channel] = self._generations.get(channel, 0) + 1
+            self._interrupt_locked(channel)
+
+    def is_busy(self, channel):
+        with self._lock:
+            running = self._running.get(channel)
+            return running is not None and running[0] == self._generations.get(channel)
+
+    def shutdown(self):
+        if self._closed:
+            return
+        self._closed = True
+        with self._lock:
+            for channel in list(self._generations):
+                self._generations[channel] += 1
+                self._interrupt_locked(channel)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._poll_id is not None:
+            try:
+                self._widget.after_cancel(self._poll_id)
+            except Exception:
+                pass
+            self._poll_id = None
+
+    def _is_current(self, channel, generation):
+        return self._generations.get(channel) == generation
+
+    def _interrupt_locked(self, channel):
+        running = self._running.get(channel)
+        if running is None:
+            return
+        try:
+            running[1].interrupt()
+        except Exception:
+            pass
+
+    def _run(self, channel, generation, fetch, callbacks):
+        if not self._is_current(channel, generation):
+            self._results.put((channel, generation, False, None, callbacks))
+            return
+        try:
+            with self._session_factory() as session:
+                raw_connection = session.connection().connection.driver_connection
+                with self._lock:
+                    if self._is_current(channel, generation):
+                        self._running[channel] = (generation, raw_connection)
+                try:
+                    result = fetch(session)
+                finally:
+                    with self._lock:
+                        running = self._running.get(channel)
+                        if running is not None and running[0] == generation:
+                            del self._running[channel]
+            self._results.put((channel, generation, True, result, callbacks))
+        except Exception as exc:
+            self._results.put((channel, generation, False, exc, callbacks))
+
+    def _schedule_poll(self):
+        if self._poll_id is not None or self._closed:
+            return
+        try:
+            self._poll_id = self._widget.after(self.POLL_INTERVAL_MS, self._poll)
+        except Exception:
+            self._poll_id = None
+
+    def _poll(self):
+        self._poll_id = None
+        while True:
+            try:
+                item = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._pending -= 1
+            self._deliver(*item)
+        if self._pending:
+            self._schedule_poll()
+
+    def _deliver(self, channel, generation, ok, payload, callbacks):
+        if self._closed:
+            return
+        with self._lock:
+            if not self._is_current(channel, generation):
+                return
+        on_success, on_error, on_done = callbacks
+        try:
+            if ok:
+                on_success(payload)
+            elif payload is not None:
+                if on_error is not None:
+                    on_error(payload)
+                else:
+                    print(f"背景查詢失敗 ({channel}): {payload}")
+        finally:
+            if on_done is not None:
+                on_done()
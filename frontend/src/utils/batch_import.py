@@ -0,0 +1,124 @@
+"""Parse a folder (or glob) of delay / Summary Actual files in parallel.
+
+Each file is parsed in its own worker process with the streaming parsers of
+``import_helpers``; the per-file results are merged into one record list so
+the whole batch can be uploaded in one transaction (delay rows are upserted
+on their natural key, Summary Actual rows replace the imported dates).
+Nothing here touches Tk, so scripts can use it headless.
+"""
+import glob
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from frontend.src.utils.import_helpers import (
+    CSV_EXTENSIONS,
+    STREAMING_EXCEL_EXTENSIONS,
+    iter_delay_records,
+    iter_sheet_rows,
+    iter_summary_actual_records,
+    select_excel_sheet,
+)
+
+DELAY = "delay"
+SUMMARY_ACTUAL = "summary_actual"
+IMPORT_EXTENSIONS = STREAMING_EXCEL_EXTENSIONS + (".xls",) + CSV_EXTENSIONS
+
+_PARSERS = {
+    DELAY: (iter_delay_records, None),
+    SUMMARY_ACTUAL: (iter_summary_actual_records, "Summary(Actual)"),
+}
+
+DATE_FIELDS = {DELAY: "delay_date", SUMMARY_ACTUAL: "summary_date"}
+
+# ``error`` is None when the file parsed; ``records`` is then the parsed rows
+FileResult = namedtuple("FileResult", ["path", "records", "error"])
+
+
+def find_import_files(source):
+    """Files to import from a folder or a glob pattern, sorted by name.
+
+    Office lock files (``~$name.xlsx``) are skipped.
+    """
+    if os.path.isdir(source):
+        paths = [os.path.join(source, name) for name in os.listdir(source)]
+    else:
+        paths = glob.glob(source)
+    return sorted(
+        path
+        for path in paths
+        if os.path.isfile(path)
+        and os.path.splitext(path)[1].lower() in IMPORT_EXTENSIONS
+        and not os.path.basename(path).startswith("~$")
+    )
+
+
+def import_sheet_name(kind, path):
+    """Sheet a batch import reads: the preferred sheet, else the first by name."""
+    if os.path.splitext(path)[1].lower() in CSV_EXTENSIONS:
+        return None
+    return select_excel_sheet(path, preferred_sheet=_PARSERS[kind][1])
+
+
+def parse_records(kind, rows):
+    """Records of ``kind`` parsed from sheet rows."""
+    return list(_PARSERS[kind][0](rows))
+
+
+def parse_import_file(kind, path):
+    """Parse one file; errors are returned in the result instead of raised."""
+    try:
+        records = parse_records(
+            kind, iter_sheet_rows(path, import_sheet_name(kind, path))
+        )
+    except Exception as exc:
+        return FileResult(path, [], exc)
+    return FileResult(path, records, None)
+
+
+def parse_import_files(kind, paths, *, max_workers=None, on_result=None):
+    """Parse ``paths`` across a process pool; results keep the order of ``paths``.
+
+    ``on_result(result, done, total)`` is called in the calling thread as each
+    file finishes and may raise to stop the batch (pending files are dropped).
+    A single file, or ``max_workers=1``, is parsed in-process.
+    """
+    paths = list(paths)
+    total = len(paths)
+    if max_workers is None:
+        max_workers = min(total, os.cpu_count() or 1)
+    results = {}
+    if total <= 1 or max_workers <= 1:
+        for path in paths:
+            results[path] = parse_import_file(kind, path)
+            if on_result is not None:
+                on_result(results[path], len(results), total)
+        return [results[path] for path in paths]
+
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {
+            executor.submit(parse_import_file, kind, path): path for path in paths
+        }
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                result = future.result()
+            except Exception as exc:
+                # e.g. a crashed worker or an exception that cannot be unpickled
+                result = FileResult(path, [], exc)
+            results[path] = result
+            if on_result is not None:
+                on_result(result, len(results), total)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    return [results[path] for path in paths]
+
+
+def merge_results(results):
+    """All records of the files that parsed, in file order."""
+    records = []
+    for result in results:
+        if result.error is None:
+            records.extend(result.records)
+    return records
@@ -0,0 +1,293 @@
+"""Summary chart images rendered offscreen and cached as PNG files.
+
+``ChartImageRenderer`` draws the summary dashboard charts with the Agg backend
+on one worker thread: matplotlib is not thread-safe, and a single thread can
+keep reusing the same figures.  Images are keyed by a hash of the series,
+texts, chart theme, language and pixel size and kept in ``ChartImageCache``,
+an in-memory LRU in front of PNG files on disk, so unchanged inputs are shown
+(or exported) without drawing again, also after a restart.
+"""
+
+import hashlib
+import json
+import os
+import queue
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Bump when the chart layout changes so stale images are not reused
+CACHE_FORMAT = 2
+# Image sizes follow the dashboard width in steps, so a window resize re-renders
+# only when a step is crossed and the cache keeps few sizes per series
+DEFAULT_CHART_SIZE = (460, 320)
+CHART_SIZE_STEP = 40
+MIN_CHART_WIDTH = 320
+
+
+def default_chart_cache_dir():
+    """Chart image directory; the packaged app keeps it in data/ next to the exe."""
+    if getattr(sys, "frozen", False):
+        app_root = Path(sys.executable).resolve().parent
+    else:
+        app_root = Path(__file__).resolve().parents[3]
+    return app_root / "data" / "chart_cache"
+
+
+def chart_image_size(width):
+    """``(width, height)`` of the image for a chart slot ``width`` pixels wide.
+
+    A slot that is not laid out yet (width 0 or 1) gets ``DEFAULT_CHART_SIZE``.
+    """
+    if width <= 1:
+        return DEFAULT_CHART_SIZE
+    width = max(MIN_CHART_WIDTH, width // CHART_SIZE_STEP * CHART_SIZE_STEP)
+    default_width, default_height = DEFAULT_CHART_SIZE
+    return width, round(width * default_height / default_width)
+
+
+def chart_image_key(kind, series, texts, theme, language, size=None):
+    """Hex digest identifying one chart image."""
+    payload = json.dumps(
+        [CACHE_FORMAT, kind, series, texts, theme, language, size],
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class ChartImageCache:
+    """PNG bytes by key: an LRU of ``max_entries`` over files in ``cache_dir``.
+
+    At most ``max_files`` images stay on disk; the least recently written are
+    removed first.  Disk errors only disable the disk layer for that call.
+    """
+
+    def __init__(self, cache_dir=None, max_entries=16, max_files=200):
+        self.cache_dir = Path(cache_dir) if cache_dir else default_chart_cache_dir()
+        self.max_entries = max_entries
+        self.max_files = max_files
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            png = self._entries.get(key)
+            if png is not None:
+                self._entries.move_to_end(key)
+                return png
+        try:
+            png = self.path_for(key).read_bytes()
+        except OSError:
+            return None
+        self._remember(key, png)
+        return png
+
+    def put(self, key, png):
+        self._remember(key, png)
+        path = self.path_for(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(png)
+            os.replace(tmp_path, path)
+            self._prune()
+        except OSError:
+            pass
+
+    def path(self, key):
+        """Path of the cached PNG file, or None when it is not on disk."""
+        path = self.path_for(key)
+        return path if path.is_file() else None
+
+    def path_for(self, key):
+        return self.cache_dir / f"{key}.png"
+
+    def _remember(self, key, png):
+        with self._lock:
+            self._entries[key] = png
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _prune(self):
+        files = list(self.cache_dir.glob("*.png"))
+        if len(files) <= self.max_files:
+            return
+        files.sort(key=lambda item: item.stat().st_mtime_ns)
+        for stale in files[: len(files) - self.max_files]:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+
+
+def summary_chart_requests(
+    labels,
+    rates,
+    regular,
+    contract,
+    rate_texts,
+    count_texts,
+    theme,
+    language,
+    size=None,
+):
+    """``{kind: (key, update kwargs)}`` for the summary dashboard charts.
+
+    ``size`` is the ``(width, height)`` of the images in pixels; the kwargs
+    carry it as ``size`` for ``ChartImageRenderer.render()``.
+    """
+    arguments = {
+        "rate": {"labels": labels, "rates": rates, "texts": rate_texts},
+        "count": {
+            "labels": labels,
+            "regular": regular,
+            "contract": contract,
+            "texts": count_texts,
+        },
+    }
+    requests = {}
+    for kind, kwargs in arguments.items():
+        series = {name: value for name, value in kwargs.items() if name != "texts"}
+        key = chart_image_key(kind, series, kwargs["texts"], theme, language, size)
+        requests[kind] = (key, dict(kwargs, theme=theme, size=size))
+    return requests
+
+
+class ChartImageRenderer:
+    """Render chart requests to cached PNGs on a worker thread.
+
+    ``show()`` delivers the images to ``on_ready`` on the Tk thread via
+    ``after()``; a newer ``show()`` supersedes a render still in progress.
+    ``render()`` draws on the calling thread (tests, scripts) and must not be
+    mixed with ``show()`` on the same renderer.
+    """
+
+    POLL_INTERVAL_MS = 50
+
+    def __init__(self, widget=None, cache=None):
+        self._widget = widget
+        self.cache = cache or ChartImageCache()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="chart-render"
+        )
+        self._results = queue.Queue()
+        self._charts = {}
+        self._generation = 0
+        self._pending = 0
+        self._poll_id = None
+        self._closed = False
+
+    def cached(self, requests):
+        """``{kind: png}`` when every requested image is cached, else None."""
+        images = {}
+        for kind, (key, _kwargs) in requests.items():
+            png = self.cache.get(key)
+            if png is None:
+                return None
+            images[kind] = png
+        return images
+
+    def show(self, requests, on_ready, on_error=None):
+        """Deliver ``{kind: png}``: at once when cached, else after rendering.
+
+        Returns True when ``on_ready`` already ran.
+        """
+        self._generation += 1
+        images = self.cached(requests)
+        if images is not None:
+            on_ready(images)
+            return True
+        if self._closed:
+            return False
+        self._pending += 1
+        generation = self._generation
+        future = self._executor.submit(self._render_current, generation, requests)
+        future.add_done_callback(
+            lambda done: self._results.put((generation, done, on_ready, on_error))
+        )
+        self._schedule_poll()
+        return False
+
+    def render(self, requests):
+        """Draw the images missing from the cache and store them; ``{kind: png}``."""
+        images = {}
+        for kind, (key, kwargs) in requests.items():
+            png = self.cache.get(key)
+            if png is None:
+                chart = self._chart(kind)
+                kwargs = dict(kwargs)
+                chart.resize(kwargs.pop("size", None))
+                chart.update(**kwargs)
+                png = chart.to_png()
+                self.cache.put(key, png)
+            images[kind] = png
+        return images
+
+    def _render_current(self, generation, requests):
+        # a render queued behind newer requests is not drawn at all
+        if generation != self._generation:
+            return None
+        return self.render(requests)
+
+    def shutdown(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._generation += 1
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._poll_id is not None:
+            try:
+                self._widget.after_cancel(self._poll_id)
+            except Exception:
+                pass
+            self._poll_id = None
+
+    def _chart(self, kind):
+        chart = self._charts.get(kind)
+        if chart is None:
+            # matplotlib is imported by the first render, on the worker thread
+            from frontend.src.components.summary_charts import (
+                AttendanceCountChart,
+                AttendanceRateChart,
+                use_cjk_fonts,
+            )
+
+            if not self._charts:
+                use_cjk_fonts()
+            chart_class = {"rate": AttendanceRateChart, "count": AttendanceCountChart}
+            chart = chart_class[kind]()
+            self._charts[kind] = chart
+        return chart
+
+    def _schedule_poll(self):
+        if self._poll_id is not None or self._closed or self._widget is None:
+            return
+        try:
+            self._poll_id = self._widget.after(self.POLL_INTERVAL_MS, self._poll)
+        except Exception:
+            self._poll_id = None
+
+    def _poll(self):
+        self._poll_id = None
+        while True:
+            try:
+                generation, future, on_ready, on_error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._pending -= 1
+            if self._closed or generation != self._generation or future.cancelled():
+                continue
+            exc = future.exception()
+            if exc is None:
+                on_ready(future.result())
+            elif on_error is not None:
+                on_error(exc)
+            else:
+                print(f"圖表繪製失敗: {exc}")
+        if self._pending:
+            self._schedule_poll()
@@ -3,6 +3,7 @@
 import tkinter as tk
 from tkinter import messagebox
 
+from frontend.src.utils.master_data_cache import master_data_cache
 from models import SessionLocal
 
 
@@ -70,6 +71,7 @@ def create_crud_manager(
                     return
                 db.add(model_class(name=name))
                 db.commit()
+            master_data_cache.invalidate()
             if name_var is not None:
                 name_var.set("")
             if update_btn is not None:
@@ -107,6 +109,7 @@ def create_crud_manager(
                     return
                 row.name = name
                 db.commit()
+            master_data_cache.invalidate()
             load_data_callback()
             _notify()
         except Exception as exc:
@@ -135,6 +138,7 @@ def create_crud_manager(
                     return
                 db.delete(row)
                 db.commit()
+            master_data_cache.invalidate()
             if name_var is not None:
                 name_var.set("")
             load_data_callback()
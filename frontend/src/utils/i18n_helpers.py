@@ -2,25 +2,45 @@
 
 
 class I18nRegistry:
+    """Translated widgets grouped as global or per page.
+
+    Page entries are kept per page id so cached pages can be re-translated
+    when they are shown again; ``apply`` only touches the active page.
+    """
+
     def __init__(self):
         self._global = []
-        self._page = []
+        self._pages = {}
+        self._active_page = None
 
     def register(self, widget, key, default, *, scope="global", translate=None):
         entry = {"widget": widget, "key": key, "default": default}
         if scope == "page":
-            self._page.append(entry)
+            self._pages.setdefault(self._active_page, []).append(entry)
         else:
             self._global.append(entry)
         if translate is not None:
             widget.config(text=translate(key, default))
         return entry
 
+    def set_active_page(self, page_id, translate=None):
+        """Switch the active page; re-translate its widgets if ``translate``."""
+        self._active_page = page_id
+        if translate is not None:
+            self._apply_entries(self._pages.get(page_id, []), translate)
+
     def apply(self, translate):
-        for entry in self._global + self._page:
+        self._apply_entries(
+            self._global + self._pages.get(self._active_page, []), translate
+        )
+
+    def clear_page(self, page_id=None):
+        """Forget the entries of ``page_id`` (default: the active page)."""
+        self._pages.pop(self._active_page if page_id is None else page_id, None)
+
+    @staticmethod
+    def _apply_entries(entries, translate):
+        for entry in entries:
             widget = entry["widget"]
             if widget.winfo_exists():
                 widget.config(text=translate(entry["key"], entry["default"]))
-
-    def clear_page(self):
-        self._page = []
@@ -1,8 +1,66 @@
-"""Helpers for Excel/CSV import flows."""
+"""Helpers for Excel/CSV import flows.
+
+Sheets are streamed row by row: ``.xlsx``/``.xlsm`` through openpyxl's
+read-only mode, CSV through the ``csv`` module.  The record parsers detect the
+header row (and the Summary Actual date) in the same single pass and yield
+typed records as they go, so a 50k-row export never exists as a DataFrame.
+Delay rows are converted column-wise in bounded chunks (``DELAY_CHUNK_ROWS``).
+"""
+import codecs
+import csv
+import math
+import numbers
 import os
+import re
 import tkinter as tk
+from datetime import date, datetime
 from tkinter import ttk
-import pandas as pd
+
+CSV_EXTENSIONS = (".csv", ".txt")
+STREAMING_EXCEL_EXTENSIONS = (".xlsx", ".xlsm")
+HEADER_SCAN_ROWS = 10
+CSV_SAMPLE_BYTES = 64 * 1024
+# MES exports come from Japanese and Taiwanese Windows hosts
+CSV_ENCODINGS = ("utf-8-sig", "cp932", "cp950")
+CSV_VERIFY_BYTES = 1024 * 1024
+_NON_ASCII = re.compile(rb"[\x80-\xff]")
+DELAY_CHUNK_ROWS = 20000
+
+DELAY_TEXT_FIELDS = (
+    "time_range",
+    "reactor",
+    "process",
+    "lot",
+    "wafer",
+    "progress",
+    "prev_steps",
+    "prev_time",
+    "severity",
+    "action",
+    "note",
+)
+SUMMARY_COUNT_FIELDS = (
+    ("plan", "plan"),
+    ("completed", "completed"),
+    ("in_process", "inprocess"),
+    ("on_track", "ontrack"),
+    ("at_risk", "atrisk"),
+    ("delayed", "delayed"),
+    ("no_data", "nodata"),
+    ("scrapped", "scrapped"),
+)
+
+_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%Y/%m/%d",
+    "%Y/%m/%d %H:%M:%S",
+    "%Y.%m.%d",
+    "%m/%d/%Y",
+)
+
+
+class MissingSummaryDateError(ValueError):
+    """The Summary Actual sheet has no date above its header row."""
 
 
 def _select_sheet_name(parent, title, sheet_names, default, label, ok_label, theme):
@@ -29,7 +87,25 @@ def _select_sheet_name(parent, title, sheet_names, default, label, ok_label, the
     return chosen["name"]
 
 
-def open_excel_workbook(
+def list_sheet_names(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext in CSV_EXTENSIONS:
+        return []
+    if ext in STREAMING_EXCEL_EXTENSIONS:
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(path, read_only=True)
+        try:
+            return list(workbook.sheetnames)
+        finally:
+            workbook.close()
+    import pandas as pd
+
+    with pd.ExcelFile(path) as xls:
+        return list(xls.sheet_names)
+
+
+def select_excel_sheet(
     path,
     *,
     parent=None,
@@ -39,8 +115,9 @@ def open_excel_workbook(
     theme=None,
     preferred_sheet=None,
 ):
-    xls = pd.ExcelFile(path)
-    sheet_names = sorted(xls.sheet_names, key=str.lower)
+    sheet_names = sorted(list_sheet_names(path), key=str.lower)
+    if not sheet_names:
+        return None
     sheet_name = preferred_sheet if preferred_sheet in sheet_names else sheet_names[0]
     if parent is not None and title and select_label:
         sheet_name = _select_sheet_name(
@@ -52,13 +129,449 @@ def open_excel_workbook(
             ok_label,
             theme,
         )
-    return xls, sheet_name
+    return sheet_name
 
 
 def read_table(path, header=None, *, xls=None, sheet_name=None):
+    import pandas as pd
+
     ext = os.path.splitext(path)[1].lower()
-    if ext in (".csv", ".txt"):
-        return pd.read_csv(path, header=header, sep=None, engine="python")
+    if ext in CSV_EXTENSIONS:
+        return _read_csv_table(path, header)
     if xls is None:
         xls = pd.ExcelFile(path)
     return pd.read_excel(xls, sheet_name=sheet_name, header=header)
+
+
+def _sniff_delimiter(sample):
+    # csv.Sniffer 對欄數不一致的報表標題列常判斷錯誤，改用出現次數最多的分隔符
+    counts = {delimiter: sample.count(delimiter) for delimiter in ",;\t|"}
+    delimiter = max(counts, key=counts.get)
+    return delimiter if counts[delimiter] else ","
+
+
+def _text_score(text):
+    """Plausibility of decoded text; Big5 misread as cp932 scores low.
+
+    Most Big5 lead bytes are half-width katakana in cp932, which real
+    exports rarely contain, and Japanese text has kana that Big5 lacks.
+    """
+    score = 0
+    for char in text:
+        code = ord(char)
+        if code < 0x80:
+            continue
+        if 0xFF61 <= code <= 0xFF9F or 0xE000 <= code <= 0xF8FF:
+            # half-width katakana, private use (Big5 EUDC)
+            score -= 4
+        elif 0x3040 <= code <= 0x30FF:
+            score += 2
+        elif 0x4E00 <= code <= 0x9FFF or 0x3000 <= code <= 0x303F:
+            score += 1
+        elif 0xFF01 <= code <= 0xFF60:
+            score += 1
+    return score
+
+
+def _strict_decode(sample, encoding, truncated):
+    try:
+        return sample.decode(encoding)
+    except UnicodeDecodeError as exc:
+        # the sample may end in the middle of a multi-byte character
+        if truncated and exc.start >= len(sample) - 3:
+            return sample[: exc.start].decode(encoding)
+        raise
+
+
+def _rank_encodings(sample, truncated):
+    """Candidate encodings for ``sample``, most plausible first.
+
+    UTF-8 validates itself, so it wins whenever it decodes; otherwise the
+    candidates that decode are ordered by ``_text_score``.
+    """
+    if sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return ["utf-16"]
+    scored = []
+    for order, encoding in enumerate(CSV_ENCODINGS):
+        try:
+            text = _strict_decode(sample, encoding, truncated)
+        except UnicodeDecodeError:
+            continue
+        if encoding == "utf-8-sig":
+            return [encoding] + [name for name in CSV_ENCODINGS if name != encoding]
+        scored.append((-_text_score(text), order, encoding))
+    if not scored:
+        return ["latin-1"]
+    ranked = [encoding for _score, _order, encoding in sorted(scored)]
+    return ranked + [name for name in CSV_ENCODINGS if name not in ranked]
+
+
+def _non_ascii_sample(path):
+    """``CSV_SAMPLE_BYTES`` from the line holding the first non-ASCII byte."""
+    offset = 0
+    with open(path, "rb") as handle:
+        while True:
+            block = handle.read(CSV_VERIFY_BYTES)
+            if not block:
+                return b""
+            match = _NON_ASCII.search(block)
+            if match:
+                line_start = block.rfind(b"\n", 0, match.start()) + 1
+                handle.seek(offset + line_start)
+                return handle.read(CSV_SAMPLE_BYTES)
+            offset += len(block)
+
+
+def _decodes_file(path, encoding):
+    decoder = codecs.getincrementaldecoder(encoding)()
+    try:
+        with open(path, "rb") as handle:
+            while True:
+                block = handle.read(CSV_VERIFY_BYTES)
+                decoder.decode(block, final=not block)
+                if not block:
+                    return True
+    except UnicodeDecodeError:
+        return False
+
+
+def _fallback_encoding(path, failed):
+    """First candidate other than ``failed`` that decodes the whole file."""
+    sample = _non_ascii_sample(path)
+    ranked = _rank_encodings(sample, len(sample) == CSV_SAMPLE_BYTES)
+    # latin-1 decodes anything; a partly garbled import is worse than an error
+    candidates = [name for name in ranked if name in CSV_ENCODINGS]
+    candidates += [name for name in CSV_ENCODINGS if name not in candidates]
+    for encoding in candidates:
+        if encoding != failed and _decodes_file(path, encoding):
+            return encoding
+    raise ValueError(f"無法判斷 CSV 檔案編碼: {os.path.basename(path)}")
+
+
+def sniff_csv_format(path):
+    """``(encoding, delimiter, width)`` of a CSV file from its first 64 KB.
+
+    ``width`` is the widest row in the sample, so ragged title rows can be
+    read by the C parser with explicit column names.  When the sample is
+    plain ASCII, the encoding is taken from the first non-ASCII line instead;
+    readers still fall back to another encoding on a later decode error.
+    """
+    with open(path, "rb") as handle:
+        sample = handle.read(CSV_SAMPLE_BYTES)
+    truncated = len(sample) == CSV_SAMPLE_BYTES
+    probe = sample
+    if truncated and not _NON_ASCII.search(sample):
+        probe = _non_ascii_sample(path) or sample
+    encoding = _rank_encodings(probe, len(probe) == CSV_SAMPLE_BYTES)[0]
+    try:
+        text = _strict_decode(sample, encoding, truncated)
+    except UnicodeDecodeError:
+        text = sample.decode(encoding, errors="replace")
+    delimiter = _sniff_delimiter(text)
+    lines = text.splitlines()
+    if truncated and len(lines) > 1:
+        lines = lines[:-1]
+    width = max((len(row) for row in csv.reader(lines, delimiter=delimiter)), default=0)
+    return encoding, delimiter, width
+
+
+def _read_csv_table(path, header=None):
+    import pandas as pd
+
+    encoding, delimiter, width = sniff_csv_format(path)
+    options = {"sep": delimiter, "dtype": str}
+    try:
+        return _read_csv_frame(pd, path, header, width, encoding, options)
+    except UnicodeDecodeError:
+        encoding = _fallback_encoding(path, encoding)
+        return _read_csv_frame(pd, path, header, width, encoding, options)
+
+
+def _read_csv_frame(pd, path, header, width, encoding, options):
+    try:
+        if header is None:
+            return pd.read_csv(
+                path,
+                header=None,
+                names=range(width),
+                engine="c",
+                encoding=encoding,
+                **options,
+            )
+        return pd.read_csv(
+            path, header=header, engine="c", encoding=encoding, **options
+        )
+    except pd.errors.ParserError:
+        # rows wider than anything in the sample
+        return pd.read_csv(
+            path, header=header, engine="python", encoding=encoding, **options
+        )
+
+
+def _iter_csv_rows(path):
+    encoding, delimiter, _width = sniff_csv_format(path)
+    yielded = 0
+    try:
+        with open(path, newline="", encoding=encoding) as handle:
+            for row in csv.reader(handle, delimiter=delimiter):
+                yield tuple(cell if cell != "" else None for cell in row)
+                yielded += 1
+        return
+    except UnicodeDecodeError:
+        encoding = _fallback_encoding(path, encoding)
+    # rows already yielded decoded the same way in every candidate encoding
+    with open(path, newline="", encoding=encoding) as handle:
+        for index, row in enumerate(csv.reader(handle, delimiter=delimiter)):
+            if index >= yielded:
+                yield tuple(cell if cell != "" else None for cell in row)
+
+
+def iter_sheet_rows(path, sheet_name=None):
+    """Yield every row of a sheet or CSV file as a tuple of cell values."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in CSV_EXTENSIONS:
+        yield from _iter_csv_rows(path)
+        return
+    if ext in STREAMING_EXCEL_EXTENSIONS:
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            sheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+            yield from sheet.iter_rows(values_only=True)
+        finally:
+            workbook.close()
+        return
+    # 舊版 .xls 無法用 openpyxl 串流讀取，改用 pandas
+    frame = read_table(path, header=None, sheet_name=sheet_name or 0)
+    for row in frame.itertuples(index=False, name=None):
+        yield tuple(None if _is_blank(value) else value for value in row)
+
+
+def estimate_sheet_rows(path, sheet_name=None):
+    """Row count from the sheet dimensions, or None when it is not cheap to know."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in STREAMING_EXCEL_EXTENSIONS:
+        return None
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True)
+    try:
+        sheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+        return sheet.max_row
+    finally:
+        workbook.close()
+
+
+def _is_blank(value):
+    if value is None:
+        return True
+    if isinstance(value, float) and math.isnan(value):
+        return True
+    return isinstance(value, str) and not value.strip()
+
+
+def cell_text(value):
+    if _is_blank(value):
+        return ""
+    return str(value).strip()
+
+
+def cell_int(value):
+    if _is_blank(value):
+        return 0
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        try:
+            return int(float(value))
+        except (TypeError, ValueError, OverflowError):
+            return 0
+
+
+def cell_date(value):
+    """Parse a cell into a ``date``; ``None`` when it is not a date."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if not isinstance(value, str) or not value.strip():
+        return None
+    text = value.strip()
+    try:
+        return datetime.fromisoformat(text).date()
+    except ValueError:
+        pass
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def _find_col(header, *matches):
+    """Index of the first column containing a match, trying ``matches`` in order."""
+    for match in matches:
+        for idx, name in enumerate(header):
+            if match in cell_text(name).lower():
+                return idx
+    return None
+
+
+def _is_delay_header(row):
+    cells = [cell_text(value).lower() for value in row]
+    has_date = any("date" in cell for cell in cells)
+    return has_date and any("reactor" in cell or "lot" in cell for cell in cells)
+
+
+def delay_column_map(header):
+    """Map delay fields to column indexes of ``header``."""
+    return {
+        "delay_date": _find_col(header, "date"),
+        "time_range": _find_col(header, "time"),
+        "reactor": _find_col(header, "reactor"),
+        "process": _find_col(header, "process"),
+        "lot": _find_col(header, "lot"),
+        "wafer": _find_col(header, "wafer"),
+        "progress": _find_col(header, "progress"),
+        "prev_steps": _find_col(header, "previous"),
+        "prev_time": _find_col(header, "prev"),
+        "severity": _find_col(header, "severity", "caution"),
+        "action": _find_col(header, "action", "対処"),
+        "note": _find_col(header, "note", "備考"),
+    }
+
+
+def _cell(row, idx):
+    if idx is None or idx >= len(row):
+        return None
+    return row[idx]
+
+
+def iter_delay_column_chunks(rows, chunk_rows=DELAY_CHUNK_ROWS):
+    """Yield delay data as column arrays, converting ``chunk_rows`` rows at a time.
+
+    Each chunk maps ``delay_date`` and every ``DELAY_TEXT_FIELDS`` name to a
+    list of equal length, ready for an ``executemany`` insert.  The header is
+    the first row (within ``HEADER_SCAN_ROWS``) naming a date column and a
+    reactor or lot column; rows without a date are dropped.
+    """
+    col_map = None
+    pending = []
+    for index, row in enumerate(rows):
+        if col_map is None:
+            if index >= HEADER_SCAN_ROWS:
+                return
+            if _is_delay_header(row):
+                col_map = delay_column_map(row)
+            continue
+        pending.append(row)
+        if len(pending) >= chunk_rows:
+            chunk = convert_delay_rows(pending, col_map)
+            pending = []
+            if chunk["delay_date"]:
+                yield chunk
+    if pending:
+        chunk = convert_delay_rows(pending, col_map)
+        if chunk["delay_date"]:
+            yield chunk
+
+
+def convert_delay_rows(rows, col_map):
+    """Vectorized conversion of raw delay rows into column arrays.
+
+    One ``to_datetime`` runs over the whole date column (number cells such as
+    Excel serials are not treated as dates; ``yyyymmdd`` text is), and every
+    text column is normalized column-wise.
+    """
+    import pandas as pd
+
+    frame = pd.DataFrame(rows, dtype=object)
+
+    def column(idx):
+        if idx is None or idx not in frame.columns:
+            return None
+        return frame[idx]
+
+    raw_dates = column(col_map["delay_date"])
+    if raw_dates is None:
+        return {field: [] for field in ("delay_date",) + DELAY_TEXT_FIELDS}
+    numeric = raw_dates.map(lambda value: isinstance(value, numbers.Number))
+    text_dates = raw_dates.mask(numeric)
+    # CSV cells are always text; "20240105" must not be read as a number
+    compact = text_dates.astype(str).str.fullmatch(r"\s*\d{8}\s*")
+    dates = pd.to_datetime(text_dates.mask(compact), errors="coerce", format="mixed")
+    compact_dates = pd.to_datetime(
+        text_dates.where(compact).str.strip(), errors="coerce", format="%Y%m%d"
+    )
+    dates = dates.mask(compact, compact_dates)
+    keep = dates.notna().to_numpy()
+    count = int(keep.sum())
+    columns = {"delay_date": dates[keep].dt.date.tolist()}
+    for field in DELAY_TEXT_FIELDS:
+        values = column(col_map[field])
+        if values is None:
+            columns[field] = [""] * count
+            continue
+        values = values[keep]
+        columns[field] = (
+            values.where(values.notna(), "").astype(str).str.strip().tolist()
+        )
+    return columns
+
+
+def delay_columns_to_records(columns):
+    fields = list(columns)
+    return [dict(zip(fields, values)) for values in zip(*columns.values())]
+
+
+def iter_delay_records(rows, chunk_rows=DELAY_CHUNK_ROWS):
+    """Yield delay records (dicts) from sheet rows, one converted chunk at a time."""
+    for chunk in iter_delay_column_chunks(rows, chunk_rows):
+        yield from delay_columns_to_records(chunk)
+
+
+def _normalize_header(value):
+    return cell_text(value).lower().replace(" ", "").replace("_", "")
+
+
+def iter_summary_actual_records(rows):
+    """Yield Summary Actual records from sheet rows.
+
+    The summary date is the first date in the last row above the header that
+    holds one; the header is the first row naming ``Plan`` and ``Completed``.
+    Rows without a label or with all counts zero are skipped.
+    """
+    summary_date = None
+    lookup = None
+    label_cols = ()
+    for index, row in enumerate(rows):
+        if lookup is None:
+            if index >= HEADER_SCAN_ROWS:
+                return
+            names = [_normalize_header(value) for value in row]
+            if "plan" in names and "completed" in names:
+                if summary_date is None:
+                    raise MissingSummaryDateError("summary date not found")
+                lookup = {}
+                for idx, name in enumerate(names):
+                    lookup.setdefault(name, idx)
+                label_cols = (1, 2) if len(row) > 2 else ()
+                continue
+            row_date = next(
+                (found for found in map(cell_date, row) if found is not None), None
+            )
+            if row_date is not None:
+                summary_date = row_date
+            continue
+        label = " ".join(cell_text(_cell(row, idx)) for idx in label_cols).strip()
+        if not label:
+            continue
+        counts = {
+            field: cell_int(_cell(row, lookup.get(key)))
+            for field, key in SUMMARY_COUNT_FIELDS
+        }
+        if not any(counts.values()):
+            continue
+        yield {"summary_date": summary_date, "label": label, **counts}
@@ -0,0 +1,194 @@
+"""Run file imports on worker threads with progress and cancellation."""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ImportCancelled(Exception):
+    """Raised inside a job once it has been cancelled."""
+
+
+class ImportJob:
+    """Handle passed to the job function for progress and cancellation checks."""
+
+    PROGRESS_EVERY = 500
+
+    def __init__(self, runner, channel, generation):
+        self._runner = runner
+        self.channel = channel
+        self.generation = generation
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def check(self):
+        if self._cancelled.is_set():
+            raise ImportCancelled()
+
+    def report(self, done, total=None):
+        """Queue a progress update; ``total`` is None when it is unknown."""
+        self.check()
+        self._runner._post(self, "progress", (done, total))
+
+    def track(self, items, total=None, every=None):
+        """Yield ``items``, reporting progress every ``every`` items."""
+        every = every or self.PROGRESS_EVERY
+        done = 0
+        for item in items:
+            yield item
+            done += 1
+            if done % every == 0:
+                self.report(done, total)
+        self.report(done, total)
+
+
+class ImportJobRunner:
+    """Single-slot-per-channel import executor polled from the Tk event loop.
+
+    ``start`` runs ``work(job)`` on a worker thread.  Progress updates and the
+    result are queued and delivered on the Tk thread via ``after()``: only the
+    latest progress per poll is delivered.  A cancelled job skips
+    ``on_success`` / ``on_error`` but still runs ``on_done``; a job superseded
+    by a newer one on the same channel runs no callbacks at all.
+    """
+
+    POLL_INTERVAL_MS = 50
+
+    def __init__(self, widget, max_workers=1):
+        self._widget = widget
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="import-job"
+        )
+        self._events = queue.Queue()
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._callbacks = {}
+        self._pending = 0
+        self._poll_id = None
+        self._closed = False
+
+    def start(
+        self, channel, work, on_success, on_error=None, on_progress=None, on_done=None
+    ):
+        if self._closed:
+            return None
+        with self._lock:
+            previous = self._jobs.get(channel)
+            generation = previous.generation + 1 if previous else 1
+            if previous is not None:
+                previous.cancel()
+            job = ImportJob(self, channel, generation)
+            self._jobs[channel] = job
+        self._callbacks[job] = (on_success, on_error, on_progress, on_done)
+        self._pending += 1
+        self._executor.submit(self._run, job, work)
+        self._schedule_poll()
+        return job
+
+    def cancel(self, channel):
+        """Cancel the running job of ``channel``; returns True if there was one."""
+        with self._lock:
+            job = self._jobs.get(channel)
+        if job is None or job.cancelled:
+            return False
+        job.cancel()
+        return True
+
+    def is_busy(self, channel):
+        with self._lock:
+            job = self._jobs.get(channel)
+        return job is not None and not job.cancelled
+
+    def shutdown(self):
+        if self._closed:
+            return
+        self._closed = True
+        with self._lock:
+            for job in self._jobs.values():
+                job.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._poll_id is not None:
+            try:
+                self._widget.after_cancel(self._poll_id)
+            except Exception:
+                pass
+            self._poll_id = None
+
+    def _post(self, job, kind, payload):
+        self._events.put((job, kind, payload))
+
+    def _run(self, job, work):
+        try:
+            job.check()
+            result = work(job)
+            job.check()
+            self._post(job, "result", result)
+        except ImportCancelled:
+            self._post(job, "cancelled", None)
+        except Exception as exc:
+            self._post(job, "error", exc)
+
+    def _schedule_poll(self):
+        if self._poll_id is not None or self._closed:
+            return
+        try:
+            self._poll_id = self._widget.after(self.POLL_INTERVAL_MS, self._poll)
+        except Exception:
+            self._poll_id = None
+
+    def _poll(self):
+        self._poll_id = None
+        latest_progress = {}
+        finished = []
+        while True:
+            try:
+                job, kind, payload = self._events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                latest_progress[job] = payload
+            else:
+                latest_progress.pop(job, None)
+                finished.append((job, kind, payload))
+        for job, progress in latest_progress.items():
+            self._deliver_progress(job, progress)
+        for job, kind, payload in finished:
+            self._pending -= 1
+            self._finish(job, kind, payload)
+        if self._pending:
+            self._schedule_poll()
+
+    def _deliver_progress(self, job, progress):
+        callbacks = self._callbacks.get(job)
+        if self._closed or job.cancelled or callbacks is None:
+            return
+        on_progress = callbacks[2]
+        if on_progress is not None:
+            on_progress(*progress)
+
+    def _finish(self, job, kind, payload):
+        on_success, on_error, _on_progress, on_done = self._callbacks.pop(job)
+        with self._lock:
+            current = self._jobs.get(job.channel) is job
+            if current:
+                del self._jobs[job.channel]
+        # A superseded job hands its channel (and its UI) to the newer job
+        if self._closed or not current:
+            return
+        try:
+            if kind == "result" and not job.cancelled:
+                on_success(payload)
+            elif kind == "error" and not job.cancelled:
+                if on_error is not None:
+                    on_error(payload)
+                else:
+                    print(f"匯入工作失敗 ({job.channel}): {payload}")
+        finally:
+            if on_done is not None:
+                on_done()
@@ -0,0 +1,114 @@
+"""Process-wide cache of the shift / area option names."""
+
+import sqlite3
+import threading
+
+from models import AreaOption, SessionLocal, ShiftOption
+
+
+class DataVersionWatch:
+    """``PRAGMA data_version`` of the database behind ``session_factory``.
+
+    Runs on a dedicated connection, so the value changes whenever any other
+    connection (pooled sessions in this process or another station) commits.
+    ``current()`` is None when there is no database file to watch.
+    """
+
+    def __init__(self, session_factory=None):
+        self._session_factory = session_factory or SessionLocal
+        self._lock = threading.Lock()
+        self._connection = None
+        self._failed = False
+
+    def current(self):
+        with self._lock:
+            if self._connection is None and not self._failed:
+                self._connection = self._connect()
+                self._failed = self._connection is None
+            if self._connection is None:
+                return None
+            try:
+                return self._connection.execute("PRAGMA data_version").fetchone()[0]
+            except sqlite3.Error:
+                return None
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self):
+        bind = getattr(self._session_factory, "kw", {}).get("bind")
+        database = getattr(getattr(bind, "url", None), "database", None)
+        if not database or database == ":memory:":
+            return None
+        try:
+            return sqlite3.connect(database, check_same_thread=False)
+        except sqlite3.Error:
+            return None
+
+
+def query_shift_area_options(db):
+    """Shift and area option names ordered by id, straight from the database."""
+    shifts = [opt.name for opt in db.query(ShiftOption).order_by(ShiftOption.id)]
+    areas = [opt.name for opt in db.query(AreaOption).order_by(AreaOption.id)]
+    return shifts, areas
+
+
+class MasterDataCache:
+    """Shift and area option names, re-read only after the database changed.
+
+    Edits made in this process call ``invalidate()``.  Edits from other
+    stations sharing the database file are noticed through ``DataVersionWatch``,
+    so a check is one pragma instead of two queries.  Any commit, not only one
+    to the option tables, triggers a reload.  Without a database file to watch
+    (e.g. ``:memory:``) only ``invalidate()`` refreshes the cache.
+    """
+
+    def __init__(self, session_factory=None):
+        self._session_factory = session_factory or SessionLocal
+        self._lock = threading.Lock()
+        self._options = None
+        self._version = None
+        self._generation = 0
+        self._watch = DataVersionWatch(self._session_factory)
+        self.hits = 0
+        self.loads = 0
+
+    def get(self, db=None):
+        """``(shifts, areas)`` lists; ``db`` is used when a reload is needed."""
+        with self._lock:
+            version = self._watch.current()
+            if self._options is not None and version == self._version:
+                self.hits += 1
+                return self._copy(self._options)
+            generation = self._generation
+        if db is None:
+            with self._session_factory() as session:
+                options = query_shift_area_options(session)
+        else:
+            options = query_shift_area_options(db)
+        with self._lock:
+            self.loads += 1
+            # an invalidate() during the reload means these rows may be stale
+            if generation == self._generation:
+                self._options = options
+                self._version = version
+        return self._copy(options)
+
+    def invalidate(self):
+        with self._lock:
+            self._options = None
+            self._generation += 1
+
+    def close(self):
+        self._watch.close()
+
+    @staticmethod
+    def _copy(options):
+        shifts, areas = options
+        return list(shifts), list(areas)
+
+
+master_data_cache = MasterDataCache()
@@ -0,0 +1,86 @@
+"""LRU cache of built page frames for the main window."""
+
+from collections import OrderedDict
+from tkinter import ttk
+
+
+def estimate_page_cost(frame, rows_per_unit=20):
+    """Rough memory weight of a page: one unit per widget plus table rows.
+
+    Treeview rows are cheap compared to widgets, so every ``rows_per_unit``
+    rows count as one widget.
+    """
+    cost = 0
+    stack = [frame]
+    while stack:
+        widget = stack.pop()
+        cost += 1
+        if isinstance(widget, ttk.Treeview):
+            cost += len(widget.get_children()) // rows_per_unit
+        stack.extend(widget.winfo_children())
+    return cost
+
+
+class PageCache:
+    """Keeps built page frames alive between navigations.
+
+    Pages are evicted least recently used first once more than ``max_pages``
+    are cached or their total cost exceeds ``budget``.  ``on_evict(page_id,
+    frame)`` is called for every evicted page and is expected to destroy it.
+    """
+
+    def __init__(self, max_pages=6, budget=8000, on_evict=None):
+        self.max_pages = max_pages
+        self.budget = budget
+        self._on_evict = on_evict
+        self._entries = OrderedDict()
+
+    def __contains__(self, page_id):
+        return page_id in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def total_cost(self):
+        return sum(cost for _frame, cost in self._entries.values())
+
+    def get(self, page_id):
+        """Return the cached frame and mark it most recently used."""
+        entry = self._entries.get(page_id)
+        if entry is None:
+            return None
+        self._entries.move_to_end(page_id)
+        return entry[0]
+
+    def put(self, page_id, frame, cost=0):
+        self._entries[page_id] = [frame, cost]
+        self._entries.move_to_end(page_id)
+
+    def set_cost(self, page_id, cost):
+        if page_id in self._entries:
+            self._entries[page_id][1] = cost
+
+    def evict(self, keep=None):
+        """Drop least recently used pages until the limits hold.
+
+        ``keep`` (normally the page being shown) is never evicted.  Returns
+        the evicted page ids.
+        """
+        evicted = []
+        while len(self._entries) > self.max_pages or self.total_cost > self.budget:
+            victim = next((pid for pid in self._entries if pid != keep), None)
+            if victim is None:
+                break
+            self.discard(victim)
+            evicted.append(victim)
+        return evicted
+
+    def discard(self, page_id):
+        entry = self._entries.pop(page_id, None)
+        if entry is not None and self._on_evict is not None:
+            self._on_evict(page_id, entry[0])
+
+    def clear(self):
+        for page_id in list(self._entries):
+            self.discard(page_id)
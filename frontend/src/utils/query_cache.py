@@ -0,0 +1,206 @@
+"""Bounded LRU cache of report query results keyed by filter spec.
+
+Keys are ``(page, start, end, shift, area, ...)`` tuples; every entry also
+records the tables its query read.  Writes are tracked through SQLAlchemy
+session events: tables touched by a flush or by a DML statement run through
+``Session.execute`` are collected per session, and on commit the entries that
+read any of them are dropped.  Commits from other stations are caught with
+``DataVersionWatch`` and clear the whole cache; a local commit does not hide
+them, since the version it moves is only taken over when nothing else can
+have moved it too.
+"""
+
+import threading
+from collections import OrderedDict
+from weakref import WeakSet
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from frontend.src.utils.master_data_cache import DataVersionWatch
+
+# Session.info key holding the tables written in the current transaction
+_WRITTEN_TABLES = "query_cache_written_tables"
+# Session.info key holding each cache's data_version just before the commit
+_PRE_COMMIT_VERSIONS = "query_cache_pre_commit_versions"
+# Written "table" meaning a statement whose targets are unknown (e.g. text())
+ALL_TABLES = "*"
+
+REPORT_TABLES = frozenset({"daily_reports", "users"})
+SUMMARY_DASHBOARD_TABLES = REPORT_TABLES | {
+    "attendance_entries",
+    "overtime_entries",
+    "daily_attendance_rollup",
+}
+REPORT_LOG_TABLES = REPORT_TABLES | {"equipment_logs", "lot_logs"}
+
+_caches = WeakSet()
+_UNSET = object()
+
+
+class QueryResultCache:
+    """LRU map of filter spec -> query result, invalidated by table writes.
+
+    Cached results are shared between hits and must not be mutated.
+    """
+
+    def __init__(self, max_entries=32, session_factory=None):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._watch = DataVersionWatch(session_factory)
+        # the watch connection is opened by the first fetch
+        self._version = _UNSET
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        _caches.add(self)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def fetch(self, key, tables, compute):
+        """Cached result for ``key``, else ``compute()`` stored under ``key``.
+
+        ``tables`` are the table names ``compute`` reads.  A result computed
+        while one of its tables was written is returned but not stored.
+        """
+        with self._lock:
+            self._check_data_version()
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            generation = self._generation
+        result = compute()
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (frozenset(tables), result)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return result
+
+    def invalidate_tables(self, tables, pre_commit_version=_UNSET):
+        """Drop entries that read any of ``tables`` (all for ``ALL_TABLES``).
+
+        ``pre_commit_version`` is the data_version read before the local
+        commit being reported; see ``_version_after_local_commit``.
+        """
+        tables = set(tables)
+        with self._lock:
+            stale = [
+                key
+                for key, (read, _result) in self._entries.items()
+                if ALL_TABLES in tables or read & tables
+            ]
+            for key in stale:
+                del self._entries[key]
+            self._generation += 1
+            self.invalidations += len(stale)
+            if self._version is not _UNSET:
+                self._version_after_local_commit(pre_commit_version)
+
+    def data_version(self):
+        """Current data_version of the watched database (None without one)."""
+        return self._watch.current()
+
+    def _version_after_local_commit(self, pre_commit_version):
+        version = self._watch.current()
+        if version == self._version:
+            return
+        # data_version steps once per change the watch notices, however many
+        # commits it covers, so only "last seen, then one step" is ours alone
+        if (
+            pre_commit_version is not _UNSET
+            and pre_commit_version == self._version
+            and version is not None
+            and pre_commit_version is not None
+            and version == pre_commit_version + 1
+        ):
+            self._version = version
+            return
+        self._clear_locked()
+        self._version = version
+
+    def clear(self):
+        with self._lock:
+            self._clear_locked()
+
+    def close(self):
+        self._watch.close()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "invalidations": self.invalidations,
+        }
+
+    def _clear_locked(self):
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+        self._generation += 1
+
+    def _check_data_version(self):
+        version = self._watch.current()
+        if version != self._version:
+            if self._version is not _UNSET:
+                self._clear_locked()
+            self._version = version
+
+
+def _written(session):
+    return session.info.setdefault(_WRITTEN_TABLES, set())
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session, _flush_context):
+    written = _written(session)
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        table = getattr(type(obj), "__table__", None)
+        written.add(table.name if table is not None else ALL_TABLES)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_execute(state):
+    if state.is_select:
+        return
+    table = getattr(state.statement, "table", None)
+    name = getattr(table, "name", None)
+    _written(state.session).add(name or ALL_TABLES)
+
+
+@event.listens_for(Session, "before_commit")
+def _note_pre_commit_versions(session):
+    # flush first: once the transaction has written, it holds the write lock,
+    # so no other connection can commit between this read and the commit
+    session.flush()
+    if session.info.get(_WRITTEN_TABLES):
+        session.info[_PRE_COMMIT_VERSIONS] = {
+            id(cache): cache.data_version() for cache in list(_caches)
+        }
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session):
+    written = session.info.pop(_WRITTEN_TABLES, None)
+    versions = session.info.pop(_PRE_COMMIT_VERSIONS, {})
+    if written:
+        for cache in list(_caches):
+            cache.invalidate_tables(written, versions.get(id(cache), _UNSET))
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_on_rollback(session):
+    session.info.pop(_WRITTEN_TABLES, None)
+    session.info.pop(_PRE_COMMIT_VERSIONS, None)
+
+
+query_cache = QueryResultCache()
@@ -8,8 +8,9 @@ def clear_tree(tree):
         return
     if not tree.winfo_exists():
         return
-    for item in tree.get_children():
-        tree.delete(item)
+    children = tree.get_children()
+    if children:
+        tree.delete(*children)
 
 
 def configure_treeview_columns(tree, columns, headers, widths=None):
@@ -42,3 +43,499 @@ def bind_treeview_context_menu(tree, build_menu):
 
     tree.bind("<Button-3>", handler)
     return handler
+
+
+def _tk_item_value(value):
+    """Mirror how a Tk round-trip returns a value stored in an item option."""
+    if isinstance(value, (str, int, float)):
+        return value
+    return str(value)
+
+
+class VirtualRowBuffer:
+    """Flat row store behind ``VirtualTreeview``.
+
+    Rows live in plain Python containers (an id list plus one small list per
+    row); only the window starting at ``offset`` is handed to Tk.
+    """
+
+    def __init__(self):
+        self.order = []
+        self.rows = {}
+        self.selection = set()
+        self.focus = None
+        self.offset = 0
+        self._positions = None
+        self._auto_id = 0
+
+    def __len__(self):
+        return len(self.order)
+
+    def next_id(self):
+        while True:
+            self._auto_id += 1
+            iid = f"I{self._auto_id:03X}"
+            if iid not in self.rows:
+                return iid
+
+    def insert(self, index, iid, text="", values=(), tags=()):
+        if iid in self.rows:
+            raise ValueError(f"Item {iid} already exists")
+        self.rows[iid] = [text, tuple(values), _as_tuple(tags)]
+        if index == "end" or int(index) >= len(self.order):
+            self.order.append(iid)
+            if self._positions is not None:
+                self._positions[iid] = len(self.order) - 1
+        else:
+            self.order.insert(max(int(index), 0), iid)
+            self._positions = None
+        return iid
+
+    def delete(self, items):
+        doomed = {iid for iid in items if iid in self.rows}
+        if not doomed:
+            return
+        for iid in doomed:
+            del self.rows[iid]
+        self.selection -= doomed
+        if self.focus in doomed:
+            self.focus = None
+        if len(doomed) == 1:
+            self.order.remove(next(iter(doomed)))
+        else:
+            self.order = [iid for iid in self.order if iid not in doomed]
+        self._positions = None
+
+    def index(self, iid):
+        if self._positions is None:
+            self._positions = {key: pos for pos, key in enumerate(self.order)}
+        return self._positions[iid]
+
+    def ordered(self, items):
+        return tuple(sorted((iid for iid in items if iid in self.rows), key=self.index))
+
+    def clamp_offset(self, capacity):
+        self.offset = max(0, min(self.offset, len(self.order) - capacity))
+        return self.offset
+
+    def window(self, capacity):
+        start = self.clamp_offset(capacity)
+        return self.order[start : start + capacity]
+
+    def scroll_to_show(self, iid, capacity):
+        pos = self.index(iid)
+        if pos < self.offset:
+            self.offset = pos
+        elif pos >= self.offset + capacity:
+            self.offset = pos - capacity + 1
+        return self.clamp_offset(capacity)
+
+    def fractions(self, capacity):
+        total = len(self.order)
+        if not total:
+            return 0.0, 1.0
+        first = self.offset / total
+        last = min(self.offset + capacity, total) / total
+        return first, last
+
+
+def _as_tuple(value):
+    if value in (None, ""):
+        return ()
+    if isinstance(value, str):
+        return (value,)
+    return tuple(value)
+
+
+class VirtualTreeview(ttk.Treeview):
+    """Flat ``ttk.Treeview`` that only materializes the visible rows.
+
+    Rows are kept in a ``VirtualRowBuffer``; Tk holds one reusable slot item
+    per visible line and the slots are re-filled while scrolling.  The
+    public Treeview methods used by the pages (insert, delete, get_children,
+    item, selection*, focus, see, identify_row, bbox, yview) accept and
+    return the logical item ids, so id schemes such as ``sq:<id>:equip:<id>``
+    keep working for context menus and inline edits.
+    """
+
+    _SLOT_PREFIX = "__vrow"
+
+    def __init__(self, master=None, **kw):
+        self._yscrollcommand = kw.pop("yscrollcommand", None)
+        self._buffer = VirtualRowBuffer()
+        self._slots = []
+        self._slot_iids = []
+        self._stale = set()
+        self._focus_slot = ""
+        self._render_id = None
+        super().__init__(master, **kw)
+        self._capacity = max(int(self.cget("height") or 10), 1)
+        self.bind("<Configure>", self._on_configure, add="+")
+        self.bind("<ButtonPress-1>", self._on_click, add="+")
+        self.bind("<MouseWheel>", self._on_mousewheel, add="+")
+        self.bind("<Button-4>", lambda _e: self._scroll_units(-3), add="+")
+        self.bind("<Button-5>", lambda _e: self._scroll_units(3), add="+")
+        self.bind("<Up>", lambda _e: self._on_arrow(-1), add="+")
+        self.bind("<Down>", lambda _e: self._on_arrow(1), add="+")
+        self.bind("<Prior>", lambda _e: self._scroll_units(-self._capacity), add="+")
+        self.bind("<Next>", lambda _e: self._scroll_units(self._capacity), add="+")
+
+    def configure(self, cnf=None, **kw):
+        if isinstance(cnf, dict):
+            kw = {**cnf, **kw}
+            cnf = None
+        if "yscrollcommand" in kw:
+            self._yscrollcommand = kw.pop("yscrollcommand")
+            self._notify_scroll()
+            if not kw and cnf is None:
+                return None
+        return super().configure(cnf, **kw)
+
+    config = configure
+
+    def destroy(self):
+        if self._render_id is not None:
+            try:
+                self.after_cancel(self._render_id)
+            except tk.TclError:
+                pass
+            self._render_id = None
+        super().destroy()
+
+    def insert(self, parent, index, iid=None, **kw):
+        if parent not in ("", None):
+            raise ValueError("VirtualTreeview only supports top-level items")
+        iid = str(iid) if iid is not None else self._buffer.next_id()
+        self._buffer.insert(
+            index,
+            iid,
+            text=kw.get("text", ""),
+            values=kw.get("values", ()),
+            tags=kw.get("tags", ()),
+        )
+        self._schedule_render()
+        return iid
+
+    def delete(self, *items):
+        if len(items) == 1 and isinstance(items[0], (tuple, list)):
+            items = items[0]
+        self._capture_tk_state()
+        self._buffer.delete(items)
+        self._schedule_render()
+
+    def get_children(self, item=None):
+        if item not in (None, ""):
+            return ()
+        return tuple(self._buffer.order)
+
+    def exists(self, item):
+        return item in self._buffer.rows
+
+    def index(self, item):
+        return self._buffer.index(item)
+
+    def next(self, item):
+        pos = self._buffer.index(item) + 1
+        return self._buffer.order[pos] if pos < len(self._buffer) else ""
+
+    def prev(self, item):
+        pos = self._buffer.index(item) - 1
+        return self._buffer.order[pos] if pos >= 0 else ""
+
+    def item(self, item, option=None, **kw):
+        row = self._row(item)
+        if kw:
+            if "text" in kw:
+                row[0] = kw["text"]
+            if "values" in kw:
+                row[1] = tuple(kw["values"] or ())
+            if "tags" in kw:
+                row[2] = _as_tuple(kw["tags"])
+            self._stale.add(item)
+            self._schedule_render()
+            return None
+        text, values, tags = row
+        if option == "values":
+            return tuple(_tk_item_value(v) for v in values) if values else ""
+        if option == "tags":
+            return tags if tags else ""
+        if option == "text":
+            return text
+        if option == "open":
+            return False
+        if option == "image":
+            return ""
+        if option is not None:
+            raise tk.TclError(f'unknown option "-{option}"')
+        return {
+            "text": text,
+            "image": "",
+            "values": [_convert_item_value(v) for v in values] if values else "",
+            "open": False,
+            "tags": list(tags) if tags else "",
+        }
+
+    def set(self, item, column=None, value=None):
+        columns = list(self["columns"])
+        values = list(self._row(item)[1])
+        values += [""] * (len(columns) - len(values))
+        if column is None:
+            return {col: _convert_item_value(val) for col, val in zip(columns, values)}
+        if str(column).startswith("#"):
+            pos = int(str(column)[1:]) - 1
+        else:
+            pos = columns.index(column)
+        if value is None:
+            return _tk_item_value(values[pos])
+        values[pos] = value
+        self.item(item, values=values)
+        return None
+
+    def tag_has(self, tagname, item=None):
+        if item is None:
+            rows = self._buffer.rows
+            return tuple(iid for iid in self._buffer.order if tagname in rows[iid][2])
+        return tagname in self._row(item)[2]
+
+    def selection(self):
+        self._capture_tk_state()
+        return self._buffer.ordered(self._buffer.selection)
+
+    def selection_set(self, *items):
+        self._capture_tk_state()
+        self._buffer.selection = set(self._known(items))
+        self._apply_tk_selection()
+
+    def selection_add(self, *items):
+        self._capture_tk_state()
+        self._buffer.selection |= set(self._known(items))
+        self._apply_tk_selection()
+
+    def selection_remove(self, *items):
+        self._capture_tk_state()
+        self._buffer.selection -= set(self._known(items))
+        self._apply_tk_selection()
+
+    def selection_toggle(self, *items):
+        self._capture_tk_state()
+        self._buffer.selection ^= set(self._known(items))
+        self._apply_tk_selection()
+
+    def focus(self, item=None):
+        if item is None:
+            self._capture_tk_state()
+            return self._buffer.focus or ""
+        if item in self._buffer.rows:
+            self._buffer.focus = item
+            self._apply_tk_focus()
+
+    def see(self, item):
+        if item not in self._buffer.rows:
+            return
+        self._capture_tk_state()
+        self._buffer.scroll_to_show(item, self._capacity)
+        self._render()
+
+    def identify_row(self, y):
+        self._flush()
+        return self._logical(super().identify_row(y))
+
+    def identify(self, component, x, y):
+        self._flush()
+        result = super().identify(component, x, y)
+        return self._logical(result) if component in ("row", "item") else result
+
+    def bbox(self, item, column=None):
+        self._flush()
+        slot = self._slot_for(item)
+        if not slot:
+            return ""
+        return super().bbox(slot, column)
+
+    def yview(self, *args):
+        if not args:
+            return self._buffer.fractions(self._capacity)
+        self._capture_tk_state()
+        if args[0] == "moveto":
+            self._buffer.offset = int(round(float(args[1]) * len(self._buffer)))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if len(args) > 2 and str(args[2]).startswith("page"):
+                step *= self._capacity
+            self._buffer.offset += step
+        self._render()
+        return None
+
+    def yview_moveto(self, fraction):
+        self.yview("moveto", fraction)
+
+    def yview_scroll(self, number, what):
+        self.yview("scroll", number, what)
+
+    def _row(self, item):
+        try:
+            return self._buffer.rows[item]
+        except KeyError:
+            raise tk.TclError(f"Item {item} not found") from None
+
+    def _known(self, items):
+        if len(items) == 1 and isinstance(items[0], (tuple, list)):
+            items = items[0]
+        return [iid for iid in items if iid in self._buffer.rows]
+
+    def _logical(self, slot):
+        slot = str(slot or "")
+        if slot.startswith(self._SLOT_PREFIX):
+            pos = int(slot[len(self._SLOT_PREFIX) :])
+            if pos < len(self._slot_iids):
+                return self._slot_iids[pos]
+            return ""
+        return slot
+
+    def _slot_for(self, item):
+        try:
+            return self._slots[self._slot_iids.index(item)]
+        except ValueError:
+            return ""
+
+    def _capture_tk_state(self):
+        """Fold the Tk selection/focus of the visible slots back into the buffer."""
+        if not self._slots or not self.winfo_exists():
+            return
+        tk_selection = {str(slot) for slot in super().selection()}
+        rows = self._buffer.rows
+        for slot, iid in zip(self._slots, self._slot_iids):
+            if iid not in rows:
+                continue
+            if slot in tk_selection:
+                self._buffer.selection.add(iid)
+            else:
+                self._buffer.selection.discard(iid)
+        tk_focus = str(super().focus() or "")
+        if tk_focus and tk_focus != self._focus_slot:
+            focus_iid = self._logical(tk_focus)
+            if focus_iid in rows:
+                self._buffer.focus = focus_iid
+                self._focus_slot = tk_focus
+
+    def _apply_tk_focus(self):
+        slot = self._slot_for(self._buffer.focus)
+        if slot:
+            super().focus(slot)
+            self._focus_slot = slot
+        else:
+            # the focused row is scrolled out; ignore Tk's leftover focus slot
+            self._focus_slot = str(super().focus() or "")
+
+    def _apply_tk_selection(self):
+        selected = self._buffer.selection
+        super().selection_set(
+            [slot for slot, iid in zip(self._slots, self._slot_iids) if iid in selected]
+        )
+
+    def _schedule_render(self):
+        if self._render_id is None:
+            self._render_id = self.after_idle(self._render)
+
+    def _flush(self):
+        if self._render_id is not None:
+            self._render()
+
+    def _render(self):
+        if self._render_id is not None:
+            try:
+                self.after_cancel(self._render_id)
+            except tk.TclError:
+                pass
+            self._render_id = None
+        if not self.winfo_exists():
+            return
+        window = self._buffer.window(self._capacity)
+        while len(self._slots) < len(window):
+            slot = f"{self._SLOT_PREFIX}{len(self._slots)}"
+            super().insert("", "end", iid=slot)
+            self._slots.append(slot)
+            self._slot_iids.append(None)
+        while len(self._slots) > len(window):
+            super().delete(self._slots.pop())
+            self._slot_iids.pop()
+        rows = self._buffer.rows
+        for pos, iid in enumerate(window):
+            if self._slot_iids[pos] == iid and iid not in self._stale:
+                continue
+            text, values, tags = rows[iid]
+            super().item(self._slots[pos], text=text, values=values, tags=tags)
+            self._slot_iids[pos] = iid
+        self._stale.clear()
+        self._apply_tk_selection()
+        self._apply_tk_focus()
+        self._notify_scroll()
+        capacity = self._visible_capacity()
+        if capacity != self._capacity:
+            self._capacity = capacity
+            self._render()
+
+    def _notify_scroll(self):
+        if callable(self._yscrollcommand):
+            self._yscrollcommand(*self._buffer.fractions(self._capacity))
+
+    def _visible_capacity(self):
+        height = self.winfo_height()
+        if height <= 1:
+            return self._capacity
+        style_name = self.cget("style") or "Treeview"
+        row_height = int(ttk.Style(self).lookup(style_name, "rowheight") or 20)
+        top = 0
+        if self._slots:
+            first = super().bbox(self._slots[0])
+            if first:
+                top = first[1]
+        return max(1, (height - top) // max(row_height, 1))
+
+    def _on_configure(self, _event=None):
+        capacity = self._visible_capacity()
+        if capacity != self._capacity:
+            self._capture_tk_state()
+            self._capacity = capacity
+            self._render()
+
+    def _on_click(self, event):
+        self._flush()
+        if event.state & 0x0005:
+            return None
+        if self.identify_region(event.x, event.y) in ("cell", "tree"):
+            self._buffer.selection.clear()
+        return None
+
+    def _on_mousewheel(self, event):
+        if abs(event.delta) >= 120:
+            self._scroll_units(-3 * (event.delta // 120))
+        elif event.delta:
+            self._scroll_units(-event.delta)
+        return "break"
+
+    def _scroll_units(self, steps):
+        self.yview("scroll", steps, "units")
+        return "break"
+
+    def _on_arrow(self, step):
+        self._flush()
+        focus_iid = self._logical(super().focus())
+        if not focus_iid or not self._slot_iids:
+            return None
+        edge_iid = self._slot_iids[-1] if step > 0 else self._slot_iids[0]
+        if focus_iid == edge_iid:
+            self._capture_tk_state()
+            self._buffer.offset += step
+            self._render()
+        return None
+
+
+def _convert_item_value(value):
+    value = _tk_item_value(value)
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            return value
+    return value
@@ -6,6 +6,8 @@ from typing import Callable, Dict, Tuple, Any
 import tkinter as tk
 from tkinter import ttk
 
+from frontend.src.utils.table_helpers import VirtualTreeview
+
 
 def create_section_header(
     parent: tk.Widget,
@@ -123,6 +125,7 @@ def create_treeview_with_scrollbars(
     context_menu_handler: Callable[[Any], None] | None = None,
     translate: Callable[[str, str], str] | None = None,
     tree_config: Dict[str, Any] | None = None,
+    virtual: bool = False,
 ) -> Dict[str, Any]:
     """
     Unified function to create a Treeview with scrollbars and configure headers.
@@ -143,13 +146,15 @@ def create_treeview_with_scrollbars(
         context_menu_handler: Callback for <Button-3> event
         translate: i18n translate function
         tree_config: Additional configuration for Treeview widget
+        virtual: Use a VirtualTreeview that only materializes visible rows
 
     Returns:
         Dict with tree, v_scrollbar, h_scrollbar, and configure function
     """
     tree_config = tree_config or {}
 
-    tree = ttk.Treeview(
+    tree_class = VirtualTreeview if virtual else ttk.Treeview
+    tree = tree_class(
         parent,
         columns=columns,
         show="headings",
@@ -4,6 +4,7 @@
 修正・最適化・モダンUIを含む
 """
 
+import importlib.util
 import sys
 import os
 from pathlib import Path
@@ -22,6 +23,8 @@ project_root = Path(__file__).parent
 os.chdir(project_root)
 sys.path.insert(0, str(project_root))
 
+import startup_profiler
+
 def check_dependencies():
     """依存パッケージを確認"""
     print("🔍 依存パッケージを確認中...")
@@ -37,12 +40,12 @@ def check_dependencies():
         "pydantic"
     ]
     
+    # 只查找模組規格，不實際匯入（pandas/matplotlib 匯入需要數秒）
     missing = []
     for package in required_packages:
-        try:
-            __import__(package)
+        if importlib.util.find_spec(package) is not None:
             print(f"   ✅ {package}")
-        except ImportError:
+        else:
             print(f"   ❌ {package}")
             missing.append(package)
     
@@ -60,8 +63,11 @@ def initialize_database():
     print("🗄️  データベースを初期化中...")
     
     try:
-        from models import init_db
-        init_db()
+        # 匯入 models 時即解析資料庫路徑 (含舊資料庫搬移) 並建立 engine
+        with startup_profiler.phase("import_models"):
+            from models import init_db
+        with startup_profiler.phase("init_db"):
+            init_db()
         print("   ✅ データベースの初期化に成功しました\n")
         return True
     except Exception as e:
@@ -74,12 +80,14 @@ def start_modern_ui():
     print("🚀 モダンUIを起動中...")
     
     try:
-        import tkinter as tk
-        from frontend.src.components.modern_main_frame import ModernMainFrame
-        from frontend.main import LanguageManager
+        with startup_profiler.phase("import_ui"):
+            import tkinter as tk
+            from frontend.src.components.modern_main_frame import ModernMainFrame
+            from frontend.main import LanguageManager
         
         # 創建主視窗
-        root = tk.Tk()
+        with startup_profiler.phase("create_root"):
+            root = tk.Tk()
         root.title("電子交接系統 V 0.1.5")
         root.geometry("1300x800")
         
@@ -92,10 +100,13 @@ def start_modern_ui():
         
         # 創建語言管理器
         locales_dir = project_root / "frontend" / "public" / "locales"
-        lang_manager = LanguageManager(str(locales_dir))
+        with startup_profiler.phase("language_manager"):
+            lang_manager = LanguageManager(str(locales_dir))
         
         # 創建現代化主框架
-        app = ModernMainFrame(root, lang_manager)
+        with startup_profiler.phase("main_frame"):
+            app = ModernMainFrame(root, lang_manager)
+        startup_profiler.finish_on_idle(root)
         
         print("   ✅ モダンUIの起動に成功しました\n")
         print("=" * 70)
@@ -137,8 +148,13 @@ def main():
     print("=" * 70)
     print()
     
+    # --profile-startup[=PATH]：記錄各啟動階段耗時並輸出 JSON 報告
+    startup_profiler.start_from_argv()
+
     # 檢查依賴
-    if not check_dependencies():
+    with startup_profiler.phase("dependency_check"):
+        dependencies_ok = check_dependencies()
+    if not dependencies_ok:
         if not prompt_continue("続行して起動しますか? (y/n): ", default=True):
             sys.exit(0)
     
@@ -152,4 +168,8 @@ def main():
 
 
 if __name__ == "__main__":
+    # 資料夾批次匯入使用 process pool，打包後的子行程需要 freeze_support
+    import multiprocessing
+
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,326 @@
+"""Bulk writes for imported delay and Summary Actual rows.
+
+Delay uploads are upserted on the natural key (date, reactor, process, lot,
+wafer) with SQLite ``ON CONFLICT``: ids and untouched rows are kept, and only
+rows whose values differ are written.  Summary Actual uploads replace every
+stored row for the dates they contain: one DELETE by date, then chunked
+``executemany`` INSERTs through Core.  Payloads are prepared before the first
+write so the SQLite write lock is held only for the statements themselves;
+the caller commits.
+
+Uploaded files are recorded in the import ledger by content hash, so a file
+whose content is already stored can be recognized before it is parsed.  Hand
+edits of imported rows mark the ledger entries of their dates superseded.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+from collections import namedtuple
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, insert, or_, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from models import DelayEntry, ImportLedgerEntry, SummaryActualEntry
+
+WRITE_CHUNK_ROWS = 5000
+
+# progress(done_rows, total_rows), called after each chunk
+ProgressCallback = Callable[[int, int], None]
+
+
+def _payloads(records: Iterable[Dict]) -> List[Dict]:
+    # Keys starting with "_" are pending-row bookkeeping (e.g. ``_pending_id``)
+    return [
+        {key: value for key, value in rec.items() if not key.startswith("_")}
+        for rec in records
+    ]
+
+
+def replace_rows_by_date(
+    session: Session,
+    model,
+    date_field: str,
+    records: Iterable[Dict],
+    *,
+    chunk_rows: int = WRITE_CHUNK_ROWS,
+    progress: Optional[ProgressCallback] = None,
+) -> int:
+    """Replace all ``model`` rows on the dates found in ``records``.
+
+    Returns the number of inserted rows.
+    """
+    rows = _payloads(records)
+    total = len(rows)
+    if not total:
+        return 0
+    dates = {row[date_field] for row in rows}
+    session.execute(
+        delete(model)
+        .where(getattr(model, date_field).in_(dates))
+        .execution_options(synchronize_session=False)
+    )
+    table = model.__table__
+    for start in range(0, total, chunk_rows):
+        session.execute(insert(table), rows[start : start + chunk_rows])
+        if progress is not None:
+            progress(min(start + chunk_rows, total), total)
+    return total
+
+
+DELAY_NATURAL_KEY = ("delay_date", "reactor", "process", "lot", "wafer")
+
+# ``duplicates``: records overridden by a later record with the same natural key
+UpsertResult = namedtuple(
+    "UpsertResult", ["inserted", "updated", "unchanged", "duplicates"]
+)
+
+
+def _delay_upsert_rows(records: Iterable[Dict]) -> Tuple[Dict[tuple, Dict], int]:
+    """Complete payloads keyed by natural key and the number of duplicates.
+
+    A later record with the same natural key wins over the earlier ones.
+    """
+    text_fields = [
+        column.name
+        for column in DelayEntry.__table__.columns
+        if column.name not in ("id", "delay_date", "imported_at")
+    ]
+    rows = {}
+    payloads = _payloads(records)
+    for row in payloads:
+        row.pop("id", None)
+        for field in text_fields:
+            if row.get(field) is None:
+                row[field] = ""
+        rows[tuple(row[field] for field in DELAY_NATURAL_KEY)] = row
+    return rows, len(payloads) - len(rows)
+
+
+def upsert_delay_entries(
+    session: Session,
+    records: Iterable[Dict],
+    *,
+    chunk_rows: int = WRITE_CHUNK_ROWS,
+    progress: Optional[ProgressCallback] = None,
+) -> UpsertResult:
+    """Insert new delay rows and update changed ones, keyed on the natural key.
+
+    Rows already stored with identical values are left alone (their id and
+    ``imported_at`` stay), and stored rows missing from ``records`` are kept.
+    The four counts add up to the number of ``records``.
+    """
+    rows, duplicates = _delay_upsert_rows(records)
+    if not rows:
+        return UpsertResult(0, 0, 0, duplicates)
+    table = DelayEntry.__table__
+    value_fields = [
+        column.name
+        for column in table.columns
+        if column.name not in DELAY_NATURAL_KEY + ("id", "imported_at")
+    ]
+    key_columns = [table.c[field] for field in DELAY_NATURAL_KEY]
+    stored = session.execute(
+        select(*key_columns, *(table.c[field] for field in value_fields)).where(
+            table.c.delay_date.in_({key[0] for key in rows})
+        )
+    )
+    width = len(DELAY_NATURAL_KEY)
+    existing = {tuple(row[:width]): tuple(row[width:]) for row in stored}
+
+    pending = []
+    inserted = updated = 0
+    for key, row in rows.items():
+        values = existing.get(key)
+        if values is None:
+            inserted += 1
+        elif values != tuple(row[field] for field in value_fields):
+            updated += 1
+        else:
+            continue
+        pending.append(row)
+
+    stmt = sqlite_insert(table)
+    excluded = stmt.excluded
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(DELAY_NATURAL_KEY),
+        set_={field: excluded[field] for field in value_fields + ["imported_at"]},
+        where=or_(*(table.c[field].is_not(excluded[field]) for field in value_fields)),
+    )
+    total = len(pending)
+    for start in range(0, total, chunk_rows):
+        session.execute(stmt, pending[start : start + chunk_rows])
+        if progress is not None:
+            progress(min(start + chunk_rows, total), total)
+    return UpsertResult(inserted, updated, len(rows) - total, duplicates)
+
+
+def replace_delay_entries(
+    session: Session,
+    records: Iterable[Dict],
+    *,
+    chunk_rows: int = WRITE_CHUNK_ROWS,
+    progress: Optional[ProgressCallback] = None,
+) -> int:
+    """Delete-by-date replace, for callers that want the file to be the truth."""
+    return replace_rows_by_date(
+        session,
+        DelayEntry,
+        "delay_date",
+        records,
+        chunk_rows=chunk_rows,
+        progress=progress,
+    )
+
+
+def replace_summary_actual_entries(
+    session: Session,
+    records: Iterable[Dict],
+    *,
+    chunk_rows: int = WRITE_CHUNK_ROWS,
+    progress: Optional[ProgressCallback] = None,
+) -> int:
+    return replace_rows_by_date(
+        session,
+        SummaryActualEntry,
+        "summary_date",
+        records,
+        chunk_rows=chunk_rows,
+        progress=progress,
+    )
+
+
+# What the ledger stores about one staged file
+ImportSource = namedtuple(
+    "ImportSource",
+    ["kind", "file_name", "content_hash", "sheet_name", "row_count", "dates"],
+)
+
+_HASH_BLOCK = 1024 * 1024
+# Dates per LIKE filter when superseding ledger entries
+LEDGER_DATE_CHUNK = 200
+
+
+def file_content_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(_HASH_BLOCK), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def describe_import(
+    kind: str,
+    path: str,
+    content_hash: str,
+    sheet_name: Optional[str],
+    records: Sequence[Dict],
+    date_field: str,
+) -> ImportSource:
+    dates = sorted({rec[date_field] for rec in records})
+    return ImportSource(
+        kind,
+        os.path.basename(path),
+        content_hash,
+        sheet_name or "",
+        len(records),
+        tuple(dates),
+    )
+
+
+def pending_fingerprint(records: Iterable[Dict]) -> str:
+    """Hash of the row payloads, to tell whether staged rows were edited."""
+    digest = hashlib.sha256()
+    for row in _payloads(records):
+        digest.update(repr(sorted(row.items())).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _ledger_dates(entry_dates: str) -> set:
+    return set(filter(None, entry_dates.split(",")))
+
+
+def find_current_import(
+    session: Session, kind: str, content_hash: str, sheet_name: Optional[str]
+) -> Optional[ImportLedgerEntry]:
+    """Ledger entry of an upload with this content that is still in effect.
+
+    An upload stops being in effect once a later upload of the same kind
+    wrote to any of its dates, or once rows on its dates were edited or
+    deleted by hand; re-importing it could then change data.
+    """
+    entry = session.scalars(
+        select(ImportLedgerEntry)
+        .where(
+            ImportLedgerEntry.kind == kind,
+            ImportLedgerEntry.content_hash == content_hash,
+            ImportLedgerEntry.sheet_name == (sheet_name or ""),
+        )
+        .order_by(ImportLedgerEntry.id.desc())
+        .limit(1)
+    ).first()
+    if entry is None or entry.superseded_at is not None:
+        return None
+    dates = _ledger_dates(entry.dates)
+    later = session.scalars(
+        select(ImportLedgerEntry.dates).where(
+            ImportLedgerEntry.kind == kind, ImportLedgerEntry.id > entry.id
+        )
+    )
+    if any(dates & _ledger_dates(later_dates) for later_dates in later):
+        return None
+    return entry
+
+
+def supersede_imports(session: Session, kind: str, dates: Iterable) -> int:
+    """Mark the in-effect uploads of ``kind`` touching ``dates`` superseded.
+
+    Called by hand edits and deletes of imported rows, before the commit.
+    Returns the number of ledger entries marked.
+    """
+    days = sorted({day.isoformat() for day in dates if day is not None})
+    now = datetime.utcnow()
+    marked = 0
+    for start in range(0, len(days), LEDGER_DATE_CHUNK):
+        chunk = days[start : start + LEDGER_DATE_CHUNK]
+        result = session.execute(
+            update(ImportLedgerEntry)
+            .where(
+                ImportLedgerEntry.kind == kind,
+                ImportLedgerEntry.superseded_at.is_(None),
+                or_(*(ImportLedgerEntry.dates.like(f"%{day}%") for day in chunk)),
+            )
+            .values(superseded_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        marked += result.rowcount or 0
+    return marked
+
+
+def record_imports(
+    session: Session, sources: Iterable[ImportSource], imported_by: str = ""
+) -> None:
+    for source in sources:
+        session.add(
+            ImportLedgerEntry(
+                kind=source.kind,
+                content_hash=source.content_hash,
+                file_name=source.file_name,
+                sheet_name=source.sheet_name,
+                row_count=source.row_count,
+                dates=",".join(day.isoformat() for day in source.dates),
+                imported_by=imported_by or "",
+            )
+        )
+
+
+def list_import_history(
+    session: Session, kind: Optional[str] = None, limit: int = 200
+) -> List[ImportLedgerEntry]:
+    stmt = select(ImportLedgerEntry).order_by(ImportLedgerEntry.id.desc())
+    if kind:
+        stmt = stmt.where(ImportLedgerEntry.kind == kind)
+    return list(session.scalars(stmt.limit(limit)))
@@ -0,0 +1,162 @@
+"""Versioned schema migrations keyed on SQLite ``PRAGMA user_version``.
+
+Each migration is applied once, in order, and the database is stamped with its
+version afterwards.  Steps are written to be idempotent so a run that was
+interrupted half-way can simply be repeated on the next launch.
+"""
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Set, Tuple
+
+from sqlalchemy.engine import Connection, Engine
+
+from models import Base, DailyAttendanceRollup, DelayEntry, ImportLedgerEntry
+from reporting import rebuild_attendance_rollup
+
+# Table receiving the delay rows removed by the natural-key migration
+DELAY_DUPLICATES_BACKUP_TABLE = "delay_entries_duplicates_backup"
+
+# Notices for the user produced by migrations; see consume_migration_notices()
+_MIGRATION_NOTICES: List[Dict[str, object]] = []
+
+
+def consume_migration_notices() -> List[Dict[str, object]]:
+    """Return and clear the notices of migrations that changed stored data."""
+    notices = list(_MIGRATION_NOTICES)
+    _MIGRATION_NOTICES.clear()
+    return notices
+
+
+def _table_columns(conn: Connection, table_name: str) -> Set[str]:
+    rows = conn.exec_driver_sql(f"PRAGMA table_info({table_name})").fetchall()
+    return {row[1] for row in rows}
+
+
+def _add_daily_report_audit_columns(conn: Connection) -> None:
+    existing = _table_columns(conn, "daily_reports")
+    if "last_modified_by" not in existing:
+        conn.exec_driver_sql(
+            "ALTER TABLE daily_reports ADD COLUMN last_modified_by VARCHAR(100)"
+        )
+    if "last_modified_at" not in existing:
+        conn.exec_driver_sql(
+            "ALTER TABLE daily_reports ADD COLUMN last_modified_at DATETIME"
+        )
+    if "is_hidden" not in existing:
+        conn.exec_driver_sql(
+            "ALTER TABLE daily_reports ADD COLUMN is_hidden INTEGER NOT NULL DEFAULT 0"
+        )
+
+
+def _add_equipment_impact_hours(conn: Connection) -> None:
+    existing = _table_columns(conn, "equipment_logs")
+    if "impact_hours" not in existing:
+        conn.exec_driver_sql(
+            "ALTER TABLE equipment_logs ADD COLUMN impact_hours REAL NOT NULL DEFAULT 0"
+        )
+
+
+REPORT_INDEX_TABLES = (
+    "daily_reports",
+    "attendance_entries",
+    "overtime_entries",
+    "equipment_logs",
+    "lot_logs",
+)
+
+
+def _create_report_indexes(conn: Connection) -> None:
+    for table_name in REPORT_INDEX_TABLES:
+        table = Base.metadata.tables[table_name]
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+    conn.exec_driver_sql("ANALYZE")
+
+
+def _create_attendance_rollup(conn: Connection) -> None:
+    DailyAttendanceRollup.__table__.create(conn, checkfirst=True)
+    rebuild_attendance_rollup(conn)
+
+
+def _create_import_ledger(conn: Connection) -> None:
+    table = ImportLedgerEntry.__table__
+    table.create(conn, checkfirst=True)
+    for index in table.indexes:
+        index.create(conn, checkfirst=True)
+
+
+def _add_import_ledger_superseded_at(conn: Connection) -> None:
+    if "superseded_at" not in _table_columns(conn, "import_ledger"):
+        conn.exec_driver_sql(
+            "ALTER TABLE import_ledger ADD COLUMN superseded_at DATETIME"
+        )
+
+
+def _create_delay_natural_key(conn: Connection) -> None:
+    # Keep the newest row of each natural key so the unique index can be built;
+    # the older rows are copied to a backup table before they are removed
+    duplicates = (
+        "FROM delay_entries WHERE id NOT IN ("
+        "SELECT MAX(id) FROM delay_entries "
+        "GROUP BY delay_date, reactor, process, lot, wafer)"
+    )
+    count = conn.exec_driver_sql(f"SELECT COUNT(*) {duplicates}").scalar() or 0
+    if count:
+        conn.exec_driver_sql(
+            f"CREATE TABLE IF NOT EXISTS {DELAY_DUPLICATES_BACKUP_TABLE} "
+            "AS SELECT * FROM delay_entries WHERE 0"
+        )
+        conn.exec_driver_sql(
+            f"INSERT INTO {DELAY_DUPLICATES_BACKUP_TABLE} SELECT * {duplicates}"
+        )
+        conn.exec_driver_sql(f"DELETE {duplicates}")
+        print(
+            f"延遲清單重複資料 {count} 筆已移至 {DELAY_DUPLICATES_BACKUP_TABLE} 資料表"
+        )
+        _MIGRATION_NOTICES.append(
+            {
+                "kind": "delay_duplicates",
+                "count": count,
+                "table": DELAY_DUPLICATES_BACKUP_TABLE,
+            }
+        )
+    for index in DelayEntry.__table__.indexes:
+        index.create(conn, checkfirst=True)
+
+
+MIGRATIONS: List[Tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "daily_reports audit and visibility columns", _add_daily_report_audit_columns),
+    (2, "equipment_logs.impact_hours", _add_equipment_impact_hours),
+    (3, "report lookup and foreign-key indexes", _create_report_indexes),
+    (4, "daily_attendance_rollup backfill", _create_attendance_rollup),
+    (5, "import_ledger table", _create_import_ledger),
+    (6, "delay_entries natural-key unique index", _create_delay_natural_key),
+    (7, "import_ledger.superseded_at", _add_import_ledger_superseded_at),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn: Connection) -> int:
+    return int(conn.exec_driver_sql("PRAGMA user_version").scalar() or 0)
+
+
+def run_migrations(bind: Engine) -> int:
+    """Apply pending migrations and return the resulting schema version."""
+    with bind.connect() as conn:
+        current = get_schema_version(conn)
+    for version, description, step in MIGRATIONS:
+        if version <= current:
+            continue
+        notice_count = len(_MIGRATION_NOTICES)
+        try:
+            with bind.begin() as conn:
+                step(conn)
+                conn.exec_driver_sql(f"PRAGMA user_version = {int(version)}")
+        except Exception as exc:
+            # the step was rolled back, so its notices did not happen
+            del _MIGRATION_NOTICES[notice_count:]
+            print(f"資料庫遷移失敗 (v{version} {description}): {exc}")
+            return current
+        current = version
+    return current
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime, date
 from pathlib import Path
+import hashlib
 import json
 import sys
 import shutil
@@ -18,8 +19,10 @@ from sqlalchemy import (
     Text,
     Float,
     ForeignKey,
+    Index,
     create_engine,
     event,
+    text,
 )
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import declarative_base, relationship, sessionmaker, Session
@@ -194,6 +197,16 @@ class AreaOption(Base):
 
 class DailyReport(Base):
     __tablename__ = "daily_reports"
+    __table_args__ = (
+        Index("ix_daily_reports_date_shift_area", "date", "shift", "area", "is_hidden"),
+        Index(
+            "ix_daily_reports_visible",
+            "date",
+            "shift",
+            "area",
+            sqlite_where=text("is_hidden = 0"),
+        ),
+    )
 
     id: int = Column(Integer, primary_key=True, index=True)
     date: date = Column(Date, nullable=False)
@@ -230,7 +243,9 @@ class AttendanceEntry(Base):
     __tablename__ = "attendance_entries"
 
     id: int = Column(Integer, primary_key=True, index=True)
-    report_id: int = Column(Integer, ForeignKey("daily_reports.id"), nullable=False)
+    report_id: int = Column(
+        Integer, ForeignKey("daily_reports.id"), nullable=False, index=True
+    )
     category: str = Column(String(20), nullable=False)  # Regular / Contract
     scheduled_count: int = Column(Integer, default=0, nullable=False)
     present_count: int = Column(Integer, default=0, nullable=False)
@@ -244,7 +259,9 @@ class OvertimeEntry(Base):
     __tablename__ = "overtime_entries"
 
     id: int = Column(Integer, primary_key=True, index=True)
-    report_id: int = Column(Integer, ForeignKey("daily_reports.id"), nullable=False)
+    report_id: int = Column(
+        Integer, ForeignKey("daily_reports.id"), nullable=False, index=True
+    )
     category: str = Column(String(20), default="", nullable=False)
     count: int = Column(Integer, default=0, nullable=False)
     notes: str = Column(Text, default="", nullable=False)
@@ -256,7 +273,9 @@ class EquipmentLog(Base):
     __tablename__ = "equipment_logs"
 
     id: int = Column(Integer, primary_key=True, index=True)
-    report_id: int = Column(Integer, ForeignKey("daily_reports.id"), nullable=False)
+    report_id: int = Column(
+        Integer, ForeignKey("daily_reports.id"), nullable=False, index=True
+    )
     equip_id: str = Column(String(50), nullable=False)
     description: str = Column(Text, default="", nullable=False)
     start_time: str = Column(String(50), default="", nullable=False)
@@ -272,7 +291,9 @@ class LotLog(Base):
     __tablename__ = "lot_logs"
 
     id: int = Column(Integer, primary_key=True, index=True)
-    report_id: int = Column(Integer, ForeignKey("daily_reports.id"), nullable=False)
+    report_id: int = Column(
+        Integer, ForeignKey("daily_reports.id"), nullable=False, index=True
+    )
     lot_id: str = Column(String(50), default="", nullable=False)
     description: str = Column(Text, default="", nullable=False)
     status: str = Column(Text, default="", nullable=False)
@@ -283,6 +304,17 @@ class LotLog(Base):
 
 class DelayEntry(Base):
     __tablename__ = "delay_entries"
+    __table_args__ = (
+        Index(
+            "ux_delay_entries_natural_key",
+            "delay_date",
+            "reactor",
+            "process",
+            "lot",
+            "wafer",
+            unique=True,
+        ),
+    )
 
     id: int = Column(Integer, primary_key=True, index=True)
     delay_date: date = Column(Date, nullable=False)
@@ -327,6 +359,61 @@ class AttendanceSummaryDeleteLog(Base):
     snapshot_json: str = Column(Text, default="", nullable=False)
 
 
+class DailyAttendanceRollup(Base):
+    """Pre-summed attendance per date/shift/area over visible reports.
+
+    Maintained by ``reporting.refresh_attendance_rollup`` in the same
+    transaction as the writes it summarizes.
+    """
+
+    __tablename__ = "daily_attendance_rollup"
+
+    date: date = Column(Date, primary_key=True)
+    shift: str = Column(String(20), primary_key=True)
+    area: str = Column(String(50), primary_key=True)
+    report_count: int = Column(Integer, default=0, nullable=False)
+    regular_present: int = Column(Integer, default=0, nullable=False)
+    regular_absent: int = Column(Integer, default=0, nullable=False)
+    contract_present: int = Column(Integer, default=0, nullable=False)
+    contract_absent: int = Column(Integer, default=0, nullable=False)
+    present: int = Column(Integer, default=0, nullable=False)
+    absent: int = Column(Integer, default=0, nullable=False)
+    overtime: int = Column(Integer, default=0, nullable=False)
+    rate: float = Column(Float, default=0.0, nullable=False)
+
+
+class ImportLedgerEntry(Base):
+    """One uploaded import file, identified by the SHA-256 of its content.
+
+    ``dates`` is the comma-separated list of ISO dates the upload replaced.
+    ``superseded_at`` is set when rows on those dates are edited or deleted by
+    hand, after which the stored data no longer matches the file.
+    """
+
+    __tablename__ = "import_ledger"
+    __table_args__ = (
+        Index("ix_import_ledger_kind_hash", "kind", "content_hash", "sheet_name"),
+    )
+
+    id: int = Column(Integer, primary_key=True, index=True)
+    kind: str = Column(String(30), nullable=False)
+    content_hash: str = Column(String(64), nullable=False)
+    file_name: str = Column(String(255), default="", nullable=False)
+    sheet_name: str = Column(String(100), default="", nullable=False)
+    row_count: int = Column(Integer, default=0, nullable=False)
+    dates: str = Column(Text, default="", nullable=False)
+    imported_by: str = Column(String(100), default="", nullable=False)
+    imported_at: datetime = Column(DateTime, default=datetime.utcnow, nullable=False)
+    superseded_at: datetime = Column(DateTime, nullable=True)
+
+
+class SchemaMeta(Base):
+    __tablename__ = "schema_meta"
+
+    key: str = Column(String(50), primary_key=True)
+    value: str = Column(Text, default="", nullable=False)
+
+
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
     try:
@@ -335,17 +422,70 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+DEFAULT_SHIFT_NAMES = ("Day", "Night")
+DEFAULT_AREA_NAMES = ("etching_D", "etching_E", "litho", "thin_film")
+SEED_FINGERPRINT_KEY = "seed_fingerprint"
+
+
+def _schema_fingerprint(default_admin_username: str) -> str:
+    """Hash of the schema version, table layout and seed data this code expects."""
+    from migrations import SCHEMA_VERSION  # local import to avoid circular dependency
+
+    tables = {
+        name: sorted(
+            [col.name for col in table.columns] + [idx.name for idx in table.indexes]
+        )
+        for name, table in Base.metadata.tables.items()
+    }
+    payload = {
+        "schema_version": SCHEMA_VERSION,
+        "tables": tables,
+        "admin": default_admin_username,
+        "shifts": DEFAULT_SHIFT_NAMES,
+        "areas": DEFAULT_AREA_NAMES,
+    }
+    raw = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.sha1(raw).hexdigest()
+
+
+def _is_schema_current(fingerprint: str) -> bool:
+    """Single read: compare user_version and the stored fingerprint with the code."""
+    from migrations import SCHEMA_VERSION  # local import to avoid circular dependency
+
+    try:
+        with engine.connect() as conn:
+            row = conn.exec_driver_sql(
+                "SELECT (SELECT user_version FROM pragma_user_version), "
+                "(SELECT value FROM schema_meta WHERE key = ?)",
+                (SEED_FINGERPRINT_KEY,),
+            ).first()
+    except Exception:
+        return False
+    return bool(row) and row[0] == SCHEMA_VERSION and row[1] == fingerprint
+
+
 def init_db(
     default_admin_username: str = "admin", default_admin_password: str = "admin123"
 ) -> None:
-    """Initialize database tables and ensure default admin exists."""
+    """Initialize database tables and ensure default admin exists.
+
+    When the stored schema version and seed fingerprint match the code, the
+    table creation, migrations and seed checks are skipped entirely.
+    """
+    fingerprint = _schema_fingerprint(default_admin_username)
+    if _is_schema_current(fingerprint):
+        return
     try:
         Base.metadata.create_all(bind=engine)
     except Exception as exc:
         print(f"資料庫初始化失敗: {exc}")
         return
-    _ensure_daily_report_columns()
-    _ensure_equipment_log_columns()
+    from migrations import (  # local import to avoid circular dependency
+        SCHEMA_VERSION,
+        run_migrations,
+    )
+
+    schema_version = run_migrations(engine)
 
     from auth import hash_password  # local import to avoid circular dependency
 
@@ -362,50 +502,11 @@ def init_db(
                 )
                 session.add(admin)
             if session.query(ShiftOption).count() == 0:
-                session.add_all([ShiftOption(name="Day"), ShiftOption(name="Night")])
+                session.add_all([ShiftOption(name=name) for name in DEFAULT_SHIFT_NAMES])
             if session.query(AreaOption).count() == 0:
-                session.add_all(
-                    [
-                        AreaOption(name="etching_D"),
-                        AreaOption(name="etching_E"),
-                        AreaOption(name="litho"),
-                        AreaOption(name="thin_film"),
-                    ]
-                )
+                session.add_all([AreaOption(name=name) for name in DEFAULT_AREA_NAMES])
+            if schema_version == SCHEMA_VERSION:
+                session.merge(SchemaMeta(key=SEED_FINGERPRINT_KEY, value=fingerprint))
             session.commit()
     except Exception as exc:
         print(f"建立預設管理員失敗: {exc}")
-
-
-def _ensure_daily_report_columns() -> None:
-    try:
-        with engine.begin() as conn:
-            rows = conn.exec_driver_sql("PRAGMA table_info(daily_reports)").fetchall()
-            existing = {row[1] for row in rows}
-            if "last_modified_by" not in existing:
-                conn.exec_driver_sql(
-                    "ALTER TABLE daily_reports ADD COLUMN last_modified_by VARCHAR(100)"
-                )
-            if "last_modified_at" not in existing:
-                conn.exec_driver_sql(
-                    "ALTER TABLE daily_reports ADD COLUMN last_modified_at DATETIME"
-                )
-            if "is_hidden" not in existing:
-                conn.exec_driver_sql(
-                    "ALTER TABLE daily_reports ADD COLUMN is_hidden INTEGER NOT NULL DEFAULT 0"
-                )
-    except Exception as exc:
-        print(f"資料庫欄位檢查失敗: {exc}")
-
-
-def _ensure_equipment_log_columns() -> None:
-    try:
-        with engine.begin() as conn:
-            rows = conn.exec_driver_sql("PRAGMA table_info(equipment_logs)").fetchall()
-            existing = {row[1] for row in rows}
-            if "impact_hours" not in existing:
-                conn.exec_driver_sql(
-                    "ALTER TABLE equipment_logs ADD COLUMN impact_hours REAL NOT NULL DEFAULT 0"
-                )
-    except Exception as exc:
-        print(f"Equipment log migration failed: {exc}")
@@ -0,0 +1,186 @@
+"""Keyset (seek) pagination for the report, abnormal-log and delay lists.
+
+Each page is ordered by a fixed sort key ending in the primary key, and the
+next page starts strictly after the last key of the previous one.  Deep pages
+cost the same as the first page, and nothing beyond ``limit + 1`` rows is
+loaded at once.
+"""
+from __future__ import annotations
+
+from collections import namedtuple
+from datetime import date
+from typing import Optional, Sequence, Tuple
+
+from sqlalchemy import and_, select, tuple_
+from sqlalchemy.orm import Session, joinedload
+
+from models import DailyReport, DelayEntry, EquipmentLog, LotLog
+
+
+DEFAULT_PAGE_SIZE = 500
+
+# ``next_cursor`` is None on the last page
+Page = namedtuple("Page", ["rows", "next_cursor"])
+
+Cursor = Tuple
+
+
+def _report_filter(
+    start_date: Optional[date],
+    end_date: Optional[date],
+    shift: Optional[str] = None,
+    area: Optional[str] = None,
+):
+    clauses = [DailyReport.is_hidden == 0]
+    if start_date:
+        clauses.append(DailyReport.date >= start_date)
+    if end_date:
+        clauses.append(DailyReport.date <= end_date)
+    if shift:
+        clauses.append(DailyReport.shift == shift)
+    if area:
+        clauses.append(DailyReport.area == area)
+    return and_(*clauses)
+
+
+def _seek(
+    session: Session,
+    stmt,
+    key_columns: Sequence,
+    key_of,
+    cursor: Optional[Cursor],
+    limit: int,
+) -> Page:
+    if cursor is not None:
+        stmt = stmt.where(tuple_(*key_columns) > tuple_(*cursor))
+    rows = session.scalars(stmt.order_by(*key_columns).limit(limit + 1)).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return Page(rows, key_of(rows[-1]))
+    return Page(rows, None)
+
+
+# Same column order as the (date, shift, area) report indexes, so SQLite walks
+# an index instead of sorting the matched reports
+REPORT_PAGE_KEY = (
+    DailyReport.date,
+    DailyReport.shift,
+    DailyReport.area,
+    DailyReport.id,
+)
+
+
+def fetch_report_page(
+    session: Session,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    shift: Optional[str] = None,
+    area: Optional[str] = None,
+    cursor: Optional[Cursor] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> Page:
+    """Visible reports ordered by (date, shift, area, id), authors preloaded."""
+    stmt = (
+        select(DailyReport)
+        .options(joinedload(DailyReport.author))
+        .where(_report_filter(start_date, end_date, shift, area))
+    )
+    return _seek(
+        session,
+        stmt,
+        REPORT_PAGE_KEY,
+        lambda row: (row.date, row.shift, row.area, row.id),
+        cursor,
+        limit,
+    )
+
+
+def _fetch_log_page(
+    session: Session,
+    model,
+    start_date,
+    end_date,
+    shift,
+    area,
+    cursor,
+    limit,
+) -> Page:
+    stmt = (
+        select(model)
+        .join(DailyReport, DailyReport.id == model.report_id)
+        .options(joinedload(model.report).joinedload(DailyReport.author))
+        .where(_report_filter(start_date, end_date, shift, area))
+    )
+    return _seek(
+        session,
+        stmt,
+        (DailyReport.date, DailyReport.shift, DailyReport.area, model.id),
+        lambda row: (row.report.date, row.report.shift, row.report.area, row.id),
+        cursor,
+        limit,
+    )
+
+
+def fetch_equipment_page(
+    session: Session,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    shift: Optional[str] = None,
+    area: Optional[str] = None,
+    cursor: Optional[Cursor] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> Page:
+    """Equipment logs of visible reports ordered by (date, shift, area, id)."""
+    return _fetch_log_page(
+        session, EquipmentLog, start_date, end_date, shift, area, cursor, limit
+    )
+
+
+def fetch_lot_page(
+    session: Session,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    shift: Optional[str] = None,
+    area: Optional[str] = None,
+    cursor: Optional[Cursor] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> Page:
+    """Lot logs of visible reports ordered by (date, shift, area, id)."""
+    return _fetch_log_page(
+        session, LotLog, start_date, end_date, shift, area, cursor, limit
+    )
+
+
+DELAY_PAGE_KEY = (
+    DelayEntry.delay_date,
+    DelayEntry.reactor,
+    DelayEntry.process,
+    DelayEntry.lot,
+    DelayEntry.id,
+)
+
+
+def fetch_delay_page(
+    session: Session,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    cursor: Optional[Cursor] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> Page:
+    """Delay entries ordered by (delay_date, reactor, process, lot, id).
+
+    Delay entries have no shift/area, so the list keeps its existing order.
+    """
+    stmt = select(DelayEntry)
+    if start_date:
+        stmt = stmt.where(DelayEntry.delay_date >= start_date)
+    if end_date:
+        stmt = stmt.where(DelayEntry.delay_date <= end_date)
+    return _seek(
+        session,
+        stmt,
+        DELAY_PAGE_KEY,
+        lambda row: (row.delay_date, row.reactor, row.process, row.lot, row.id),
+        cursor,
+        limit,
+    )
@@ -0,0 +1,410 @@
+"""Set-based attendance aggregation shared by the summary dashboard and exports.
+
+All sums are computed by SQLite with GROUP BY; callers receive compact named
+tuples instead of ORM objects.  Per-day series are served from the
+``daily_attendance_rollup`` table, which writers keep current through
+``refresh_attendance_rollup``; long ranges are summed per week or month in
+SQL (see ``series_bucket``) so charts get a bounded number of points.
+"""
+from __future__ import annotations
+
+from collections import namedtuple
+from datetime import date
+from typing import Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import Date, and_, case, delete, func, insert, literal, or_, select
+from sqlalchemy.orm import Session
+
+from models import (
+    AttendanceEntry,
+    DailyAttendanceRollup,
+    DailyReport,
+    OvertimeEntry,
+    User,
+)
+
+
+AttendanceReportRow = namedtuple(
+    "AttendanceReportRow",
+    [
+        "report_id",
+        "date",
+        "shift",
+        "area",
+        "author",
+        "regular_present",
+        "regular_absent",
+        "contract_present",
+        "contract_absent",
+        "overtime_count",
+        "regular_reason",
+        "contract_reason",
+        "last_modified_by",
+        "last_modified_at",
+    ],
+)
+
+DailyAttendancePoint = namedtuple(
+    "DailyAttendancePoint", ["date", "regular", "contract", "present", "absent"]
+)
+
+AttendanceSummary = namedtuple(
+    "AttendanceSummary",
+    ["reports", "daily_series", "total_present", "total_absent", "bucket"],
+)
+
+BUCKET_DAY = "day"
+BUCKET_WEEK = "week"
+BUCKET_MONTH = "month"
+# Longest ranges (in days) still plotted per day / per week
+MAX_DAILY_RANGE = 45
+MAX_WEEKLY_RANGE = 26 * 7
+
+REASON_SEPARATOR = " / "
+
+
+def _is_regular():
+    return func.lower(func.coalesce(AttendanceEntry.category, "")).like("reg%")
+
+
+def _sum_if(condition, column):
+    return func.coalesce(func.sum(case((condition, column), else_=0)), 0)
+
+
+def _visible_report_filter(
+    start_date: date,
+    end_date: date,
+    shift: Optional[str] = None,
+    area: Optional[str] = None,
+):
+    clauses = [
+        DailyReport.date >= start_date,
+        DailyReport.date <= end_date,
+        DailyReport.is_hidden == 0,
+    ]
+    if shift:
+        clauses.append(DailyReport.shift == shift)
+    if area:
+        clauses.append(DailyReport.area == area)
+    return and_(*clauses)
+
+
+def _attendance_subquery(report_filter, with_reasons: bool = False):
+    """Attendance sums per report, restricted to reports matching ``report_filter``."""
+    is_regular = _is_regular()
+    columns = [
+        AttendanceEntry.report_id.label("report_id"),
+        _sum_if(is_regular, AttendanceEntry.present_count).label("regular_present"),
+        _sum_if(is_regular, AttendanceEntry.absent_count).label("regular_absent"),
+        _sum_if(~is_regular, AttendanceEntry.present_count).label("contract_present"),
+        _sum_if(~is_regular, AttendanceEntry.absent_count).label("contract_absent"),
+    ]
+    if with_reasons:
+        reason = func.trim(func.coalesce(AttendanceEntry.reason, ""))
+        columns += [
+            func.group_concat(
+                case((and_(is_regular, reason != ""), reason)), REASON_SEPARATOR
+            ).label("regular_reason"),
+            func.group_concat(
+                case((and_(~is_regular, reason != ""), reason)), REASON_SEPARATOR
+            ).label("contract_reason"),
+        ]
+    return (
+        select(*columns)
+        .join(DailyReport, DailyReport.id == AttendanceEntry.report_id)
+        .where(report_filter)
+        .group_by(AttendanceEntry.report_id)
+        .subquery()
+    )
+
+
+def _overtime_subquery(report_filter):
+    return (
+        select(
+            OvertimeEntry.report_id.label("report_id"),
+            func.sum(OvertimeEntry.count).label("overtime_count"),
+        )
+        .join(DailyReport, DailyReport.id == OvertimeEntry.report_id)
+        .where(report_filter)
+        .group_by(OvertimeEntry.report_id)
+        .subquery()
+    )
+
+
+def query_attendance_reports(
+    session: Session,
+    start_date: date,
+    end_date: date,
+    shift: Optional[str] = None,
+    area: Optional[str] = None,
+) -> List[AttendanceReportRow]:
+    """One row per visible report with attendance and overtime pre-summed."""
+    report_filter = _visible_report_filter(start_date, end_date, shift, area)
+    attendance = _attendance_subquery(report_filter, with_reasons=True)
+    overtime = _overtime_subquery(report_filter)
+
+    stmt = (
+        select(
+            DailyReport.id,
+            DailyReport.date,
+            DailyReport.shift,
+            DailyReport.area,
+            func.coalesce(User.username, literal("")),
+            func.coalesce(attendance.c.regular_present, 0),
+            func.coalesce(attendance.c.regular_absent, 0),
+            func.coalesce(attendance.c.contract_present, 0),
+            func.coalesce(attendance.c.contract_absent, 0),
+            func.coalesce(overtime.c.overtime_count, 0),
+            func.coalesce(attendance.c.regular_reason, ""),
+            func.coalesce(attendance.c.contract_reason, ""),
+            DailyReport.last_modified_by,
+            DailyReport.last_modified_at,
+        )
+        .outerjoin(User, User.id == DailyReport.author_id)
+        .outerjoin(attendance, attendance.c.report_id == DailyReport.id)
+        .outerjoin(overtime, overtime.c.report_id == DailyReport.id)
+        .where(report_filter)
+        .order_by(DailyReport.date, DailyReport.shift, DailyReport.area)
+    )
+    return [AttendanceReportRow(*row) for row in session.execute(stmt)]
+
+
+RollupKey = Tuple[date, str, str]
+# Keys per OR filter; SQLite rejects expression trees deeper than 1000
+ROLLUP_KEY_CHUNK = 200
+
+ROLLUP_VALUE_COLUMNS = (
+    "report_count",
+    "regular_present",
+    "regular_absent",
+    "contract_present",
+    "contract_absent",
+    "present",
+    "absent",
+    "overtime",
+    "rate",
+)
+
+
+def _rollup_rows(executor, report_filter) -> List[dict]:
+    """Aggregate raw entries into rollup rows for the reports matching the filter."""
+    attendance = _attendance_subquery(report_filter)
+    overtime = _overtime_subquery(report_filter)
+    stmt = (
+        select(
+            DailyReport.date,
+            DailyReport.shift,
+            DailyReport.area,
+            func.count(DailyReport.id),
+            func.coalesce(func.sum(attendance.c.regular_present), 0),
+            func.coalesce(func.sum(attendance.c.regular_absent), 0),
+            func.coalesce(func.sum(attendance.c.contract_present), 0),
+            func.coalesce(func.sum(attendance.c.contract_absent), 0),
+            func.coalesce(func.sum(overtime.c.overtime_count), 0),
+        )
+        .outerjoin(attendance, attendance.c.report_id == DailyReport.id)
+        .outerjoin(overtime, overtime.c.report_id == DailyReport.id)
+        .where(report_filter)
+        .group_by(DailyReport.date, DailyReport.shift, DailyReport.area)
+    )
+    rows = []
+    for (
+        day,
+        shift,
+        area,
+        report_count,
+        regular_present,
+        regular_absent,
+        contract_present,
+        contract_absent,
+        overtime_count,
+    ) in executor.execute(stmt):
+        present = regular_present + contract_present
+        absent = regular_absent + contract_absent
+        total = present + absent
+        rows.append(
+            {
+                "date": day,
+                "shift": shift,
+                "area": area,
+                "report_count": report_count,
+                "regular_present": regular_present,
+                "regular_absent": regular_absent,
+                "contract_present": contract_present,
+                "contract_absent": contract_absent,
+                "present": present,
+                "absent": absent,
+                "overtime": overtime_count,
+                "rate": round(present / total * 100, 4) if total else 0.0,
+            }
+        )
+    return rows
+
+
+def _rollup_key_filter(columns, keys: Iterable[RollupKey]):
+    date_col, shift_col, area_col = columns
+    return or_(
+        *[
+            and_(date_col == day, shift_col == shift, area_col == area)
+            for day, shift, area in keys
+        ]
+    )
+
+
+def rollup_keys_for_reports(executor, report_ids: Iterable[int]) -> Set[RollupKey]:
+    """Current (date, shift, area) keys of the given reports."""
+    ids = [int(rid) for rid in report_ids if rid is not None]
+    if not ids:
+        return set()
+    stmt = select(DailyReport.date, DailyReport.shift, DailyReport.area).where(
+        DailyReport.id.in_(ids)
+    )
+    return {tuple(row) for row in executor.execute(stmt)}
+
+
+def refresh_attendance_rollup(executor, keys: Iterable[RollupKey]) -> int:
+    """Recompute the rollup rows for ``keys`` from raw entries.
+
+    ``executor`` is the caller's Session or Connection, so the rollup is
+    written inside the same transaction as the change that triggered it.
+    Pending ORM changes must be flushed first.  Returns the number of rollup
+    rows written.
+    """
+    keys = sorted(
+        {key for key in keys if key and all(part is not None for part in key)}
+    )
+    rollup = DailyAttendanceRollup
+    written = 0
+    for start in range(0, len(keys), ROLLUP_KEY_CHUNK):
+        chunk = keys[start : start + ROLLUP_KEY_CHUNK]
+        executor.execute(
+            delete(rollup).where(
+                _rollup_key_filter((rollup.date, rollup.shift, rollup.area), chunk)
+            )
+        )
+        report_columns = (DailyReport.date, DailyReport.shift, DailyReport.area)
+        report_filter = and_(
+            DailyReport.is_hidden == 0, _rollup_key_filter(report_columns, chunk)
+        )
+        rows = _rollup_rows(executor, report_filter)
+        if rows:
+            executor.execute(insert(rollup), rows)
+        written += len(rows)
+    return written
+
+
+def rebuild_attendance_rollup(executor) -> int:
+    """Regenerate the whole rollup table from raw entries."""
+    executor.execute(delete(DailyAttendanceRollup))
+    rows = _rollup_rows(executor, DailyReport.is_hidden == 0)
+    if rows:
+        executor.execute(insert(DailyAttendanceRollup), rows)
+    return len(rows)
+
+
+def verify_attendance_rollup(executor) -> List[RollupKey]:
+    """Keys whose stored rollup differs from a fresh aggregation of raw entries."""
+    expected = {
+        (row["date"], row["shift"], row["area"]): tuple(
+            row[name] for name in ROLLUP_VALUE_COLUMNS
+        )
+        for row in _rollup_rows(executor, DailyReport.is_hidden == 0)
+    }
+    rollup = DailyAttendanceRollup
+    stored = {
+        (row[0], row[1], row[2]): tuple(row[3:])
+        for row in executor.execute(
+            select(
+                rollup.date,
+                rollup.shift,
+                rollup.area,
+                *[getattr(rollup, name) for name in ROLLUP_VALUE_COLUMNS],
+            )
+        )
+    }
+    mismatched = [
+        key
+        for key in expected.keys() | stored.keys()
+        if expected.get(key) != stored.get(key)
+    ]
+    return sorted(mismatched)
+
+
+def series_bucket(start_date: date, end_date: date) -> str:
+    """Bucket for a chart series over the range: day, week or month."""
+    days = (end_date - start_date).days + 1
+    if days <= MAX_DAILY_RANGE:
+        return BUCKET_DAY
+    if days <= MAX_WEEKLY_RANGE:
+        return BUCKET_WEEK
+    return BUCKET_MONTH
+
+
+def _bucket_start(column, bucket: str):
+    if bucket == BUCKET_DAY:
+        return column
+    if bucket == BUCKET_WEEK:
+        # Monday on or before the date
+        return func.date(column, "-6 days", "weekday 1", type_=Date)
+    if bucket == BUCKET_MONTH:
+        return func.date(column, "start of month", type_=Date)
+    raise ValueError(f"unknown series bucket: {bucket!r}")
+
+
+def query_daily_attendance(
+    session: Session,
+    start_date: date,
+    end_date: date,
+    shift: Optional[str] = None,
+    area: Optional[str] = None,
+    bucket: str = BUCKET_DAY,
+) -> List[DailyAttendancePoint]:
+    """Present/absent totals per bucket split into regular and contract staff.
+
+    Reads the pre-summed ``daily_attendance_rollup`` rows, so long ranges
+    touch one row per date/shift/area instead of every attendance entry.
+    Each point's ``date`` is the first day of its bucket (the Monday of a
+    week, the 1st of a month); a first bucket starting before ``start_date``
+    only sums the days inside the range.
+    """
+    rollup = DailyAttendanceRollup
+    period = _bucket_start(rollup.date, bucket).label("period")
+    clauses = [rollup.date >= start_date, rollup.date <= end_date]
+    if shift:
+        clauses.append(rollup.shift == shift)
+    if area:
+        clauses.append(rollup.area == area)
+    stmt = (
+        select(
+            period,
+            func.sum(rollup.regular_present),
+            func.sum(rollup.contract_present),
+            func.sum(rollup.present),
+            func.sum(rollup.absent),
+        )
+        .where(*clauses)
+        .group_by(period)
+        .order_by(period)
+    )
+    return [DailyAttendancePoint(*row) for row in session.execute(stmt)]
+
+
+def load_attendance_summary(
+    session: Session,
+    start_date: date,
+    end_date: date,
+    shift: Optional[str] = None,
+    area: Optional[str] = None,
+    bucket: Optional[str] = None,
+) -> AttendanceSummary:
+    """Reports plus a chart series bucketed by ``series_bucket`` unless given."""
+    bucket = bucket or series_bucket(start_date, end_date)
+    reports = query_attendance_reports(session, start_date, end_date, shift, area)
+    daily_series = query_daily_attendance(
+        session, start_date, end_date, shift, area, bucket
+    )
+    total_present = sum(point.present for point in daily_series)
+    total_absent = sum(point.absent for point in daily_series)
+    return AttendanceSummary(
+        reports, daily_series, total_present, total_absent, bucket
+    )
@@ -0,0 +1,144 @@
+"""
+Import a folder (or glob) of delay / Summary Actual files without the UI.
+
+Files are parsed in parallel in a process pool; every file that parses is
+uploaded in one transaction (delay rows are upserted on their natural key,
+Summary Actual rows replace the stored rows on the imported dates).  Files
+that fail are reported and skipped, as are files whose content the import
+ledger shows is already stored (unless --force).  --dry-run neither creates
+nor migrates the database.
+
+Usage: python scripts/batch_import.py KIND SOURCE [--workers N] [--dry-run] [--force]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from frontend.src.utils.batch_import import (  # noqa: E402
+    DATE_FIELDS,
+    DELAY,
+    SUMMARY_ACTUAL,
+    find_import_files,
+    import_sheet_name,
+    merge_results,
+    parse_import_files,
+)
+from import_service import (  # noqa: E402
+    describe_import,
+    file_content_hash,
+    find_current_import,
+    record_imports,
+    replace_summary_actual_entries,
+    upsert_delay_entries,
+)
+from sqlalchemy.exc import SQLAlchemyError  # noqa: E402
+
+from models import DATABASE_PATH, SessionLocal, init_db  # noqa: E402
+
+UPLOADERS = {
+    DELAY: upsert_delay_entries,
+    SUMMARY_ACTUAL: replace_summary_actual_entries,
+}
+
+
+def _print_result(result, done, total):
+    name = os.path.basename(result.path)
+    if result.error is None:
+        print(f"[{done}/{total}] OK    {name}: {len(result.records)} row(s)")
+    else:
+        print(f"[{done}/{total}] ERROR {name}: {result.error}")
+
+
+def _split_already_imported(kind, paths, check_ledger):
+    """(paths to parse, {path: (hash, sheet)}) after skipping stored content."""
+    fresh, keys = [], {}
+    session = SessionLocal() if check_ledger else None
+    try:
+        for path in paths:
+            content_hash = file_content_hash(path)
+            try:
+                sheet_name = import_sheet_name(kind, path)
+            except Exception:
+                sheet_name = None
+            if session is not None and find_current_import(
+                session, kind, content_hash, sheet_name
+            ):
+                print(f"SKIP  {os.path.basename(path)}: already imported")
+                continue
+            fresh.append(path)
+            keys[path] = (content_hash, sheet_name)
+    finally:
+        if session is not None:
+            session.close()
+    return fresh, keys
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("kind", choices=sorted(UPLOADERS))
+    parser.add_argument("source", help="folder or glob pattern, e.g. 'in/*.xlsx'")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument(
+        "--dry-run", action="store_true", help="parse only, do not write"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="re-import files already imported"
+    )
+    args = parser.parse_args()
+
+    paths = find_import_files(args.source)
+    if not paths:
+        print(f"找不到可匯入的檔案: {args.source}")
+        return 1
+    if args.dry_run:
+        # 試跑不建立或遷移資料庫；讀不到匯入紀錄時不略過任何檔案
+        check_ledger = not args.force and DATABASE_PATH.exists()
+        try:
+            paths, keys = _split_already_imported(args.kind, paths, check_ledger)
+        except SQLAlchemyError as exc:
+            print(f"無法讀取匯入紀錄，不檢查重複匯入: {getattr(exc, 'orig', exc)}")
+            paths, keys = _split_already_imported(args.kind, paths, False)
+    else:
+        init_db()
+        paths, keys = _split_already_imported(args.kind, paths, not args.force)
+    results = parse_import_files(
+        args.kind, paths, max_workers=args.workers, on_result=_print_result
+    )
+    records = merge_results(results)
+    failed = sum(1 for result in results if result.error is not None)
+    print(f"{len(paths) - failed}/{len(paths)} file(s) parsed, {len(records)} row(s)")
+    if records and not args.dry_run:
+        sources = [
+            describe_import(
+                args.kind,
+                result.path,
+                *keys[result.path],
+                result.records,
+                DATE_FIELDS[args.kind],
+            )
+            for result in results
+            if result.error is None and result.records
+        ]
+        with SessionLocal() as session:
+            outcome = UPLOADERS[args.kind](session, records)
+            record_imports(session, sources, "batch_import")
+            session.commit()
+        if args.kind == DELAY:
+            print(
+                f"inserted {outcome.inserted}, updated {outcome.updated}, "
+                f"unchanged {outcome.unchanged}, duplicate in file "
+                f"{outcome.duplicates} row(s)"
+            )
+        else:
+            print(f"uploaded {outcome} row(s)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""
+Benchmark pending delay uploads: per-row ORM adds vs chunked Core inserts.
+
+Both paths replace the same dates in a fresh WAL-mode SQLite file that
+already holds one copy of the rows, so the DELETE is part of the timing.
+
+Usage: python scripts/benchmark_bulk_upload.py [--rows 30000]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, delete, event
+from sqlalchemy.orm import Session
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from import_service import replace_delay_entries  # noqa: E402
+from models import Base, DelayEntry  # noqa: E402
+
+
+def _records(count):
+    start = date(2024, 1, 1)
+    return [
+        {
+            "delay_date": start + timedelta(days=i % 30),
+            "time_range": "08:00-09:00",
+            "reactor": f"R{i % 12}",
+            "process": "ETCH",
+            "lot": f"L{i:06d}",
+            "wafer": str(i % 25),
+            "progress": "50%",
+            "prev_steps": "3",
+            "prev_time": "",
+            "severity": "",
+            "action": "rework",
+            "note": "",
+            "_pending_id": i + 1,
+        }
+        for i in range(count)
+    ]
+
+
+def _engine(path):
+    engine = create_engine(f"sqlite:///{path}", future=True)
+
+    @event.listens_for(engine, "connect")
+    def _wal(connection, _):
+        connection.execute("PRAGMA journal_mode=WAL")
+
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def upload_orm(session, records):
+    dates = {rec["delay_date"] for rec in records}
+    session.execute(
+        delete(DelayEntry)
+        .where(DelayEntry.delay_date.in_(dates))
+        .execution_options(synchronize_session=False)
+    )
+    for rec in records:
+        payload = {k: v for k, v in rec.items() if not k.startswith("_")}
+        session.add(DelayEntry(**payload))
+
+
+def upload_bulk(session, records):
+    replace_delay_entries(session, records)
+
+
+def _timed(engine, upload, records):
+    with Session(engine, future=True) as session:
+        started = time.perf_counter()
+        upload(session, records)
+        session.commit()
+        return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=30_000)
+    args = parser.parse_args()
+
+    records = _records(args.rows)
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, upload in (("orm add", upload_orm), ("bulk", upload_bulk)):
+            engine = _engine(Path(tmp) / f"{name.replace(' ', '_')}.db")
+            _timed(engine, upload_bulk, records)
+            results[name] = _timed(engine, upload, records)
+            engine.dispose()
+            print(f"{name:>8}: {results[name] * 1000:8.0f} ms  ({args.rows} rows)")
+    print(f"speedup: x{results['orm add'] / results['bulk']:.1f}")
+
+
+if __name__ == "__main__":
+    main()
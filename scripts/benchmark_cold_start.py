@@ -0,0 +1,103 @@
+"""
+Cold-start benchmark for the main window module and the dependency check.
+
+Each sample runs in a fresh interpreter so nothing is cached in
+``sys.modules``.  The "eager" variant additionally imports pandas and
+matplotlib the way the main window module used to at load time, and runs the
+old import-based dependency check; "lazy" is the current startup path.
+
+Usage: python scripts/benchmark_cold_start.py [--repeat 5]
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+_TIMED = """
+import sys, time
+sys.path.insert(0, {root!r})
+started = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - started
+heavy = [m for m in ("pandas", "matplotlib") if m in sys.modules]
+print(f"{{elapsed:.6f}} {{','.join(heavy) or '-'}}")
+"""
+
+_PACKAGES = (
+    "tkinter",
+    "sqlalchemy",
+    "pandas",
+    "bcrypt",
+    "openpyxl",
+    "matplotlib",
+    "jwt",
+    "pydantic",
+)
+
+VARIANTS = {
+    "main window import": {
+        "eager": (
+            "import pandas\n"
+            "import matplotlib.figure\n"
+            "import matplotlib.backends.backend_tkagg\n"
+            "import frontend.src.components.modern_main_frame"
+        ),
+        "lazy": "import frontend.src.components.modern_main_frame",
+    },
+    "dependency check": {
+        "eager": (
+            f"for name in {_PACKAGES!r}:\n"
+            "    try:\n"
+            "        __import__(name)\n"
+            "    except ImportError:\n"
+            "        pass"
+        ),
+        "lazy": (
+            "import importlib.util\n"
+            f"for name in {_PACKAGES!r}:\n"
+            "    importlib.util.find_spec(name)"
+        ),
+    },
+}
+
+
+def _sample(body):
+    code = _TIMED.format(root=str(PROJECT_ROOT), body=body)
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    return float(output[0]), output[1]
+
+
+def _measure(body, repeat):
+    samples = [_sample(body) for _ in range(repeat)]
+    return statistics.median(s[0] for s in samples), samples[-1][1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, variants in VARIANTS.items():
+        eager, eager_heavy = _measure(variants["eager"], args.repeat)
+        lazy, lazy_heavy = _measure(variants["lazy"], args.repeat)
+        speedup = eager / lazy if lazy else float("inf")
+        print(
+            f"== {name}: {eager * 1000:.0f} ms -> {lazy * 1000:.0f} ms "
+            f"(x{speedup:.1f}, median of {args.repeat})"
+        )
+        print(f"   heavy modules loaded: eager={eager_heavy} lazy={lazy_heavy}")
+
+
+if __name__ == "__main__":
+    main()
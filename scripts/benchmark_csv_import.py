@@ -0,0 +1,106 @@
+"""
+Benchmark CSV import paths on a generated delay CSV (100k rows by default).
+
+The file mimics an MES export: a title row, ``;`` separators and cp932
+text.  Three paths read it:
+
+* ``python``    - the original ``read_table``: ``pd.read_csv(sep=None,
+  engine="python")``, which sniffs the first line and parses in Python;
+* ``c``         - ``read_table`` now: encoding and delimiter sniffed on the
+  first 64 KB, then the C parser with ``dtype=str``;
+* ``streaming`` - the import path: ``iter_sheet_rows`` + ``iter_delay_records``.
+
+Usage: python scripts/benchmark_csv_import.py [--rows 100000] [--repeat 3]
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from frontend.src.utils.import_helpers import (  # noqa: E402
+    iter_delay_records,
+    iter_sheet_rows,
+    read_table,
+)
+
+HEADER = ("Date", "Time", "Reactor", "Process", "Lot", "Wafer", "Caution", "備考")
+
+
+def write_delay_csv(path, count, delimiter=";", encoding="cp932"):
+    """Title row, header and ``count`` data rows; returns ``path``."""
+    start = date(2024, 1, 1)
+    title = delimiter.join(("遅延リスト",) + ("",) * (len(HEADER) - 1))
+    lines = [title, delimiter.join(HEADER)]
+    for i in range(count):
+        lines.append(
+            delimiter.join(
+                (
+                    (start + timedelta(days=i % 365)).strftime("%Y/%m/%d"),
+                    "08:00-09:00",
+                    f"R{i % 12}",
+                    "ETCH" if i % 3 else "DEP",
+                    f"L{i:06d}",
+                    str(i % 25),
+                    "高" if i % 7 == 0 else "",
+                    "再処理" if i % 4 == 0 else "",
+                )
+            )
+        )
+    Path(path).write_text("\n".join(lines) + "\n", encoding=encoding)
+    return path
+
+
+def read_python(path):
+    import pandas as pd
+
+    frame = pd.read_csv(path, header=None, sep=None, engine="python", encoding="cp932")
+    return len(frame)
+
+
+def read_table_rows(path):
+    return len(read_table(path))
+
+
+def read_streaming(path):
+    return sum(1 for _ in iter_delay_records(iter_sheet_rows(path)))
+
+
+PATHS = {"python": read_python, "c": read_table_rows, "streaming": read_streaming}
+
+
+def time_path(read, path, repeat=3):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        count = read(path)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples), count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_delay_csv(str(Path(tmp) / "delay.csv"), args.rows)
+        for name, read in PATHS.items():
+            results[name], count = time_path(read, path, args.repeat)
+            print(f"{name:>10}: {results[name] * 1000:8.0f} ms  ({count} rows)")
+    baseline = results["python"]
+    for name, elapsed in results.items():
+        print(f"{name:>10}: x{baseline / elapsed:.1f} vs python engine")
+
+
+if __name__ == "__main__":
+    main()
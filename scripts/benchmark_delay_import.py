@@ -0,0 +1,167 @@
+"""
+Benchmark delay-sheet conversion on a generated sheet (100k rows by default).
+
+Three paths turn the same in-memory rows into delay records:
+
+* ``iterrows``  - the original import: DataFrame + ``iterrows`` with a scalar
+  ``pd.to_datetime`` and string cleanup per row;
+* ``per-row``   - per-cell parsing with the ``cell_*`` helpers;
+* ``vectorized`` - ``iter_delay_column_chunks`` (one ``to_datetime`` and
+  column-wise string normalization per chunk).
+
+Usage: python scripts/benchmark_delay_import.py [--rows 100000] [--repeat 3]
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from frontend.src.utils.import_helpers import (  # noqa: E402
+    DELAY_TEXT_FIELDS,
+    HEADER_SCAN_ROWS,
+    _cell,
+    _is_delay_header,
+    cell_date,
+    cell_text,
+    delay_column_map,
+    iter_delay_column_chunks,
+)
+
+HEADER = (
+    "Date",
+    "Time",
+    "Reactor",
+    "Process",
+    "Lot",
+    "Wafer",
+    "Progress",
+    "Previous steps",
+    "Prev time",
+    "Severity",
+    "Action",
+    "Note",
+)
+
+
+def generate_rows(count):
+    """Title row, header and ``count`` data rows; every 50th row has no date."""
+    start = datetime(2024, 1, 1)
+    rows = [("Delay list",), HEADER]
+    for i in range(count):
+        if i % 50 == 49:
+            day = None
+        elif i % 2:
+            day = (start + timedelta(days=i % 365)).strftime("%Y/%m/%d")
+        else:
+            day = start + timedelta(days=i % 365)
+        rows.append(
+            (
+                day,
+                "08:00-09:00",
+                f"R{i % 12}",
+                "ETCH" if i % 3 else "DEP",
+                f"L{i:06d}",
+                i % 25,
+                f" {i % 100}% ",
+                "3",
+                None,
+                "high" if i % 7 == 0 else "",
+                "rework",
+                None if i % 4 else " check ",
+            )
+        )
+    return rows
+
+
+def convert_iterrows(rows):
+    import pandas as pd
+
+    frame = pd.DataFrame(rows)
+    header_idx = next(
+        i for i, row in frame.head(HEADER_SCAN_ROWS).iterrows() if _is_delay_header(row)
+    )
+    col_map = delay_column_map(list(frame.iloc[header_idx]))
+    records = []
+    for _, row in frame.iloc[header_idx + 1 :].iterrows():
+
+        def sval(field):
+            idx = col_map[field]
+            if idx is None or pd.isna(row[idx]):
+                return ""
+            return str(row[idx]).strip()
+
+        raw = row[col_map["delay_date"]]
+        if pd.isna(raw):
+            continue
+        parsed = pd.to_datetime(raw, errors="coerce")
+        if pd.isna(parsed):
+            continue
+        record = {"delay_date": parsed.date()}
+        record.update({field: sval(field) for field in DELAY_TEXT_FIELDS})
+        records.append(record)
+    return len(records)
+
+
+def convert_per_row(rows):
+    col_map = None
+    count = 0
+    for row in rows:
+        if col_map is None:
+            if _is_delay_header(row):
+                col_map = delay_column_map(row)
+            continue
+        delay_date = cell_date(_cell(row, col_map["delay_date"]))
+        if delay_date is None:
+            continue
+        record = {"delay_date": delay_date}
+        record.update(
+            {
+                field: cell_text(_cell(row, col_map[field]))
+                for field in DELAY_TEXT_FIELDS
+            }
+        )
+        count += 1
+    return count
+
+
+def convert_vectorized(rows):
+    return sum(len(chunk["delay_date"]) for chunk in iter_delay_column_chunks(rows))
+
+
+PATHS = {
+    "iterrows": convert_iterrows,
+    "per-row": convert_per_row,
+    "vectorized": convert_vectorized,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = generate_rows(args.rows)
+    results = {}
+    for name, convert in PATHS.items():
+        samples = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            count = convert(rows)
+            samples.append(time.perf_counter() - started)
+        results[name] = statistics.median(samples)
+        print(f"{name:>10}: {results[name] * 1000:8.0f} ms  ({count} records)")
+    baseline = results["iterrows"]
+    for name, elapsed in results.items():
+        print(f"{name:>10}: x{baseline / elapsed:.1f} vs iterrows")
+
+
+if __name__ == "__main__":
+    main()
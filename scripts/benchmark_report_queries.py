@@ -0,0 +1,178 @@
+"""
+Before/after query-plan benchmark for the report lookup indexes.
+
+Builds a throw-away SQLite database with several years of synthetic shifts,
+runs the dashboard / abnormal history / summary query shapes without the
+report indexes, applies the migrations and runs them again.
+
+Usage: python scripts/benchmark_report_queries.py [--years 3] [--repeat 20]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from sqlalchemy import create_engine, insert, select  # noqa: E402
+
+from migrations import REPORT_INDEX_TABLES, run_migrations  # noqa: E402
+from models import (  # noqa: E402
+    AttendanceEntry,
+    Base,
+    DailyReport,
+    EquipmentLog,
+    LotLog,
+    OvertimeEntry,
+    User,
+)
+
+SHIFTS = ("Day", "Night")
+AREAS = ("etching_D", "etching_E", "litho", "thin_film")
+
+
+def _populate(engine, years):
+    rng = random.Random(42)
+    start = date.today() - timedelta(days=365 * years)
+    reports = []
+    report_id = 0
+    for offset in range(365 * years):
+        day = start + timedelta(days=offset)
+        for shift in SHIFTS:
+            for area in AREAS:
+                report_id += 1
+                reports.append(
+                    {
+                        "id": report_id,
+                        "date": day,
+                        "shift": shift,
+                        "area": area,
+                        "author_id": 1,
+                        "is_hidden": 1 if rng.random() < 0.02 else 0,
+                    }
+                )
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"id": 1, "username": "bench", "password_hash": "x"}])
+        conn.execute(insert(DailyReport), reports)
+        conn.execute(
+            insert(AttendanceEntry),
+            [
+                {
+                    "report_id": rep["id"],
+                    "category": category,
+                    "scheduled_count": 10,
+                    "present_count": rng.randint(6, 10),
+                    "absent_count": rng.randint(0, 2),
+                }
+                for rep in reports
+                for category in ("Regular", "Contract")
+            ],
+        )
+        conn.execute(
+            insert(OvertimeEntry),
+            [
+                {"report_id": rep["id"], "category": "Regular", "count": rng.randint(0, 3)}
+                for rep in reports
+            ],
+        )
+        conn.execute(
+            insert(EquipmentLog),
+            [
+                {"report_id": rep["id"], "equip_id": f"EQ{rng.randint(1, 80):03d}"}
+                for rep in reports
+                for _ in range(2)
+            ],
+        )
+        conn.execute(
+            insert(LotLog),
+            [{"report_id": rep["id"], "lot_id": f"L{rep['id']:06d}"} for rep in reports],
+        )
+    return len(reports)
+
+
+def _drop_report_indexes(engine):
+    with engine.begin() as conn:
+        for table_name in REPORT_INDEX_TABLES:
+            for index in Base.metadata.tables[table_name].indexes:
+                index.drop(conn, checkfirst=True)
+        conn.exec_driver_sql("PRAGMA user_version = 2")
+
+
+def _queries():
+    end = date.today()
+    start = end - timedelta(days=30)
+    visible_range = (
+        DailyReport.date >= start,
+        DailyReport.date <= end,
+        DailyReport.is_hidden == 0,
+    )
+    report_ids = (
+        select(DailyReport.id).where(*visible_range).scalar_subquery()
+    )
+    return {
+        "dashboard reports": select(DailyReport)
+        .where(*visible_range)
+        .order_by(DailyReport.date, DailyReport.shift, DailyReport.area),
+        "dashboard attendance": select(AttendanceEntry).where(
+            AttendanceEntry.report_id.in_(report_ids)
+        ),
+        "abnormal equipment": select(EquipmentLog)
+        .join(DailyReport)
+        .where(*visible_range, DailyReport.shift == "Day", DailyReport.area == "litho")
+        .order_by(DailyReport.date, DailyReport.area, DailyReport.shift, EquipmentLog.id),
+        "summary query reports": select(DailyReport)
+        .where(*visible_range, DailyReport.area == "litho")
+        .order_by(DailyReport.date, DailyReport.area, DailyReport.shift, DailyReport.id),
+        "summary query lots": select(LotLog).where(LotLog.report_id.in_(report_ids)),
+    }
+
+
+def _measure(engine, repeat):
+    results = {}
+    with engine.connect() as conn:
+        for name, stmt in _queries().items():
+            compiled = stmt.compile(engine, compile_kwargs={"literal_binds": True})
+            plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}").fetchall()
+            started = time.perf_counter()
+            for _ in range(repeat):
+                conn.execute(stmt).fetchall()
+            elapsed = (time.perf_counter() - started) / repeat
+            results[name] = (elapsed, [row[-1] for row in plan])
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}", future=True)
+        Base.metadata.create_all(engine)
+        _drop_report_indexes(engine)
+        count = _populate(engine, args.years)
+        print(f"{count} daily reports over {args.years} year(s)\n")
+
+        before = _measure(engine, args.repeat)
+        run_migrations(engine)
+        after = _measure(engine, args.repeat)
+        engine.dispose()
+
+    for name in before:
+        before_ms = before[name][0] * 1000
+        after_ms = after[name][0] * 1000
+        speedup = before_ms / after_ms if after_ms else float("inf")
+        print(f"== {name}: {before_ms:.2f} ms -> {after_ms:.2f} ms (x{speedup:.1f})")
+        print("   before: " + " | ".join(before[name][1]))
+        print("   after:  " + " | ".join(after[name][1]))
+
+
+if __name__ == "__main__":
+    main()
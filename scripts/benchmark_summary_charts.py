@@ -0,0 +1,145 @@
+"""
+Benchmark summary dashboard chart refreshes: rebuild vs in-place update.
+
+Both charts are refreshed ``--refreshes`` times with a ``--days``-long
+series whose values change on every refresh, drawn offscreen with Agg:
+
+* ``rebuild`` - the original ``_render_summary_charts``: a new Figure per
+  chart, one artist per value label, ``tight_layout`` and a full draw;
+* ``update``  - ``AttendanceRateChart`` / ``AttendanceCountChart`` built once,
+  then only data, labels and colors are changed before the redraw.
+
+Peak traced memory of the whole run is reported next to the timings.
+
+Usage: python scripts/benchmark_summary_charts.py [--refreshes 50] [--days 31]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg  # noqa: E402
+from matplotlib.figure import Figure  # noqa: E402
+
+from frontend.src.components.summary_charts import (  # noqa: E402
+    AttendanceCountChart,
+    AttendanceRateChart,
+)
+
+THEME = {
+    "face": "#ffffff",
+    "grid": "#d0d7de",
+    "text": "#1f2328",
+    "line": "#1a7f37",
+    "bar_primary": "#0969da",
+    "bar_accent": "#bf8700",
+}
+RATE_TEXTS = {"title": "Rate", "series": "Rate", "axis": "%", "empty": "-"}
+COUNT_TEXTS = {
+    "title": "Headcount",
+    "regular": "Regular",
+    "contract": "Contract",
+    "axis": "People",
+    "empty": "-",
+}
+
+
+def make_series(days, seed):
+    start = date(2024, 1, 1)
+    labels = [(start + timedelta(days=idx)).isoformat() for idx in range(days)]
+    regular = [20 + (idx * 7 + seed) % 9 for idx in range(days)]
+    contract = [5 + (idx * 3 + seed) % 4 for idx in range(days)]
+    rates = [80 + (idx * 5 + seed) % 20 for idx in range(days)]
+    return labels, regular, contract, rates
+
+
+def rebuild_charts(labels, regular, contract, rates):
+    x = list(range(len(labels)))
+    line_fig = Figure(figsize=(4.2, 3.2), dpi=100)
+    line_ax = line_fig.add_subplot(111)
+    line_ax.plot(x, rates, marker="o", color=THEME["line"], label="Rate")
+    for idx, rate in enumerate(rates):
+        line_ax.annotate(
+            f"{rate:.1f}%",
+            (x[idx], rate),
+            textcoords="offset points",
+            xytext=(0, 6),
+            ha="center",
+            fontsize=8,
+        )
+    line_ax.set_xticks(x)
+    line_ax.set_xticklabels(labels, rotation=45, ha="right")
+    line_ax.set_ylim(0, 100)
+    line_ax.legend(loc="upper right")
+    line_fig.tight_layout()
+    FigureCanvasAgg(line_fig).draw()
+
+    bar_fig = Figure(figsize=(4.6, 3.2), dpi=100)
+    bar_ax = bar_fig.add_subplot(111)
+    bar_ax.bar(x, regular, label="Regular", color=THEME["bar_primary"])
+    bar_ax.bar(x, contract, bottom=regular, label="Contract", color=THEME["bar_accent"])
+    for idx, (reg, con) in enumerate(zip(regular, contract)):
+        bar_ax.text(x[idx], reg / 2, f"{reg}", ha="center", va="center", fontsize=8)
+        bar_ax.text(
+            x[idx], reg + con / 2, f"{con}", ha="center", va="center", fontsize=8
+        )
+    bar_ax.set_xticks(x)
+    bar_ax.set_xticklabels(labels, rotation=45, ha="right")
+    bar_ax.legend(loc="upper right")
+    bar_fig.tight_layout()
+    FigureCanvasAgg(bar_fig).draw()
+
+
+def run_rebuild(refreshes, days):
+    for seed in range(refreshes):
+        rebuild_charts(*make_series(days, seed))
+
+
+def run_update(refreshes, days):
+    rate_chart = AttendanceRateChart()
+    count_chart = AttendanceCountChart()
+    for seed in range(refreshes):
+        labels, regular, contract, rates = make_series(days, seed)
+        rate_chart.update(labels, rates, THEME, RATE_TEXTS)
+        count_chart.update(labels, regular, contract, THEME, COUNT_TEXTS)
+        rate_chart.canvas.draw()
+        count_chart.canvas.draw()
+
+
+def measure(run, refreshes, days):
+    tracemalloc.start()
+    started = time.perf_counter()
+    run(refreshes, days)
+    elapsed = time.perf_counter() - started
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--refreshes", type=int, default=50)
+    parser.add_argument("--days", type=int, default=31)
+    args = parser.parse_args()
+
+    results = {}
+    for name, run in (("rebuild", run_rebuild), ("update", run_update)):
+        elapsed, peak = measure(run, args.refreshes, args.days)
+        results[name] = elapsed
+        per_refresh = elapsed / args.refreshes * 1000
+        print(
+            f"{name:>7}: {elapsed:7.2f} s  ({per_refresh:.1f} ms/refresh, "
+            f"peak {peak / 1024 / 1024:.1f} MiB)"
+        )
+    print(f"speedup: x{results['rebuild'] / results['update']:.1f}")
+
+
+if __name__ == "__main__":
+    main()
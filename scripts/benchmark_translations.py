@@ -0,0 +1,69 @@
+"""
+Benchmark translation lookups: nested dict walk vs the flattened index.
+
+Every key of the shipped locales is looked up ``--rounds`` times, plus the
+same number of missing keys (which fall through to the default text):
+
+* ``nested`` - the original ``get_text``: split the dotted key and walk the
+  nested dicts of the current language;
+* ``flat``   - ``LanguageManager.get_text``: one lookup in the per-language
+  index with the fallback languages merged in at load time.
+
+Usage: python scripts/benchmark_translations.py [--rounds 200]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from frontend.main import LanguageManager, flatten_translations  # noqa: E402
+
+
+def nested_get_text(manager, key, default_text=""):
+    try:
+        current = manager.translations[manager.current_language]
+        for part in key.split("."):
+            current = current.get(part, {})
+        if isinstance(current, str):
+            return current
+        return default_text or key
+    except (TypeError, AttributeError):
+        return default_text or key
+
+
+def flat_get_text(manager, key, default_text=""):
+    return manager.get_text(key, default_text)
+
+
+def time_lookups(lookup, manager, keys, rounds):
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for key in keys:
+            lookup(manager, key, "default")
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    manager = LanguageManager(str(PROJECT_ROOT / "frontend" / "public" / "locales"))
+    keys = list(flatten_translations(manager.translations[manager.current_language]))
+    keys += [f"missing.{key}" for key in keys]
+    lookups = len(keys) * args.rounds
+    results = {}
+    for name, lookup in (("nested", nested_get_text), ("flat", flat_get_text)):
+        results[name] = time_lookups(lookup, manager, keys, args.rounds)
+        per_call = results[name] / lookups * 1e9
+        print(f"{name:>6}: {results[name] * 1000:8.1f} ms  ({per_call:.0f} ns/lookup)")
+    print(f"speedup: x{results['nested'] / results['flat']:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Rebuild and verify the daily_attendance_rollup table.
+
+Regenerates every rollup row from the raw attendance/overtime entries of the
+visible reports, then re-aggregates and compares.  With --verify-only the
+table is only checked.
+
+Usage: python scripts/rebuild_attendance_rollup.py [--verify-only]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from models import SessionLocal, init_db  # noqa: E402
+from reporting import rebuild_attendance_rollup, verify_attendance_rollup  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--verify-only",
+        action="store_true",
+        help="check the rollup without rewriting it",
+    )
+    args = parser.parse_args()
+
+    init_db()
+    with SessionLocal() as session:
+        if not args.verify_only:
+            count = rebuild_attendance_rollup(session)
+            session.commit()
+            print(f"rebuilt {count} rollup row(s)")
+        mismatched = verify_attendance_rollup(session)
+
+    if mismatched:
+        print(f"{len(mismatched)} rollup row(s) differ from raw entries:")
+        for day, shift, area in mismatched:
+            print(f"  {day} {shift} {area}")
+        return 1
+    print("rollup matches raw entries")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
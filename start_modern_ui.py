@@ -13,15 +13,29 @@ from tkinter import ttk
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-# 導入現代化框架
-from frontend.src.components.modern_main_frame import ModernMainFrame
-from frontend.main import LanguageManager
+# --profile-startup[=PATH]：在匯入框架前開始記錄，才能量到模組匯入時間
+import startup_profiler
+
+startup_profiler.start_from_argv()
+
+# 與 handover_system.py 共用依賴檢查與資料庫初始化，兩個入口的啟動分析階段一致
+from handover_system import check_dependencies, initialize_database
 
 
 def main():
     """メイン関数"""
+    with startup_profiler.phase("dependency_check"):
+        check_dependencies()
+    initialize_database()
+
+    # 導入現代化框架
+    with startup_profiler.phase("import_ui"):
+        from frontend.src.components.modern_main_frame import ModernMainFrame
+        from frontend.main import LanguageManager
+
     # 創建主視窗
-    root = tk.Tk()
+    with startup_profiler.phase("create_root"):
+        root = tk.Tk()
     root.title("電子引き継ぎシステム V 0.1.5 - モダンUI")
     root.geometry("1300x800")
     
@@ -36,10 +50,13 @@ def main():
     
     # 創建語言管理器
     locales_dir = project_root / "frontend" / "public" / "locales"
-    lang_manager = LanguageManager(str(locales_dir))
+    with startup_profiler.phase("language_manager"):
+        lang_manager = LanguageManager(str(locales_dir))
     
     # 創建現代化主框架
-    modern_frame = ModernMainFrame(root, lang_manager)
+    with startup_profiler.phase("main_frame"):
+        modern_frame = ModernMainFrame(root, lang_manager)
+    startup_profiler.finish_on_idle(root)
     
     # 啟動主循環
     print("🚀 電子引き継ぎシステムのモダンUIを起動しました")
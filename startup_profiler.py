@@ -0,0 +1,213 @@
+"""Startup phase profiler behind the ``--profile-startup`` launcher flag.
+
+Records when each startup phase begins and how long it takes, times every
+module imported while profiling, and writes everything to a JSON report when
+the Tk event loop first goes idle.  When profiling is off, ``phase`` and
+``mark`` are no-ops so the launch path can stay instrumented.
+"""
+from __future__ import annotations
+
+import json
+import platform
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from importlib.abc import MetaPathFinder
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+PROFILE_FLAG = "--profile-startup"
+DEFAULT_REPORT_NAME = "startup_profile.json"
+
+_active: Optional["StartupProfiler"] = None
+
+
+class _TimedLoader:
+    """Wraps a module loader and times ``exec_module``.
+
+    The original loader is put back on the module afterwards, so nothing
+    outside the profiler ever sees the wrapper.
+    """
+
+    def __init__(self, loader, timer: "_ImportTimer"):
+        self._loader = loader
+        self._timer = timer
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        spec = module.__spec__
+        if spec is not None:
+            spec.loader = self._loader
+        module.__loader__ = self._loader
+        self._timer.enter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._timer.leave(module.__name__)
+
+
+class _ImportTimer(MetaPathFinder):
+    """Meta path hook recording cumulative and self import time per module."""
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self._profiler = profiler
+        self._stack: List[List[float]] = []
+        self._finding = set()
+        self.records: List[Dict] = []
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname in self._finding:
+            return None
+        self._finding.add(fullname)
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._finding.discard(fullname)
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self)
+        return spec
+
+    def enter(self):
+        self._stack.append([time.perf_counter(), 0.0])
+
+    def leave(self, name):
+        started, children = self._stack.pop()
+        elapsed = time.perf_counter() - started
+        if self._stack:
+            self._stack[-1][1] += elapsed
+        self.records.append(
+            {
+                "module": name,
+                "cumulative_ms": round(elapsed * 1000, 3),
+                "self_ms": round((elapsed - children) * 1000, 3),
+                "phase": self._profiler.current_phase,
+            }
+        )
+
+
+class StartupProfiler:
+    def __init__(self, report_path: Path):
+        self.report_path = Path(report_path)
+        self.started_at = datetime.now()
+        self._origin = time.perf_counter()
+        self.phases: List[Dict] = []
+        self.marks: List[Dict] = []
+        self.current_phase: Optional[str] = None
+        self._imports = _ImportTimer(self)
+        sys.meta_path.insert(0, self._imports)
+
+    def _elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self._origin) * 1000, 3)
+
+    @contextmanager
+    def phase(self, name: str):
+        outer = self.current_phase
+        self.current_phase = name
+        start_ms = self._elapsed_ms()
+        try:
+            yield
+        finally:
+            self.phases.append(
+                {
+                    "name": name,
+                    "start_ms": start_ms,
+                    "duration_ms": round(self._elapsed_ms() - start_ms, 3),
+                }
+            )
+            self.current_phase = outer
+
+    def mark(self, name: str) -> None:
+        self.marks.append({"name": name, "at_ms": self._elapsed_ms()})
+
+    def stop(self) -> None:
+        if self._imports in sys.meta_path:
+            sys.meta_path.remove(self._imports)
+
+    def report(self) -> Dict:
+        imports = sorted(
+            self._imports.records, key=lambda rec: rec["cumulative_ms"], reverse=True
+        )
+        return {
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "frozen": bool(getattr(sys, "frozen", False)),
+            "total_ms": self._elapsed_ms(),
+            "phases": self.phases,
+            "marks": self.marks,
+            "imports": imports,
+        }
+
+    def write(self) -> Path:
+        self.stop()
+        self.report_path.parent.mkdir(parents=True, exist_ok=True)
+        self.report_path.write_text(
+            json.dumps(self.report(), ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+        return self.report_path
+
+
+def report_path_from_argv(argv: Sequence[str]) -> Optional[Path]:
+    """Return the report path if ``--profile-startup[=PATH]`` is in ``argv``."""
+    for arg in argv:
+        if arg == PROFILE_FLAG:
+            return Path(DEFAULT_REPORT_NAME)
+        if arg.startswith(PROFILE_FLAG + "="):
+            return Path(arg.split("=", 1)[1] or DEFAULT_REPORT_NAME)
+    return None
+
+
+def start_from_argv(
+    argv: Optional[Sequence[str]] = None,
+) -> Optional[StartupProfiler]:
+    """Start profiling when the launcher was given ``--profile-startup``."""
+    global _active
+    if _active is None:
+        path = report_path_from_argv(sys.argv[1:] if argv is None else argv)
+        if path is not None:
+            _active = StartupProfiler(path)
+    return _active
+
+
+@contextmanager
+def phase(name: str):
+    if _active is None:
+        yield
+        return
+    with _active.phase(name):
+        yield
+
+
+def mark(name: str) -> None:
+    if _active is not None:
+        _active.mark(name)
+
+
+def finish_on_idle(root) -> None:
+    """Write the report once the Tk event loop first goes idle."""
+    if _active is None:
+        return
+
+    def _finish():
+        global _active
+        profiler, _active = _active, None
+        if profiler is None:
+            return
+        profiler.mark("first_idle")
+        path = profiler.write()
+        print(f"啟動分析報告已寫入: {path.resolve()}")
+
+    root.after_idle(_finish)
@@ -0,0 +1,106 @@
+"""
+背景查詢執行器 (BackgroundQueryRunner) 測試
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from frontend.src.utils.background_query import BackgroundQueryRunner  # noqa: E402
+
+
+class _FakeTkWidget:
+    """Collects after() callbacks so the test can pump them like mainloop."""
+
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, _ms, callback):
+        self.callbacks.append(callback)
+        return len(self.callbacks)
+
+    def after_cancel(self, _after_id):
+        pass
+
+    def pump(self, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while self.callbacks and time.monotonic() < deadline:
+            callback = self.callbacks.pop(0)
+            callback()
+            time.sleep(0.01)
+
+
+def _runner(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'query.db'}", future=True)
+    widget = _FakeTkWidget()
+    runner = BackgroundQueryRunner(widget, session_factory=sessionmaker(bind=engine))
+    return engine, widget, runner
+
+
+def test_results_are_delivered_on_the_polling_thread(tmp_path):
+    engine, widget, runner = _runner(tmp_path)
+    delivered = []
+    done = []
+
+    runner.submit(
+        "page",
+        lambda db: (db.execute(text("SELECT 41 + 1")).scalar(), threading.get_ident()),
+        delivered.append,
+        on_done=lambda: done.append(threading.get_ident()),
+    )
+    widget.pump()
+
+    (value, worker_thread), = delivered
+    assert value == 42
+    assert worker_thread != threading.get_ident()
+    assert done == [threading.get_ident()]
+    runner.shutdown()
+    engine.dispose()
+
+
+def test_superseded_and_cancelled_jobs_are_dropped(tmp_path):
+    engine, widget, runner = _runner(tmp_path)
+    release = threading.Event()
+    delivered = []
+    errors = []
+
+    def _slow(db):
+        release.wait(2)
+        return "stale"
+
+    runner.submit("page", _slow, delivered.append, on_error=errors.append)
+    runner.submit("page", lambda db: "fresh", delivered.append, on_error=errors.append)
+    runner.submit("other", lambda db: "cancelled", delivered.append)
+    runner.cancel("other")
+    release.set()
+    widget.pump()
+
+    assert delivered == ["fresh"]
+    assert errors == []
+    runner.shutdown()
+    engine.dispose()
+
+
+def test_errors_are_routed_to_on_error(tmp_path):
+    engine, widget, runner = _runner(tmp_path)
+    errors = []
+
+    runner.submit(
+        "page",
+        lambda db: db.execute(text("SELECT * FROM missing_table")).all(),
+        lambda result: None,
+        on_error=errors.append,
+    )
+    widget.pump()
+
+    assert len(errors) == 1
+    assert "missing_table" in str(errors[0])
+    runner.shutdown()
+    engine.dispose()
@@ -0,0 +1,71 @@
+"""
+資料夾批次匯入 (batch_import) 測試
+"""
+
+import sys
+from datetime import date
+from pathlib import Path
+
+from openpyxl import Workbook
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from frontend.src.utils.batch_import import (  # noqa: E402
+    DELAY,
+    find_import_files,
+    merge_results,
+    parse_import_files,
+)
+
+
+def _write_delay_xlsx(path, reactor, day):
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(["Date", "Reactor", "Lot"])
+    sheet.append([day, reactor, f"L-{reactor}"])
+    workbook.save(path)
+
+
+def test_folder_is_parsed_in_parallel_and_merged_in_file_order(tmp_path):
+    _write_delay_xlsx(tmp_path / "b_group.xlsx", "R2", "2024-06-02")
+    _write_delay_xlsx(tmp_path / "a_group.xlsx", "R1", "2024-06-01")
+    (tmp_path / "c_group.csv").write_text("Date,Reactor\n2024-06-03,R3\n")
+    (tmp_path / "d_broken.xlsx").write_bytes(b"not a workbook")
+    (tmp_path / "~$a_group.xlsx").write_bytes(b"lock")
+    (tmp_path / "notes.md").write_text("ignored")
+    progress = []
+
+    paths = find_import_files(str(tmp_path))
+    results = parse_import_files(
+        DELAY,
+        paths,
+        max_workers=2,
+        on_result=lambda result, done, total: progress.append((done, total)),
+    )
+
+    assert [Path(path).name for path in paths] == [
+        "a_group.xlsx",
+        "b_group.xlsx",
+        "c_group.csv",
+        "d_broken.xlsx",
+    ]
+    assert [result.path for result in results] == paths
+    assert results[3].error is not None and results[3].records == []
+    assert progress[-1] == (4, 4)
+    records = merge_results(results)
+    assert [(rec["delay_date"], rec["reactor"]) for rec in records] == [
+        (date(2024, 6, 1), "R1"),
+        (date(2024, 6, 2), "R2"),
+        (date(2024, 6, 3), "R3"),
+    ]
+
+
+def test_glob_source_and_in_process_single_file(tmp_path):
+    _write_delay_xlsx(tmp_path / "only.xlsx", "R9", "2024-07-01")
+
+    paths = find_import_files(str(tmp_path / "*.xlsx"))
+    results = parse_import_files(DELAY, paths)
+
+    assert len(results) == 1 and results[0].error is None
+    assert results[0].records[0]["reactor"] == "R9"
@@ -0,0 +1,165 @@
+"""
+摘要圖表離屏繪製與 PNG 快取 (chart_images) 測試
+"""
+
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from frontend.src.utils.chart_images import (  # noqa: E402
+    DEFAULT_CHART_SIZE,
+    ChartImageCache,
+    ChartImageRenderer,
+    chart_image_size,
+    summary_chart_requests,
+)
+
+THEME = {
+    "face": "#ffffff",
+    "grid": "#d0d7de",
+    "text": "#1f2328",
+    "line": "#1a7f37",
+    "bar_primary": "#0969da",
+    "bar_accent": "#bf8700",
+}
+RATE_TEXTS = {"title": "Rate", "series": "Rate", "axis": "%", "empty": "-"}
+COUNT_TEXTS = {
+    "title": "Headcount",
+    "regular": "Regular",
+    "contract": "Contract",
+    "axis": "People",
+    "empty": "-",
+}
+
+
+class _FakeTkWidget:
+    """Collects after() callbacks so the test can pump them like mainloop."""
+
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, _ms, callback):
+        self.callbacks.append(callback)
+        return len(self.callbacks)
+
+    def after_cancel(self, _after_id):
+        pass
+
+    def pump(self, timeout=30.0):
+        deadline = time.monotonic() + timeout
+        while self.callbacks and time.monotonic() < deadline:
+            callback = self.callbacks.pop(0)
+            callback()
+            time.sleep(0.01)
+
+
+def _requests(rates=(90.0, 80.0), theme=THEME, language="zh", size=None):
+    labels = ["2024-03-01", "2024-03-02"]
+    return summary_chart_requests(
+        labels,
+        list(rates),
+        [8, 9],
+        [2, 1],
+        RATE_TEXTS,
+        COUNT_TEXTS,
+        theme,
+        language,
+        size,
+    )
+
+
+def _png_size(png):
+    return struct.unpack(">II", png[16:24])
+
+
+def _keys(requests):
+    return {kind: key for kind, (key, _kwargs) in requests.items()}
+
+
+def test_keys_follow_data_theme_and_language():
+    base = _keys(_requests())
+    assert base == _keys(_requests())
+    assert base["rate"] != base["count"]
+
+    # 出勤率改變只影響出勤率圖；主題與語言改變兩張圖都要重繪
+    changed_rates = _keys(_requests(rates=(90.0, 70.0)))
+    assert changed_rates["rate"] != base["rate"]
+    assert changed_rates["count"] == base["count"]
+    dark = dict(THEME, face="#0d1117")
+    resized = _requests(size=(640, 445))
+    for changed in (_requests(theme=dark), _requests(language="en"), resized):
+        assert set(_keys(changed).values()).isdisjoint(base.values())
+
+
+def test_rendered_images_are_reused_from_disk(tmp_path):
+    requests = _requests()
+    renderer = ChartImageRenderer(cache=ChartImageCache(tmp_path))
+    images = renderer.render(requests)
+    assert all(png.startswith(b"\x89PNG") for png in images.values())
+    for kind, key in _keys(requests).items():
+        assert renderer.cache.path(key).read_bytes() == images[kind]
+    renderer.shutdown()
+
+    # 重新啟動後 (新的記憶體快取) 直接讀取磁碟上的 PNG，不再繪圖
+    restarted = ChartImageRenderer(cache=ChartImageCache(tmp_path))
+    shown = []
+    assert restarted.show(requests, shown.append) is True
+    assert shown == [images]
+    assert restarted._charts == {}
+    restarted.shutdown()
+
+
+def test_images_are_drawn_at_the_requested_size(tmp_path):
+    renderer = ChartImageRenderer(cache=ChartImageCache(tmp_path))
+    wide = renderer.render(_requests(size=chart_image_size(655)))
+    narrow = renderer.render(_requests(size=chart_image_size(0)))
+    # 同一個 Figure 重繪成不同大小
+    assert {_png_size(png) for png in wide.values()} == {(640, 445)}
+    assert {_png_size(png) for png in narrow.values()} == {DEFAULT_CHART_SIZE}
+    renderer.shutdown()
+
+
+def test_chart_image_size_follows_slot_width_in_steps():
+    assert chart_image_size(1) == DEFAULT_CHART_SIZE
+    assert chart_image_size(100) == (320, 223)
+    assert chart_image_size(479) == chart_image_size(440) == (440, 306)
+
+
+def test_show_renders_on_worker_and_latest_request_wins(tmp_path):
+    widget = _FakeTkWidget()
+    renderer = ChartImageRenderer(widget, cache=ChartImageCache(tmp_path))
+    delivered = []
+    threads = []
+
+    def on_ready(images):
+        threads.append(threading.get_ident())
+        delivered.append(images)
+
+    stale = _requests(rates=(10.0, 20.0))
+    latest = _requests(rates=(30.0, 40.0))
+    assert renderer.show(stale, on_ready) is False
+    assert renderer.show(latest, on_ready) is False
+    widget.pump()
+
+    assert len(delivered) == 1
+    assert threads == [threading.get_ident()]
+    assert delivered[0] == renderer.cached(latest)
+    renderer.shutdown()
+
+
+def test_disk_cache_keeps_at_most_max_files(tmp_path):
+    cache = ChartImageCache(tmp_path, max_entries=1, max_files=2)
+    for idx in range(4):
+        cache.put(f"key{idx}", b"png%d" % idx)
+        time.sleep(0.01)
+    assert sorted(path.name for path in tmp_path.glob("*.png")) == [
+        "key2.png",
+        "key3.png",
+    ]
+    assert cache.get("key0") is None
+    assert cache.get("key2") == b"png2"
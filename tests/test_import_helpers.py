@@ -0,0 +1,220 @@
+"""
+Excel/CSV 串流匯入 (import_helpers) 測試
+"""
+
+import sys
+from datetime import date, datetime
+from pathlib import Path
+
+import pytest
+from openpyxl import Workbook
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from frontend.src.utils.import_helpers import (  # noqa: E402
+    MissingSummaryDateError,
+    delay_column_map,
+    iter_delay_column_chunks,
+    iter_delay_records,
+    iter_sheet_rows,
+    iter_summary_actual_records,
+    list_sheet_names,
+    read_table,
+    sniff_csv_format,
+)
+from scripts.benchmark_csv_import import (  # noqa: E402
+    read_python,
+    read_table_rows,
+    time_path,
+    write_delay_csv,
+)
+
+
+def _write_xlsx(path, rows, title="Sheet1"):
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = title
+    for row in rows:
+        sheet.append(row)
+    workbook.save(path)
+
+
+def test_delay_records_stream_from_xlsx(tmp_path):
+    path = tmp_path / "delay.xlsx"
+    _write_xlsx(
+        path,
+        [
+            ["Delay list for the week (date in column A)"],
+            ["Date", "Time", "Reactor", "Process", "Lot", "Wafer", "Caution", "備考"],
+            [datetime(2024, 3, 1), "08-09", "R1", "ETCH", "L001", 3, "high", " x "],
+            [None, "", "R2", "", "", "", "", ""],
+            ["2024/3/2", None, "R2", "DEP", "L002", None, None, None],
+        ],
+        title="Delay",
+    )
+
+    assert list_sheet_names(str(path)) == ["Delay"]
+    records = list(iter_delay_records(iter_sheet_rows(str(path), "Delay")))
+
+    assert [rec["delay_date"] for rec in records] == [
+        date(2024, 3, 1),
+        date(2024, 3, 2),
+    ]
+    assert records[0]["wafer"] == "3"
+    assert records[0]["severity"] == "high"
+    assert records[0]["note"] == "x"
+    assert records[1]["time_range"] == "" and records[1]["process"] == "DEP"
+
+
+def test_delay_chunks_are_column_arrays_across_chunk_boundaries():
+    header = ("Date", "Reactor", "Lot", "Note")
+    rows = [header]
+    for day in range(1, 8):
+        rows.append((f"2024-04-0{day}", f"R{day}", None, f" n{day} "))
+    rows.append((45000, "R9", "L9", ""))
+    rows.append(("not a date", "R10"))
+    rows.append((datetime(2024, 4, 9, 13, 30), "R11"))
+
+    chunks = list(iter_delay_column_chunks(rows, chunk_rows=3))
+
+    assert [len(chunk["delay_date"]) for chunk in chunks] == [3, 3, 1, 1]
+    assert delay_column_map(header)["lot"] == 2
+    merged = {key: sum((c[key] for c in chunks), []) for key in chunks[0]}
+    assert merged["delay_date"][-1] == date(2024, 4, 9)
+    assert merged["reactor"] == ["R1", "R2", "R3", "R4", "R5", "R6", "R7", "R11"]
+    assert set(merged["lot"]) == {""} and merged["note"][0] == "n1"
+    assert all(len(values) == 8 for values in merged.values())
+
+
+def test_delay_dates_in_yyyymmdd_text_are_kept():
+    header = ("Date", "Reactor")
+    rows = [header, ("20240105", "R1"), (" 20240106 ", "R2"), (20240107, "R3")]
+    rows.append(("2024-01-08", "R4"))
+
+    columns = next(iter_delay_column_chunks(rows))
+
+    # 文字的 yyyymmdd 為日期；數值儲存格 (Excel 序號等) 不是
+    assert columns["delay_date"] == [
+        date(2024, 1, 5),
+        date(2024, 1, 6),
+        date(2024, 1, 8),
+    ]
+    assert columns["reactor"] == ["R1", "R2", "R4"]
+
+
+def test_summary_actual_date_and_header_in_one_pass(tmp_path):
+    path = tmp_path / "summary.csv"
+    path.write_text(
+        "Summary(Actual);;;;\n"
+        ";2024-05-06;;;\n"
+        "No;Type;Item;Plan;Completed;In Process\n"
+        "1;Logic;A;10;4;6\n"
+        "2;Logic;B;0;0;0\n"
+        "3;;Memory;5.0;5;\n",
+        encoding="utf-8",
+    )
+
+    records = list(iter_summary_actual_records(iter_sheet_rows(str(path))))
+
+    assert [(rec["label"], rec["plan"], rec["in_process"]) for rec in records] == [
+        ("Logic A", 10, 6),
+        ("Memory", 5, 0),
+    ]
+    assert {rec["summary_date"] for rec in records} == {date(2024, 5, 6)}
+
+
+def test_summary_actual_without_date_is_rejected(tmp_path):
+    path = tmp_path / "summary.xlsx"
+    _write_xlsx(
+        path,
+        [["Summary"], [None, "n/a"], ["No", "Type", "Item", "Plan", "Completed"]],
+    )
+
+    with pytest.raises(MissingSummaryDateError):
+        list(iter_summary_actual_records(iter_sheet_rows(str(path))))
+
+
+@pytest.fixture
+def delay_csv(tmp_path):
+    """cp932、分號分隔、含標題列的 MES 延遲匯出檔 (20k 筆)"""
+    return write_delay_csv(str(tmp_path / "delay.csv"), 20_000)
+
+
+def test_csv_format_is_sniffed_from_a_sample(tmp_path, delay_csv):
+    assert sniff_csv_format(delay_csv) == ("cp932", ";", 8)
+
+    path = tmp_path / "tabs.txt"
+    path.write_text("title\nDate\tReactor\t備考\n2024-06-01\tR1\tx\n", "utf-8-sig")
+    assert sniff_csv_format(str(path)) == ("utf-8-sig", "\t", 3)
+
+
+@pytest.mark.parametrize(
+    "text", ["日期,時間,機台,工程,早班", "機台", "正常", "設備", "早班"]
+)
+def test_big5_csv_is_not_taken_for_cp932(tmp_path, text):
+    # 這些 Big5 位元組也能以 cp932 解碼 (成為半形片假名亂碼)
+    path = tmp_path / "big5.csv"
+    path.write_text(f"{text}\n2024/03/01,08:00,R1,ETCH,x\n", encoding="cp950")
+    assert sniff_csv_format(str(path))[0] == "cp950"
+    assert next(iter_sheet_rows(str(path)))[0] == text.split(",")[0]
+
+
+def test_csv_with_ascii_sample_streams_later_non_ascii_rows(tmp_path):
+    path = tmp_path / "ascii_head.csv"
+    ascii_rows = [f"2024/03/01,08:00,R{i % 12},ETCH,L{i:06d}" for i in range(4000)]
+    lines = ["Date,Time,Reactor,Process,Lot"] + ascii_rows
+    lines += ["2024/03/02,09:00,R1,機台,早班", "2024/03/02,10:00,R2,設備,正常"]
+    path.write_text("\n".join(lines) + "\n", encoding="cp950")
+    assert path.stat().st_size > 64 * 1024
+
+    assert sniff_csv_format(str(path)) == ("cp950", ",", 5)
+    rows = list(iter_sheet_rows(str(path)))
+    assert len(rows) == 4003
+    assert rows[-2][3:] == ("機台", "早班") and rows[-1][3:] == ("設備", "正常")
+    assert read_table(str(path)).iloc[-1, 3] == "設備"
+
+
+def test_csv_decode_error_while_streaming_falls_back(tmp_path, monkeypatch):
+    from frontend.src.utils import import_helpers
+
+    path = tmp_path / "late.csv"
+    lines = [f"2024/03/01,R{i % 12},L{i:06d}" for i in range(3000)]
+    lines += ["2024/03/02,R1,機台", "2024/03/02,R2,日期"]
+    path.write_text("\n".join(lines) + "\n", encoding="cp950")
+    # 取樣判斷錯誤 (例如只看到 ASCII) 時，讀到非 ASCII 列才改用可解碼的編碼
+    monkeypatch.setattr(
+        import_helpers, "sniff_csv_format", lambda _path: ("utf-8-sig", ",", 3)
+    )
+    rows = list(iter_sheet_rows(str(path)))
+    assert len(rows) == 3002 and rows[0] == ("2024/03/01", "R0", "L000000")
+    assert [row[2] for row in rows[-2:]] == ["機台", "日期"]
+    assert read_table(str(path)).iloc[-1, 2] == "日期"
+
+    # 截斷的雙位元組字元：沒有任何候選編碼能解碼整個檔案
+    path.write_bytes(path.read_bytes() + b"2024/03/03,R3,\x81\n")
+    with pytest.raises(ValueError):
+        list(iter_sheet_rows(str(path)))
+
+
+def test_read_table_csv_keeps_text_and_ragged_rows(tmp_path, delay_csv):
+    frame = read_table(delay_csv)
+    assert frame.shape == (20_002, 8)
+    assert frame.iloc[0, 0] == "遅延リスト" and frame.iloc[1, 7] == "備考"
+    assert frame.iloc[2, 5] == "0" and frame.iloc[2, 7] == "再処理"
+
+    path = tmp_path / "ragged.csv"
+    path.write_text("Title\nDate,Reactor,Lot\n2024-06-01,R1,007\n", "utf-8")
+    frame = read_table(str(path))
+    assert frame.shape == (3, 3) and frame.iloc[2, 2] == "007"
+
+    records = list(iter_delay_records(iter_sheet_rows(delay_csv)))
+    assert len(records) == 20_000 and records[0]["note"] == "再処理"
+
+
+def test_csv_read_table_stays_ahead_of_python_engine(delay_csv):
+    # 平常約快 2~4 倍；寬鬆門檻只在退回 Python 引擎等級時失敗
+    python_time, _ = time_path(read_python, delay_csv)
+    c_time, count = time_path(read_table_rows, delay_csv)
+    assert count == 20_002
+    assert c_time * 1.2 < python_time
@@ -0,0 +1,115 @@
+"""
+背景匯入工作 (ImportJobRunner) 測試
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from frontend.src.utils.import_jobs import ImportJobRunner  # noqa: E402
+
+
+class _FakeTkWidget:
+    """Collects after() callbacks so the test can pump them like mainloop."""
+
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, _ms, callback):
+        self.callbacks.append(callback)
+        return len(self.callbacks)
+
+    def after_cancel(self, _after_id):
+        pass
+
+    def pump(self, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while self.callbacks and time.monotonic() < deadline:
+            callback = self.callbacks.pop(0)
+            callback()
+            time.sleep(0.01)
+
+
+def test_progress_and_result_are_delivered_on_the_polling_thread():
+    widget = _FakeTkWidget()
+    runner = ImportJobRunner(widget)
+    progress, results, done = [], [], []
+    seen = threading.Event()
+
+    def _on_progress(done_rows, total):
+        progress.append((done_rows, total))
+        seen.set()
+
+    def _work(job):
+        rows = list(job.track(range(1200), total=1200, every=500))
+        seen.wait(2)
+        return threading.get_ident(), len(rows)
+
+    runner.start(
+        "delay_import",
+        _work,
+        results.append,
+        on_progress=_on_progress,
+        on_done=lambda: done.append(threading.get_ident()),
+    )
+    widget.pump()
+
+    (worker_thread, count), = results
+    assert count == 1200 and worker_thread != threading.get_ident()
+    assert progress and {total for _, total in progress} == {1200}
+    assert done == [threading.get_ident()]
+    assert not runner.is_busy("delay_import")
+    runner.shutdown()
+
+
+def test_cancelled_job_skips_result_but_runs_on_done():
+    widget = _FakeTkWidget()
+    runner = ImportJobRunner(widget)
+    started = threading.Event()
+    results, errors, done = [], [], []
+
+    def _work(job):
+        started.set()
+        for _ in job.track(iter(lambda: 1, None), every=1):
+            time.sleep(0.001)
+
+    runner.start(
+        "summary_import",
+        _work,
+        results.append,
+        on_error=errors.append,
+        on_done=lambda: done.append(True),
+    )
+    started.wait(2)
+    assert runner.cancel("summary_import")
+    widget.pump()
+
+    assert results == [] and errors == [] and done == [True]
+    runner.shutdown()
+
+
+def test_superseded_job_runs_no_callbacks_and_errors_reach_on_error():
+    widget = _FakeTkWidget()
+    runner = ImportJobRunner(widget)
+    release = threading.Event()
+    calls = []
+
+    def _slow(job):
+        release.wait(2)
+        job.check()
+        return "stale"
+
+    def _broken(job):
+        raise ValueError("bad sheet")
+
+    runner.start("delay_import", _slow, calls.append, on_done=lambda: calls.append("x"))
+    runner.start("delay_import", _broken, calls.append, on_error=calls.append)
+    release.set()
+    widget.pump()
+
+    assert len(calls) == 1 and str(calls[0]) == "bad sheet"
+    runner.shutdown()
@@ -0,0 +1,194 @@
+"""
+匯入批次寫入 (import_service) 測試
+"""
+
+import sys
+from datetime import date
+from pathlib import Path
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from import_service import (  # noqa: E402
+    describe_import,
+    file_content_hash,
+    find_current_import,
+    list_import_history,
+    pending_fingerprint,
+    record_imports,
+    replace_delay_entries,
+    replace_summary_actual_entries,
+    supersede_imports,
+    upsert_delay_entries,
+)
+from models import Base, DelayEntry, SummaryActualEntry  # noqa: E402
+
+
+def _session():
+    engine = create_engine("sqlite://", future=True)
+    Base.metadata.create_all(engine)
+    return Session(engine, future=True)
+
+
+def test_delay_upload_replaces_only_dates_in_file_with_progress():
+    with _session() as session:
+        session.add_all(
+            [
+                DelayEntry(delay_date=date(2024, 1, 1), reactor="old"),
+                DelayEntry(delay_date=date(2024, 1, 2), reactor="keep"),
+            ]
+        )
+        session.commit()
+        records = [
+            {"delay_date": date(2024, 1, 1), "reactor": f"R{n}", "_pending_id": n}
+            for n in range(7)
+        ]
+        progress = []
+
+        inserted = replace_delay_entries(
+            session,
+            records,
+            chunk_rows=3,
+            progress=lambda done, total: progress.append((done, total)),
+        )
+        session.commit()
+
+        rows = session.scalars(select(DelayEntry).order_by(DelayEntry.id)).all()
+    assert inserted == 7
+    assert progress == [(3, 7), (6, 7), (7, 7)]
+    assert [row.reactor for row in rows] == ["keep"] + [f"R{n}" for n in range(7)]
+    assert all(row.imported_at is not None and row.lot == "" for row in rows)
+
+
+def test_delay_upsert_keeps_ids_and_reports_counts():
+    day = date(2024, 2, 1)
+    with _session() as session:
+        first = upsert_delay_entries(
+            session,
+            [
+                {"delay_date": day, "reactor": "R1", "lot": "L1", "note": "a"},
+                {"delay_date": day, "reactor": "R2", "lot": "L2", "note": "b"},
+                {"delay_date": day, "reactor": "R3", "lot": "L3", "note": "c"},
+            ],
+        )
+        session.commit()
+        ids = dict(session.execute(select(DelayEntry.reactor, DelayEntry.id)).all())
+
+        second = upsert_delay_entries(
+            session,
+            [
+                {"delay_date": day, "reactor": "R1", "lot": "L1", "note": "a"},
+                {"delay_date": day, "reactor": "R2", "lot": "L2", "note": "x"},
+                {"delay_date": day, "reactor": "R4", "lot": "L4", "_pending_id": 9},
+                {"delay_date": day, "reactor": "R4", "lot": "L4", "note": "last"},
+            ],
+            chunk_rows=1,
+        )
+        session.commit()
+        rows = {
+            row.reactor: (row.id, row.note)
+            for row in session.scalars(select(DelayEntry))
+        }
+
+    assert first == (3, 0, 0, 0)
+    # 檔案內重複的 R4 以最後一筆為準，另計入 duplicates
+    assert second == (1, 1, 1, 1)
+    assert rows["R1"] == (ids["R1"], "a")
+    assert rows["R2"] == (ids["R2"], "x")
+    assert rows["R3"] == (ids["R3"], "c")
+    assert rows["R4"][1] == "last"
+
+
+def test_summary_upload_and_empty_upload():
+    with _session() as session:
+        assert replace_summary_actual_entries(session, []) == 0
+        replace_summary_actual_entries(
+            session,
+            [{"summary_date": date(2024, 5, 6), "label": "Logic A", "plan": 10}],
+        )
+        replace_summary_actual_entries(
+            session,
+            [{"summary_date": date(2024, 5, 6), "label": "Logic A", "plan": 12}],
+        )
+        session.commit()
+        plans = session.scalars(select(SummaryActualEntry.plan)).all()
+    assert plans == [12]
+
+
+def test_ledger_recognizes_stored_content_until_its_dates_are_replaced(tmp_path):
+    path = tmp_path / "delay.csv"
+    path.write_text("Date,Reactor\n2024-01-01,R1\n")
+    content_hash = file_content_hash(str(path))
+    records = [{"delay_date": date(2024, 1, 1), "reactor": "R1"}]
+    other = [{"delay_date": date(2024, 1, 1), "reactor": "R2"}]
+
+    with _session() as session:
+        assert find_current_import(session, "delay", content_hash, None) is None
+        source = describe_import(
+            "delay", str(path), content_hash, None, records, "delay_date"
+        )
+        record_imports(session, [source], "op")
+        session.commit()
+
+        entry = find_current_import(session, "delay", content_hash, None)
+        assert (entry.file_name, entry.row_count, entry.dates) == (
+            "delay.csv",
+            1,
+            "2024-01-01",
+        )
+        assert not find_current_import(session, "summary_actual", content_hash, None)
+
+        record_imports(
+            session,
+            [describe_import("delay", "b.csv", "other", "", other, "delay_date")],
+        )
+        session.commit()
+        assert find_current_import(session, "delay", content_hash, None) is None
+        assert [e.file_name for e in list_import_history(session, "delay")] == [
+            "b.csv",
+            "delay.csv",
+        ]
+
+
+def test_hand_edits_supersede_ledger_entries_of_their_dates():
+    def source(name, content_hash, *days):
+        records = [{"summary_date": day} for day in days]
+        return describe_import(
+            "summary_actual", name, content_hash, "", records, "summary_date"
+        )
+
+    with _session() as session:
+        record_imports(
+            session,
+            [
+                source("may.xlsx", "may", date(2024, 5, 6), date(2024, 5, 7)),
+                source("june.xlsx", "june", date(2024, 6, 3)),
+            ],
+        )
+        record_imports(session, [source("other.xlsx", "other", date(2024, 4, 1))])
+        session.commit()
+
+        # 手動修改或刪除 5/7 的資料後，重新匯入 may.xlsx 不可被視為相同資料
+        assert supersede_imports(session, "summary_actual", [date(2024, 5, 7)]) == 1
+        session.commit()
+        assert find_current_import(session, "summary_actual", "may", "") is None
+        assert find_current_import(session, "summary_actual", "june", "")
+        assert supersede_imports(session, "summary_actual", []) == 0
+
+        # 重新匯入後又回到有效狀態
+        record_imports(session, [source("may.xlsx", "may", date(2024, 5, 7))])
+        session.commit()
+        entry = find_current_import(session, "summary_actual", "may", "")
+        assert entry.superseded_at is None and entry.dates == "2024-05-07"
+
+
+def test_pending_fingerprint_ignores_bookkeeping_keys_but_not_edits():
+    records = [{"delay_date": date(2024, 1, 1), "reactor": "R1"}]
+    staged = [dict(records[0], _pending_id=1)]
+
+    assert pending_fingerprint(staged) == pending_fingerprint(records)
+    staged[0]["reactor"] = "R9"
+    assert pending_fingerprint(staged) != pending_fingerprint(records)
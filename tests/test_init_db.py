@@ -0,0 +1,56 @@
+"""
+init_db 快速路徑（schema 版本與種子資料指紋）測試
+"""
+
+import sys
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import models  # noqa: E402
+
+
+def _use_temp_database(monkeypatch, tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'init.db'}", future=True)
+    monkeypatch.setattr(models, "engine", engine)
+    monkeypatch.setattr(
+        models,
+        "SessionLocal",
+        sessionmaker(bind=engine, autoflush=False, future=True),
+    )
+    return engine
+
+
+def test_second_start_takes_fast_path(monkeypatch, tmp_path):
+    engine = _use_temp_database(monkeypatch, tmp_path)
+    models.init_db()
+
+    with models.SessionLocal() as session:
+        assert session.query(models.User).filter_by(username="admin").count() == 1
+        assert session.query(models.ShiftOption).count() == 2
+        stamp = session.get(models.SchemaMeta, models.SEED_FINGERPRINT_KEY)
+        assert stamp is not None
+
+    calls = []
+    monkeypatch.setattr(
+        models.Base.metadata, "create_all", lambda *a, **kw: calls.append("create_all")
+    )
+    models.init_db()
+    assert calls == []
+    engine.dispose()
+
+
+def test_fingerprint_mismatch_runs_full_path(monkeypatch, tmp_path):
+    engine = _use_temp_database(monkeypatch, tmp_path)
+    models.init_db()
+    with engine.begin() as conn:
+        conn.exec_driver_sql("UPDATE schema_meta SET value = 'stale'")
+
+    assert not models._is_schema_current(models._schema_fingerprint("admin"))
+    models.init_db()
+    assert models._is_schema_current(models._schema_fingerprint("admin"))
+    engine.dispose()
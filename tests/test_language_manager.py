@@ -0,0 +1,117 @@
+"""
+語言管理器 (LanguageManager) 攤平翻譯索引與語言快取測試
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from frontend.main import LanguageManager, flatten_translations  # noqa: E402
+
+
+def _write_locales(locales_dir, catalogs):
+    locales_dir.mkdir(exist_ok=True)
+    for lang_code, catalog in catalogs.items():
+        (locales_dir / f"{lang_code}.json").write_text(
+            json.dumps(catalog, ensure_ascii=False), encoding="utf-8"
+        )
+
+
+def test_flatten_translations_keeps_only_text_leaves():
+    tree = {"header": {"title": "題", "menu": {"open": "開"}}, "count": 3, "x": ""}
+
+    assert flatten_translations(tree) == {
+        "header.title": "題",
+        "header.menu.open": "開",
+        "x": "",
+    }
+
+
+def test_lookup_uses_index_and_defaults_for_missing_keys(tmp_path):
+    locales_dir = tmp_path / "locales"
+    _write_locales(
+        locales_dir,
+        {
+            "ja": {"header": {"title": "電子引継ぎ"}, "empty": "", "menu": "メニュー"},
+            "zh": {"header": {"title": "電子交接", "extra": "中文"}},
+            "en": {
+                "header": {"title": "Handover", "extra": "English"},
+                "menu": {"open": "Open"},
+            },
+        },
+    )
+    manager = LanguageManager(str(locales_dir), cache_dir=tmp_path / "cache")
+
+    assert manager.get_text("header.title", "d") == "電子引継ぎ"
+    # 目前語言缺少的鍵返回呼叫端的默認文本，不取其他語言
+    assert manager.get_text("header.extra", "d") == "d"
+    assert manager.get_text("header.only") == "header.only"
+    assert manager.get_text("empty", "d") == ""
+    assert manager.get_text("header", "d") == "d"
+    assert list(manager.translations) == ["ja"]
+    # 路徑被字串遮蔽時才依 supported_languages 順序查其他語言
+    assert manager.get_text("menu.open", "d") == "Open"
+    assert manager.get_text("header.title.more") == "header.title.more"
+
+    manager.set_language("en")
+    assert manager.get_text("header.extra") == "English"
+
+    manager.translations["en"]["header"]["title"] = "Shift Handover"
+    manager.rebuild_index()
+    assert manager.get_text("header.title") == "Shift Handover"
+
+
+def test_only_active_language_loads_until_needed(tmp_path):
+    locales_dir = tmp_path / "locales"
+    _write_locales(
+        locales_dir,
+        {
+            "ja": {"a": "ja-a"},
+            "zh": {"a": "zh-a", "b": "zh-b"},
+            "en": {"a": "en-a"},
+        },
+    )
+    manager = LanguageManager(str(locales_dir), cache_dir=tmp_path / "cache")
+
+    assert list(manager.translations) == ["ja"]
+    assert manager.get_text("a") == "ja-a"
+    assert list(manager.translations) == ["ja"]
+
+    manager.set_language("en")
+    assert sorted(manager.translations) == ["en", "ja"]
+    # 查無鍵值不會載入其他語言
+    assert manager.get_text("b", "default") == "default"
+    assert sorted(manager.translations) == ["en", "ja"]
+
+
+def test_catalog_cache_skips_json_until_source_changes(tmp_path, monkeypatch):
+    locales_dir = tmp_path / "locales"
+    cache_dir = tmp_path / "cache"
+    _write_locales(locales_dir, {"ja": {"header": {"title": "旧"}}})
+    LanguageManager(str(locales_dir), cache_dir=cache_dir)
+    assert (cache_dir / "ja.marshal").exists()
+
+    def fail_json_load(_file):
+        raise AssertionError("JSON should not be parsed")
+
+    monkeypatch.setattr(json, "load", fail_json_load)
+    assert LanguageManager(str(locales_dir), cache_dir=cache_dir).get_text(
+        "header.title"
+    ) == "旧"
+
+    # 只有 mtime 變動 (例如打包版重新解壓) 時仍使用快取
+    source = locales_dir / "ja.json"
+    os.utime(source, ns=(0, source.stat().st_mtime_ns + 10**9))
+    assert LanguageManager(str(locales_dir), cache_dir=cache_dir).get_text(
+        "header.title"
+    ) == "旧"
+
+    monkeypatch.undo()
+    _write_locales(locales_dir, {"ja": {"header": {"title": "新しい"}}})
+    assert LanguageManager(str(locales_dir), cache_dir=cache_dir).get_text(
+        "header.title"
+    ) == "新しい"
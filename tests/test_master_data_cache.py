@@ -0,0 +1,60 @@
+"""
+班別/區域主資料快取 (MasterDataCache) 測試
+"""
+
+import sys
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from frontend.src.utils.master_data_cache import MasterDataCache  # noqa: E402
+from models import AreaOption, Base, ShiftOption  # noqa: E402
+
+
+def _cache(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'master.db'}", future=True)
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, future=True)
+    with factory() as db:
+        db.add_all([ShiftOption(name="Day"), AreaOption(name="litho")])
+        db.commit()
+    return engine, factory, MasterDataCache(session_factory=factory)
+
+
+def test_repeated_reads_do_not_query_until_invalidated(tmp_path):
+    engine, factory, cache = _cache(tmp_path)
+
+    assert cache.get() == (["Day"], ["litho"])
+    shifts, _areas = cache.get()
+    shifts.append("mutated")
+    assert cache.get() == (["Day"], ["litho"])
+    assert (cache.loads, cache.hits) == (1, 2)
+
+    cache.invalidate()
+    with factory() as db:
+        assert cache.get(db) == (["Day"], ["litho"])
+    assert cache.loads == 2
+    cache.close()
+    engine.dispose()
+
+
+def test_commit_from_another_connection_is_picked_up(tmp_path):
+    engine, factory, cache = _cache(tmp_path)
+    assert cache.get() == (["Day"], ["litho"])
+
+    # 另一台工作站 (另一個連線) 新增班別，不經過 invalidate()
+    other = create_engine(f"sqlite:///{tmp_path / 'master.db'}", future=True)
+    with sessionmaker(bind=other, future=True)() as db:
+        db.add(ShiftOption(name="Night"))
+        db.commit()
+
+    assert cache.get() == (["Day", "Night"], ["litho"])
+    assert cache.get() == (["Day", "Night"], ["litho"])
+    assert (cache.loads, cache.hits) == (2, 1)
+    cache.close()
+    other.dispose()
+    engine.dispose()
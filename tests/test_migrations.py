@@ -0,0 +1,121 @@
+"""
+資料庫遷移 (PRAGMA user_version) 測試
+"""
+
+import sys
+from pathlib import Path
+
+from sqlalchemy import create_engine, inspect
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from migrations import (  # noqa: E402
+    DELAY_DUPLICATES_BACKUP_TABLE,
+    SCHEMA_VERSION,
+    consume_migration_notices,
+    get_schema_version,
+    run_migrations,
+)
+from models import Base  # noqa: E402
+
+
+LEGACY_DDL = [
+    "CREATE TABLE users (id INTEGER PRIMARY KEY, username VARCHAR(50), "
+    "password_hash VARCHAR(128), role VARCHAR(20))",
+    "CREATE TABLE daily_reports (id INTEGER PRIMARY KEY, date DATE NOT NULL, "
+    "shift VARCHAR(20) NOT NULL, area VARCHAR(50) NOT NULL, author_id INTEGER, "
+    "created_at DATETIME, summary_key_output TEXT, summary_issues TEXT, "
+    "summary_countermeasures TEXT)",
+    "CREATE TABLE equipment_logs (id INTEGER PRIMARY KEY, report_id INTEGER, "
+    "equip_id VARCHAR(50), description TEXT, start_time VARCHAR(50), "
+    "impact_qty INTEGER, action_taken TEXT, image_path VARCHAR(255))",
+    "INSERT INTO daily_reports (id, date, shift, area, author_id) "
+    "VALUES (1, '2024-01-01', 'Day', 'litho', 1)",
+    "CREATE TABLE delay_entries (id INTEGER PRIMARY KEY, delay_date DATE NOT NULL, "
+    "time_range VARCHAR(50) DEFAULT '', reactor VARCHAR(50) DEFAULT '', "
+    "process VARCHAR(100) DEFAULT '', lot VARCHAR(50) DEFAULT '', "
+    "wafer VARCHAR(50) DEFAULT '', progress VARCHAR(100) DEFAULT '', "
+    "prev_steps VARCHAR(100) DEFAULT '', prev_time VARCHAR(50) DEFAULT '', "
+    "severity VARCHAR(50) DEFAULT '', action TEXT DEFAULT '', note TEXT DEFAULT '', "
+    "imported_at DATETIME)",
+    "INSERT INTO delay_entries (id, delay_date, reactor, note) VALUES "
+    "(1, '2024-01-01', 'R1', 'old'), (2, '2024-01-01', 'R1', 'new'), "
+    "(3, '2024-01-01', 'R2', '')",
+    "CREATE TABLE import_ledger (id INTEGER PRIMARY KEY, kind VARCHAR(30) NOT NULL, "
+    "content_hash VARCHAR(64) NOT NULL, file_name VARCHAR(255) NOT NULL, "
+    "sheet_name VARCHAR(100) NOT NULL, row_count INTEGER NOT NULL, "
+    "dates TEXT NOT NULL, imported_by VARCHAR(100) NOT NULL, "
+    "imported_at DATETIME NOT NULL)",
+]
+
+
+def _legacy_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}", future=True)
+    with engine.begin() as conn:
+        for ddl in LEGACY_DDL:
+            conn.exec_driver_sql(ddl)
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def test_legacy_database_is_upgraded(tmp_path):
+    engine = _legacy_engine(tmp_path)
+
+    assert run_migrations(engine) == SCHEMA_VERSION
+
+    inspector = inspect(engine)
+    report_columns = {col["name"] for col in inspector.get_columns("daily_reports")}
+    assert {"last_modified_by", "last_modified_at", "is_hidden"} <= report_columns
+    equipment_columns = {col["name"] for col in inspector.get_columns("equipment_logs")}
+    assert "impact_hours" in equipment_columns
+
+    report_indexes = {idx["name"] for idx in inspector.get_indexes("daily_reports")}
+    assert "ix_daily_reports_date_shift_area" in report_indexes
+    assert "ix_daily_reports_visible" in report_indexes
+    for table in ("attendance_entries", "overtime_entries", "equipment_logs", "lot_logs"):
+        names = {idx["name"] for idx in inspector.get_indexes(table)}
+        assert f"ix_{table}_report_id" in names
+    ledger_indexes = {idx["name"] for idx in inspector.get_indexes("import_ledger")}
+    assert "ix_import_ledger_kind_hash" in ledger_indexes
+    ledger_columns = {col["name"] for col in inspector.get_columns("import_ledger")}
+    assert "superseded_at" in ledger_columns
+    delay_indexes = {
+        idx["name"]: idx["unique"] for idx in inspector.get_indexes("delay_entries")
+    }
+    assert delay_indexes["ux_delay_entries_natural_key"]
+
+    with engine.connect() as conn:
+        hidden = conn.exec_driver_sql("SELECT is_hidden FROM daily_reports").scalar()
+        assert hidden == 0
+        rollup = conn.exec_driver_sql(
+            "SELECT date, shift, area, report_count, present FROM daily_attendance_rollup"
+        ).fetchall()
+        assert rollup == [("2024-01-01", "Day", "litho", 1, 0)]
+        delays = conn.exec_driver_sql(
+            "SELECT id, reactor, note FROM delay_entries ORDER BY id"
+        ).fetchall()
+        assert delays == [(2, "R1", "new"), (3, "R2", "")]
+        backup = conn.exec_driver_sql(
+            f"SELECT id, reactor, note FROM {DELAY_DUPLICATES_BACKUP_TABLE}"
+        ).fetchall()
+        assert backup == [(1, "R1", "old")]
+    assert consume_migration_notices() == [
+        {"kind": "delay_duplicates", "count": 1, "table": DELAY_DUPLICATES_BACKUP_TABLE}
+    ]
+    assert consume_migration_notices() == []
+    engine.dispose()
+
+
+def test_migrations_are_skipped_once_stamped(tmp_path):
+    engine = _legacy_engine(tmp_path)
+    run_migrations(engine)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX ix_lot_logs_report_id")
+
+    assert run_migrations(engine) == SCHEMA_VERSION
+    with engine.connect() as conn:
+        assert get_schema_version(conn) == SCHEMA_VERSION
+    names = {idx["name"] for idx in inspect(engine).get_indexes("lot_logs")}
+    assert "ix_lot_logs_report_id" not in names
+    engine.dispose()
@@ -0,0 +1,76 @@
+"""
+頁面快取 (PageCache) 與頁面翻譯註冊 (I18nRegistry) 測試
+"""
+
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from frontend.src.utils.i18n_helpers import I18nRegistry  # noqa: E402
+from frontend.src.utils.page_cache import PageCache  # noqa: E402
+
+
+class _FakeWidget:
+    def __init__(self):
+        self.text = None
+        self.alive = True
+
+    def config(self, text):
+        self.text = text
+
+    def winfo_exists(self):
+        return self.alive
+
+
+def _cache(**kwargs):
+    evicted = []
+    cache = PageCache(on_evict=lambda pid, frame: evicted.append(pid), **kwargs)
+    return cache, evicted
+
+
+def test_least_recently_used_page_is_evicted_first():
+    cache, evicted = _cache(max_pages=2)
+    cache.put("daily_report", "f1")
+    cache.put("attendance", "f2")
+    assert cache.get("daily_report") == "f1"
+    cache.put("equipment", "f3")
+
+    assert cache.evict(keep="equipment") == ["attendance"]
+    assert evicted == ["attendance"]
+    assert "daily_report" in cache and "attendance" not in cache
+
+
+def test_budget_eviction_never_drops_the_kept_page():
+    cache, evicted = _cache(max_pages=10, budget=100)
+    cache.put("summary", "f1", cost=80)
+    cache.put("delay_list", "f2", cost=150)
+
+    assert cache.evict(keep="delay_list") == ["summary"]
+    assert len(cache) == 1 and cache.total_cost == 150
+    cache.clear()
+    assert evicted == ["summary", "delay_list"]
+
+
+def test_page_texts_are_kept_per_page_and_reapplied_on_show():
+    registry = I18nRegistry()
+    title = _FakeWidget()
+    texts = {"a": "A", "b": "B"}
+    translate = lambda key, default: texts.get(key, default)  # noqa: E731
+
+    registry.set_active_page("daily_report")
+    registry.register(title, "a", "a", scope="page", translate=translate)
+    registry.set_active_page("summary")
+    registry.register(title, "b", "b", scope="page", translate=translate)
+    assert title.text == "B"
+
+    texts["a"] = "A2"
+    registry.set_active_page("daily_report", translate)
+    assert title.text == "A2"
+    registry.apply(translate)
+    assert title.text == "A2"
+
+    registry.clear_page("daily_report")
+    registry.set_active_page("daily_report", translate)
+    assert title.text == "A2"
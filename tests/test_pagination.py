@@ -0,0 +1,137 @@
+"""
+Keyset 分頁 (pagination) 測試
+"""
+
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, select, tuple_
+from sqlalchemy.orm import Session
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from models import Base, DailyReport, DelayEntry, EquipmentLog, User  # noqa: E402
+from pagination import (  # noqa: E402
+    REPORT_PAGE_KEY,
+    fetch_delay_page,
+    fetch_equipment_page,
+    fetch_report_page,
+)
+
+
+def _seed(session):
+    author = User(username="op", password_hash="x")
+    session.add(author)
+    session.flush()
+    start = date(2024, 1, 1)
+    for offset in range(20):
+        for shift in ("Day", "Night"):
+            for area in ("litho", "etching_D"):
+                report = DailyReport(
+                    date=start + timedelta(days=offset),
+                    shift=shift,
+                    area=area,
+                    author_id=author.id,
+                    is_hidden=1 if offset == 3 else 0,
+                )
+                session.add(report)
+                session.flush()
+                for n in range(2):
+                    session.add(EquipmentLog(report_id=report.id, equip_id=f"EQ{n}"))
+        for wafer, reactor in enumerate(("R2", "R1", "R1")):
+            session.add(
+                DelayEntry(
+                    delay_date=start + timedelta(days=offset),
+                    reactor=reactor,
+                    wafer=str(wafer),
+                )
+            )
+    session.commit()
+
+
+def _all_pages(fetch, limit):
+    rows, cursor, pages = [], None, 0
+    while True:
+        page = fetch(cursor, limit)
+        rows.extend(page.rows)
+        pages += 1
+        if page.next_cursor is None:
+            return rows, pages
+        cursor = page.next_cursor
+
+
+def test_pages_concatenate_to_the_full_ordered_range(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'page.db'}", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        _seed(session)
+        start, end = date(2024, 1, 1), date(2024, 1, 31)
+
+        reports, pages = _all_pages(
+            lambda cursor, limit: fetch_report_page(
+                session, start, end, cursor=cursor, limit=limit
+            ),
+            7,
+        )
+        keys = [(r.date, r.shift, r.area, r.id) for r in reports]
+        assert len(keys) == 76
+        assert keys == sorted(keys)
+        assert pages == 11
+        assert all(r.author.username == "op" for r in reports)
+
+        equipment, _ = _all_pages(
+            lambda cursor, limit: fetch_equipment_page(
+                session, start, end, "Night", "litho", cursor=cursor, limit=limit
+            ),
+            5,
+        )
+        assert len(equipment) == 38
+        assert {(row.report.shift, row.report.area) for row in equipment} == {
+            ("Night", "litho")
+        }
+
+        delays, _ = _all_pages(
+            lambda cursor, limit: fetch_delay_page(
+                session, start, date(2024, 1, 2), cursor=cursor, limit=limit
+            ),
+            2,
+        )
+        assert [(d.delay_date.day, d.reactor) for d in delays] == [
+            (1, "R1"),
+            (1, "R1"),
+            (1, "R2"),
+            (2, "R1"),
+            (2, "R1"),
+            (2, "R2"),
+        ]
+    engine.dispose()
+
+
+def test_last_page_has_no_cursor(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'page.db'}", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        _seed(session)
+        page = fetch_report_page(session, date(2024, 1, 1), date(2024, 1, 1), limit=4)
+        assert len(page.rows) == 4
+        assert page.next_cursor is None
+    engine.dispose()
+
+
+def test_report_page_order_follows_the_report_index():
+    engine = create_engine("sqlite://", future=True)
+    Base.metadata.create_all(engine)
+    stmt = (
+        select(DailyReport)
+        .where(DailyReport.is_hidden == 0, DailyReport.date >= date(2024, 1, 1))
+        .where(tuple_(*REPORT_PAGE_KEY) > tuple_(date(2024, 1, 1), "Day", "litho", 1))
+        .order_by(*REPORT_PAGE_KEY)
+        .limit(501)
+    )
+    sql = str(stmt.compile(engine, compile_kwargs={"literal_binds": True}))
+    with engine.connect() as conn:
+        plan = [row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")]
+    assert any("USING INDEX ix_daily_reports" in step for step in plan)
+    assert not any("TEMP B-TREE" in step for step in plan)
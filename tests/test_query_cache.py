@@ -0,0 +1,154 @@
+"""
+查詢結果快取 (QueryResultCache) 測試
+"""
+
+import sys
+from datetime import date
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from frontend.src.utils.query_cache import (  # noqa: E402
+    REPORT_LOG_TABLES,
+    SUMMARY_DASHBOARD_TABLES,
+    QueryResultCache,
+)
+from models import Base, DailyReport, DelayEntry, ShiftOption  # noqa: E402
+
+
+def _setup(tmp_path, **kwargs):
+    engine = create_engine(f"sqlite:///{tmp_path / 'cache.db'}", future=True)
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, future=True)
+    return engine, factory, QueryResultCache(session_factory=factory, **kwargs)
+
+
+def _report(day):
+    return DailyReport(date=day, shift="Day", area="litho", author_id=1)
+
+
+def _counter():
+    calls = []
+
+    def compute(value="result"):
+        calls.append(value)
+        return value
+
+    return calls, compute
+
+
+def test_lru_hits_and_eviction(tmp_path):
+    engine, _factory, cache = _setup(tmp_path, max_entries=2)
+    calls, compute = _counter()
+    key_a = ("summary_query", date(2024, 1, 1), date(2024, 1, 31), None, None)
+    key_b = key_a[:3] + ("D", None)
+    key_c = key_a[:3] + ("N", "litho")
+
+    cache.fetch(key_a, REPORT_LOG_TABLES, lambda: compute("a"))
+    cache.fetch(key_b, REPORT_LOG_TABLES, lambda: compute("b"))
+    assert cache.fetch(key_a, REPORT_LOG_TABLES, lambda: compute("a")) == "a"
+    cache.fetch(key_c, REPORT_LOG_TABLES, lambda: compute("c"))
+    cache.fetch(key_b, REPORT_LOG_TABLES, lambda: compute("b"))
+
+    assert calls == ["a", "b", "c", "b"]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 4, 2)
+    assert stats["hit_rate"] == 0.2
+    cache.close()
+    engine.dispose()
+
+
+def test_commit_drops_only_entries_reading_written_tables(tmp_path):
+    engine, factory, cache = _setup(tmp_path)
+    calls, compute = _counter()
+    dashboard = ("summary_dashboard", date(2024, 1, 1), date(2024, 1, 31), None, None)
+    abnormal = ("abnormal_history",) + dashboard[1:] + ("equip", None)
+
+    def fetch_both():
+        cache.fetch(dashboard, SUMMARY_DASHBOARD_TABLES, lambda: compute("dash"))
+        cache.fetch(abnormal, REPORT_LOG_TABLES, lambda: compute("abn"))
+
+    fetch_both()
+    # 與報表無關的資料表 (ORM flush 與 Core insert) 不影響快取
+    with factory() as db:
+        db.add(ShiftOption(name="Day"))
+        db.execute(insert(DelayEntry.__table__), [{"delay_date": date(2024, 1, 2)}])
+        db.commit()
+    fetch_both()
+    assert calls == ["dash", "abn"]
+
+    with factory() as db:
+        db.add(_report(date(2024, 1, 3)))
+        db.flush()
+        db.rollback()
+    fetch_both()
+    assert calls == ["dash", "abn"]
+
+    with factory() as db:
+        db.add(_report(date(2024, 1, 3)))
+        db.commit()
+    fetch_both()
+    assert calls == ["dash", "abn", "dash", "abn"]
+    cache.close()
+    engine.dispose()
+
+
+def test_foreign_commit_clears_and_inflight_result_is_not_stored(tmp_path):
+    engine, factory, cache = _setup(tmp_path)
+    calls, compute = _counter()
+    key = ("summary_query", date(2024, 2, 1), date(2024, 2, 29), None, None, None)
+    cache.fetch(key, REPORT_LOG_TABLES, compute)
+
+    # 另一台工作站以原生連線寫入，不觸發 session 事件
+    other = create_engine(f"sqlite:///{tmp_path / 'cache.db'}", future=True)
+    with other.begin() as conn:
+        conn.exec_driver_sql("INSERT INTO shift_options (name) VALUES ('Night')")
+    cache.fetch(key, REPORT_LOG_TABLES, compute)
+    assert len(calls) == 2
+
+    def compute_while_writing():
+        with factory() as db:
+            db.add(_report(date(2024, 2, 2)))
+            db.commit()
+        return "stale"
+
+    cache.clear()
+    assert cache.fetch(key, REPORT_LOG_TABLES, compute_while_writing) == "stale"
+    assert cache.fetch(key, REPORT_LOG_TABLES, compute) == "result"
+    cache.close()
+    other.dispose()
+    engine.dispose()
+
+
+def test_foreign_commit_before_a_local_commit_is_not_absorbed(tmp_path):
+    engine, factory, cache = _setup(tmp_path)
+    calls, compute = _counter()
+    key = ("summary_query", date(2024, 3, 1), date(2024, 3, 31), None, None, None)
+    cache.fetch(key, REPORT_LOG_TABLES, compute)
+
+    # 其他工作站先寫入報表，本機接著提交與快取無關的資料表
+    other = create_engine(f"sqlite:///{tmp_path / 'cache.db'}", future=True)
+    with other.begin() as conn:
+        conn.execute(
+            insert(DailyReport.__table__),
+            {"date": date(2024, 3, 2), "shift": "Day", "area": "litho", "author_id": 1},
+        )
+    with factory() as db:
+        db.add(ShiftOption(name="Night"))
+        db.commit()
+    cache.fetch(key, REPORT_LOG_TABLES, compute)
+    assert len(calls) == 2
+
+    # 只有本機提交時快取保留
+    with factory() as db:
+        db.add(ShiftOption(name="Evening"))
+        db.commit()
+    cache.fetch(key, REPORT_LOG_TABLES, compute)
+    assert len(calls) == 2
+    cache.close()
+    other.dispose()
+    engine.dispose()
@@ -0,0 +1,219 @@
+"""
+出勤統計彙總 (reporting) 測試
+"""
+
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from models import (  # noqa: E402
+    AttendanceEntry,
+    Base,
+    DailyAttendanceRollup,
+    DailyReport,
+    OvertimeEntry,
+    User,
+)
+from reporting import (  # noqa: E402
+    BUCKET_DAY,
+    BUCKET_MONTH,
+    BUCKET_WEEK,
+    load_attendance_summary,
+    query_daily_attendance,
+    rebuild_attendance_rollup,
+    refresh_attendance_rollup,
+    rollup_keys_for_reports,
+    series_bucket,
+    verify_attendance_rollup,
+)
+
+
+def _seed(session):
+    author = User(username="op", password_hash="x")
+    session.add(author)
+    session.flush()
+    day_report = DailyReport(
+        date=date(2024, 3, 1), shift="Day", area="litho", author_id=author.id
+    )
+    night_report = DailyReport(
+        date=date(2024, 3, 1), shift="Night", area="litho", author_id=author.id
+    )
+    hidden_report = DailyReport(
+        date=date(2024, 3, 2), shift="Day", area="litho", author_id=author.id, is_hidden=1
+    )
+    empty_report = DailyReport(
+        date=date(2024, 3, 3), shift="Day", area="litho", author_id=author.id
+    )
+    session.add_all([day_report, night_report, hidden_report, empty_report])
+    session.flush()
+    session.add_all(
+        [
+            AttendanceEntry(report_id=day_report.id, category="Regular", present_count=8, absent_count=2, reason="sick"),
+            AttendanceEntry(report_id=day_report.id, category="Contract", present_count=4, absent_count=1, reason=" leave "),
+            AttendanceEntry(report_id=night_report.id, category="regular", present_count=5, absent_count=0),
+            AttendanceEntry(report_id=hidden_report.id, category="Regular", present_count=9, absent_count=9),
+            OvertimeEntry(report_id=day_report.id, category="Regular", count=2),
+            OvertimeEntry(report_id=day_report.id, category="Contract", count=1),
+        ]
+    )
+    session.flush()
+    rebuild_attendance_rollup(session)
+    session.commit()
+    return day_report.id
+
+
+def test_attendance_summary_is_aggregated_in_sql(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'report.db'}", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        day_report_id = _seed(session)
+        summary = load_attendance_summary(session, date(2024, 3, 1), date(2024, 3, 31))
+
+    assert [row.shift for row in summary.reports] == ["Day", "Night", "Day"]
+    day = summary.reports[0]
+    assert day.report_id == day_report_id
+    assert day.author == "op"
+    assert (day.regular_present, day.regular_absent) == (8, 2)
+    assert (day.contract_present, day.contract_absent) == (4, 1)
+    assert day.overtime_count == 3
+    assert day.regular_reason == "sick"
+    assert day.contract_reason == "leave"
+
+    empty = summary.reports[2]
+    assert (empty.regular_present, empty.overtime_count, empty.regular_reason) == (0, 0, "")
+
+    assert [point.date for point in summary.daily_series] == [
+        date(2024, 3, 1),
+        date(2024, 3, 3),
+    ]
+    first = summary.daily_series[0]
+    assert (first.regular, first.contract, first.present, first.absent) == (13, 4, 17, 3)
+    assert (summary.total_present, summary.total_absent) == (17, 3)
+    assert summary.bucket == BUCKET_DAY
+    engine.dispose()
+
+
+def test_rollup_follows_hide_and_move(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'rollup.db'}", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        day_report_id = _seed(session)
+        assert verify_attendance_rollup(session) == []
+        row = session.get(DailyAttendanceRollup, (date(2024, 3, 1), "Day", "litho"))
+        assert (row.present, row.absent, row.overtime) == (12, 3, 3)
+        assert row.rate == 80.0
+
+        report = session.get(DailyReport, day_report_id)
+        keys = rollup_keys_for_reports(session, [day_report_id])
+        report.date = date(2024, 3, 5)
+        keys.add((report.date, report.shift, report.area))
+        session.flush()
+        refresh_attendance_rollup(session, keys)
+        session.commit()
+        old_key = (date(2024, 3, 1), "Day", "litho")
+        assert session.get(DailyAttendanceRollup, old_key) is None
+        assert verify_attendance_rollup(session) == []
+
+        report.is_hidden = 1
+        session.flush()
+        refresh_attendance_rollup(session, keys)
+        session.commit()
+        assert verify_attendance_rollup(session) == []
+        summary = load_attendance_summary(session, date(2024, 3, 1), date(2024, 3, 31))
+        assert [point.date for point in summary.daily_series] == [
+            date(2024, 3, 1),
+            date(2024, 3, 3),
+        ]
+        assert (summary.total_present, summary.total_absent) == (5, 0)
+
+        session.execute(DailyAttendanceRollup.__table__.delete())
+        assert verify_attendance_rollup(session) == [
+            (date(2024, 3, 1), "Night", "litho"),
+            (date(2024, 3, 3), "Day", "litho"),
+        ]
+    engine.dispose()
+
+
+def test_long_ranges_are_bucketed_in_sql(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'bucket.db'}", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        for month, day, present in ((1, 3, 4), (1, 7, 6), (1, 8, 1), (2, 29, 2)):
+            session.add(
+                DailyAttendanceRollup(
+                    date=date(2024, month, day),
+                    shift="Day",
+                    area="litho",
+                    regular_present=present,
+                    present=present,
+                    absent=1,
+                )
+            )
+        session.commit()
+
+        weekly = query_daily_attendance(
+            session, date(2024, 1, 1), date(2024, 3, 31), bucket=BUCKET_WEEK
+        )
+        # 1/3 與 1/7 同屬 1/1 (週一) 那週
+        assert [(p.date, p.present, p.absent) for p in weekly] == [
+            (date(2024, 1, 1), 10, 2),
+            (date(2024, 1, 8), 1, 1),
+            (date(2024, 2, 26), 2, 1),
+        ]
+        summary = load_attendance_summary(session, date(2024, 1, 1), date(2024, 12, 31))
+        assert summary.bucket == BUCKET_MONTH
+        assert [(p.date, p.regular) for p in summary.daily_series] == [
+            (date(2024, 1, 1), 11),
+            (date(2024, 2, 1), 2),
+        ]
+        assert (summary.total_present, summary.total_absent) == (13, 4)
+    engine.dispose()
+
+    assert series_bucket(date(2024, 1, 1), date(2024, 2, 14)) == BUCKET_DAY
+    assert series_bucket(date(2024, 1, 1), date(2024, 6, 30)) == BUCKET_WEEK
+    assert series_bucket(date(2024, 1, 1), date(2024, 7, 1)) == BUCKET_MONTH
+
+
+def test_refresh_handles_more_keys_than_sqlite_expression_depth(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'many.db'}", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        author = User(username="op", password_hash="x")
+        session.add(author)
+        session.flush()
+        reports = [
+            DailyReport(
+                date=date(2020, 1, 1) + timedelta(days=idx),
+                shift="Day",
+                area="litho",
+                author_id=author.id,
+            )
+            for idx in range(1200)
+        ]
+        session.add_all(reports)
+        session.flush()
+        session.add_all(
+            AttendanceEntry(report_id=report.id, category="Regular", present_count=1)
+            for report in reports
+        )
+        session.flush()
+        keys = rollup_keys_for_reports(session, [report.id for report in reports])
+        assert len(keys) == 1200
+
+        assert refresh_attendance_rollup(session, keys) == 1200
+        session.commit()
+        assert verify_attendance_rollup(session) == []
+
+        for report in reports:
+            report.is_hidden = 1
+        session.flush()
+        assert refresh_attendance_rollup(session, keys) == 0
+        session.commit()
+        assert session.query(DailyAttendanceRollup).count() == 0
+    engine.dispose()
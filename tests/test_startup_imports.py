@@ -0,0 +1,26 @@
+"""
+啟動匯入 (lazy import) 測試
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+
+
+def test_main_window_import_does_not_load_pandas_or_matplotlib():
+    code = (
+        "import sys\n"
+        f"sys.path.insert(0, {str(project_root)!r})\n"
+        "import frontend.src.components.modern_main_frame\n"
+        "print(','.join(m for m in ('pandas', 'matplotlib') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=project_root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == ""
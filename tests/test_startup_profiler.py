@@ -0,0 +1,49 @@
+"""
+啟動分析 (startup_profiler) 測試
+"""
+
+import json
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from startup_profiler import StartupProfiler, report_path_from_argv  # noqa: E402
+
+
+def test_report_path_from_argv():
+    assert report_path_from_argv(["--lang", "ja"]) is None
+    assert report_path_from_argv(["--profile-startup"]) == Path("startup_profile.json")
+    assert report_path_from_argv(["--profile-startup=out/p.json"]) == Path(
+        "out/p.json"
+    )
+
+
+def test_phases_and_module_imports_are_reported(tmp_path, monkeypatch):
+    (tmp_path / "profiled_outer.py").write_text("import profiled_inner\n")
+    (tmp_path / "profiled_inner.py").write_text("VALUE = 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    profiler = StartupProfiler(tmp_path / "report" / "startup.json")
+    try:
+        with profiler.phase("import_ui"):
+            import profiled_outer  # noqa: F401
+        profiler.mark("first_idle")
+        path = profiler.write()
+    finally:
+        profiler.stop()
+        sys.modules.pop("profiled_outer", None)
+        sys.modules.pop("profiled_inner", None)
+
+    report = json.loads(path.read_text(encoding="utf-8"))
+    assert [p["name"] for p in report["phases"]] == ["import_ui"]
+    assert report["marks"][0]["name"] == "first_idle"
+    modules = {rec["module"]: rec for rec in report["imports"]}
+    assert modules["profiled_outer"]["phase"] == "import_ui"
+    assert (
+        modules["profiled_outer"]["cumulative_ms"]
+        >= modules["profiled_inner"]["cumulative_ms"]
+    )
+    assert profiler._imports not in sys.meta_path
+    assert type(profiled_outer.__loader__).__name__ == "SourceFileLoader"
@@ -0,0 +1,114 @@
+"""
+摘要儀表板圖表 (持續存在的 Figure，就地更新資料) 測試
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from frontend.src.components.summary_charts import (  # noqa: E402
+    MAX_TICK_LABELS,
+    MAX_VALUE_LABELS,
+    AttendanceCountChart,
+    AttendanceRateChart,
+    SummaryChart,
+)
+
+LIGHT = {
+    "face": "#ffffff",
+    "grid": "#d0d7de",
+    "text": "#1f2328",
+    "line": "#1a7f37",
+    "bar_primary": "#0969da",
+    "bar_accent": "#bf8700",
+}
+DARK = dict(LIGHT, face="#0d1117", text="#e6edf3", line="#3fb950")
+RATE_TEXTS = {"title": "Rate", "series": "Rate", "axis": "%", "empty": "No data"}
+COUNT_TEXTS = {
+    "title": "Headcount",
+    "regular": "Regular",
+    "contract": "Contract",
+    "axis": "People",
+    "empty": "No data",
+}
+
+
+def _labels(count):
+    return [f"2024-01-{idx + 1:02d}" for idx in range(count)]
+
+
+def test_repeated_updates_reuse_figure_and_artists():
+    rate_chart = AttendanceRateChart()
+    count_chart = AttendanceCountChart()
+    figures = (rate_chart.figure, count_chart.figure)
+    artist_counts = []
+
+    for refresh in range(40):
+        days = (5, 31, 0, 12)[refresh % 4]
+        theme = DARK if refresh % 3 else LIGHT
+        labels = _labels(days)
+        rate_chart.update(labels, [90.0] * days, theme, RATE_TEXTS)
+        count_chart.update(labels, [3] * days, [refresh % 2] * days, theme, COUNT_TEXTS)
+        artist_counts.append(
+            (
+                len(rate_chart.ax.texts),
+                len(count_chart.ax.texts),
+                len(count_chart.ax.patches),
+            )
+        )
+
+    assert (rate_chart.figure, count_chart.figure) == figures
+    # 池化後，最長序列出現過一次即不再新增 artist；數值標籤有上限
+    assert set(artist_counts[4:]) == {artist_counts[3]}
+    assert artist_counts[3] == (1 + 16, 1 + 32, 62)
+
+
+def test_long_series_show_a_bounded_number_of_labels():
+    chart = AttendanceRateChart()
+    labels = [f"2024-{idx:03d}" for idx in range(365)]
+    chart.update(labels, [80.0] * 365, LIGHT, RATE_TEXTS)
+    assert len(chart.line.get_xdata()) == 365
+    visible = [text for text in chart.ax.texts if text.get_visible()]
+    assert len(visible) <= MAX_VALUE_LABELS
+    assert len(chart.ax.get_xticklabels()) <= MAX_TICK_LABELS
+
+
+def test_update_changes_data_labels_and_colors_in_place():
+    chart = AttendanceCountChart()
+    chart.update(_labels(3), [4, 5, 6], [1, 0, 2], LIGHT, COUNT_TEXTS)
+    chart.update(_labels(2), [7, 8], [0, 3], DARK, dict(COUNT_TEXTS, title="Daily"))
+
+    visible_bars = [bar for bar in chart.regular_bars if bar.get_visible()]
+    assert [bar.get_height() for bar in visible_bars] == [7, 8]
+    assert not chart.regular_bars[2].get_visible()
+    assert chart.ax.get_title() == "Daily"
+    assert [tick.get_text() for tick in chart.ax.get_xticklabels()] == _labels(2)
+    visible_texts = [text.get_text() for text in chart.ax.texts if text.get_visible()]
+    assert visible_texts == ["7", "8", "3"]
+    assert chart.figure.get_facecolor()[:3] == (13 / 255, 17 / 255, 23 / 255)
+
+    chart.update([], [], [], DARK, COUNT_TEXTS)
+    visible_texts = [text.get_text() for text in chart.ax.texts if text.get_visible()]
+    assert visible_texts == ["No data"]
+    assert not any(bar.get_visible() for bar in chart.regular_bars)
+
+
+def test_rate_chart_labels_follow_series():
+    chart = AttendanceRateChart()
+    chart.update(_labels(2), [50.0, 75.5], LIGHT, RATE_TEXTS)
+    assert list(chart.line.get_ydata()) == [50.0, 75.5]
+    visible = [text.get_text() for text in chart.ax.texts if text.get_visible()]
+    assert visible == ["50.0%", "75.5%"]
+    assert chart.line.get_color() == LIGHT["line"]
+
+
+def test_chart_without_build_cannot_be_created():
+    class Incomplete(SummaryChart):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,73 @@
+"""
+虛擬表格 (VirtualRowBuffer) 測試
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from frontend.src.utils.table_helpers import VirtualRowBuffer  # noqa: E402
+
+
+def _buffer(count):
+    buffer = VirtualRowBuffer()
+    for idx in range(count):
+        buffer.insert("end", f"sq:{idx}:equip:{idx}", values=(idx, f"row {idx}"))
+    return buffer
+
+
+def test_window_follows_offset_and_clamps():
+    buffer = _buffer(50_000)
+
+    assert buffer.window(20)[0] == "sq:0:equip:0"
+    buffer.offset = 49_990
+    window = buffer.window(20)
+    assert len(window) == 20
+    assert window[-1] == "sq:49999:equip:49999"
+    assert buffer.offset == 49_980
+    first, last = buffer.fractions(20)
+    assert last == 1.0 and 0.99 < first < 1.0
+
+
+def test_scroll_to_show_and_index():
+    buffer = _buffer(1000)
+
+    buffer.scroll_to_show("sq:500:equip:500", 20)
+    assert buffer.offset == 481
+    buffer.scroll_to_show("sq:10:equip:10", 20)
+    assert buffer.offset == 10
+    assert buffer.index("sq:999:equip:999") == 999
+
+
+def test_delete_updates_order_selection_and_focus():
+    buffer = _buffer(10)
+    buffer.selection = {"sq:1:equip:1", "sq:2:equip:2"}
+    buffer.focus = "sq:2:equip:2"
+
+    buffer.delete(["sq:2:equip:2", "sq:3:equip:3", "missing"])
+
+    assert len(buffer) == 8
+    assert buffer.selection == {"sq:1:equip:1"}
+    assert buffer.focus is None
+    assert buffer.index("sq:4:equip:4") == 2
+    assert buffer.ordered({"sq:9:equip:9", "sq:0:equip:0"}) == (
+        "sq:0:equip:0",
+        "sq:9:equip:9",
+    )
+
+
+def test_insert_keeps_explicit_ids_and_generates_unique_ones():
+    buffer = VirtualRowBuffer()
+    buffer.insert("end", "P1", values=("P1",))
+    buffer.insert(0, "ab:lot:7", values=("x",), tags="odd")
+    generated = buffer.next_id()
+
+    assert buffer.order == ["ab:lot:7", "P1"]
+    assert buffer.rows["ab:lot:7"][2] == ("odd",)
+    assert generated not in buffer.rows
+    with pytest.raises(ValueError):
+        buffer.insert("end", "P1")